@@ -0,0 +1,51 @@
+"""
+This example measures the cost of building a QuerySet by chaining calls.
+
+No query is executed, so it isolates the Python-side overhead of ``QuerySet._clone()``
+and friends that every chained ``.filter()``, ``.order_by()``, ``.limit()`` etc. pays.
+"""
+
+import timeit
+
+from tortoise import Tortoise, fields, run_async
+from tortoise.functions import Count
+from tortoise.models import Model
+
+
+class Tournament(Model):
+    id = fields.IntField(pk=True)
+    name = fields.CharField(max_length=255)
+
+
+class Event(Model):
+    id = fields.IntField(pk=True)
+    name = fields.CharField(max_length=255)
+    tournament: fields.ForeignKeyRelation[Tournament] = fields.ForeignKeyField(
+        "models.Tournament", related_name="events"
+    )
+    modified = fields.DatetimeField(auto_now=True)
+
+
+def chain() -> None:
+    (
+        Event.filter(name__startswith="FIFA")
+        .exclude(tournament__name="Old")
+        .annotate(count=Count("id"))
+        .select_related("tournament")
+        .only("id", "name")
+        .order_by("-modified")
+        .offset(20)
+        .limit(10)
+    )
+
+
+async def run():
+    await Tortoise.init(db_url="sqlite://:memory:", modules={"models": ["__main__"]})
+
+    number = 20000
+    best = min(timeit.repeat(chain, number=number, repeat=5))
+    print(f"8 chained calls: {best / number * 1e6:.2f} µs per QuerySet")
+
+
+if __name__ == "__main__":
+    run_async(run())
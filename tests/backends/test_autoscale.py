@@ -0,0 +1,118 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from tortoise.autoscale import PoolAutoscaler
+from tortoise.backends.sqlite.client import SqliteClient
+from tortoise.contrib import test
+from tortoise.metrics import get_stats, reset_stats
+
+
+class TestPoolAutoscaler(test.SimpleTestCase):
+    def setUp(self):
+        reset_stats()
+        self.client = SqliteClient(file_path=":memory:", connection_name="autoscale")
+        self.stats = get_stats("autoscale")
+
+    def test_grow_and_shrink(self):
+        autoscaler = PoolAutoscaler(
+            self.client, 2, 4, max_size=6, target_wait=0.01, cooldown=10, step=2
+        )
+        self.stats.acquire_wait.observe(0.05)
+        self.assertEqual(autoscaler.tick(now=1000), 6)
+        # Up to the max size
+        self.stats.acquire_wait.observe(0.05)
+        self.assertEqual(autoscaler.tick(now=1001), 6)
+        # No wait, but within the cooldown
+        self.stats.acquire_wait.observe(0.001)
+        self.assertEqual(autoscaler.tick(now=1005), 6)
+        autoscaler.peak = 3
+        self.assertEqual(autoscaler.tick(now=1011), 4)
+        self.assertEqual(autoscaler.tick(now=1016), 2)
+        self.assertEqual(autoscaler.tick(now=1021), 2)
+
+    def test_budget(self):
+        budget = 8
+        autoscaler = PoolAutoscaler(
+            self.client, 1, 6, max_size=10, cooldown=10, budget=lambda: budget
+        )
+        for now in range(4):
+            self.stats.acquire_wait.observe(1)
+            autoscaler.tick(now=now)
+        self.assertEqual(autoscaler.size, 8)
+        budget = 3
+        self.assertEqual(autoscaler.tick(now=5), 3)
+        self.assertEqual(PoolAutoscaler(self.client, 1, 6, budget=2).tick(), 2)
+
+    def test_config(self):
+        client = SqliteClient(
+            file_path=":memory:",
+            connection_name="autoscale",
+            autoscale={"max_size": "20", "target_wait": "0.05"},
+            hot_statements=["SELECT 1"],
+        )
+        self.assertNotIn("autoscale", client.pragmas)
+        self.assertEqual(client._pool_max_size(2, 5), 20)
+        self.assertEqual(
+            (client.autoscaler.min_size, client.autoscaler.size, client.autoscaler.target_wait),
+            (2, 5, 0.05),
+        )
+        self.assertEqual(self.client._pool_max_size(2, 5), 5)
+
+    async def test_limit(self):
+        autoscaler = PoolAutoscaler(self.client, 1, 1, max_size=2, target_wait=0.01)
+        await autoscaler.acquire()
+        waiting = asyncio.ensure_future(autoscaler.acquire())
+        await asyncio.sleep(0)
+        self.assertFalse(waiting.done())
+        self.stats.acquire_wait.observe(0.05)
+        autoscaler.tick()
+        await waiting
+        self.assertEqual((autoscaler.in_use, autoscaler.peak), (2, 2))
+        autoscaler.release()
+        autoscaler.release()
+        cancelled = asyncio.ensure_future(autoscaler.acquire())
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        self.assertEqual(autoscaler.in_use, 0)
+
+
+class TestWarmUp(test.SimpleTestCase):
+    async def test_warm_up(self):
+        client = SqliteClient(
+            file_path=":memory:", connection_name="warm_up", hot_statements=["SELECT 1"]
+        )
+        self.assertIsNone(client._connection)
+        await client.warm_up()
+        try:
+            self.assertIsNotNone(client._connection)
+            self.assertEqual(get_stats("warm_up").in_use, 0)
+        finally:
+            await client.close()
+
+    async def test_warm_up_limited(self):
+        # Limits below the size of the pool don't apply to the warm-up
+        client = SqliteClient(
+            file_path=":memory:",
+            connection_name="warm_up",
+            hot_statements=["SELECT 1"],
+            max_waiters=0,
+            max_concurrency=1,
+            lanes={"default": {"max": 1}, "batch": {"reserved": 1}},
+            autoscale={"min_size": 1, "size": 1, "max_size": 3},
+        )
+        client._pool = asyncio.Queue()
+        connections = ["conn1", "conn2", "conn3"]
+        for connection in connections:
+            client._pool.put_nowait(connection)
+        client._pool.acquire = client._pool.get
+        client._pool.release = client._pool.put
+        with patch.object(client, "_pool_size", return_value={"size": 3}), patch.object(
+            client, "_prepare_statements", new_callable=AsyncMock
+        ) as prepare:
+            await asyncio.wait_for(client.warm_up(), 1)
+        try:
+            self.assertEqual([call.args[0] for call in prepare.await_args_list], connections)
+            self.assertEqual(client._pool.qsize(), 3)
+            self.assertEqual(get_stats("warm_up").in_use, 0)
+        finally:
+            await client.close()
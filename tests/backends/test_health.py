@@ -0,0 +1,137 @@
+from typing import List
+from unittest.mock import patch
+
+from tests.testmodels import Tournament
+from tortoise import connections
+from tortoise.backends.base.client import retry_reads
+from tortoise.backends.base.config_generator import expand_db_url
+from tortoise.backends.sqlite.client import SqliteClient
+from tortoise.contrib import test
+from tortoise.health import IDLE, LIFETIME, PING, ConnectionHealth
+
+
+class Connection:
+    def __init__(self, alive: bool = True) -> None:
+        self.alive = alive
+        self.closed = False
+
+
+class Pool:
+    def __init__(self, *connections: Connection) -> None:
+        self.free = list(connections)
+        self.released: List[Connection] = []
+
+    async def acquire(self) -> Connection:
+        return self.free.pop(0) if self.free else Connection()
+
+    async def release(self, connection: Connection) -> None:
+        self.released.append(connection)
+        if not connection.closed:
+            self.free.append(connection)
+
+
+class Client(SqliteClient):
+    async def _ping(self, connection: Connection) -> None:
+        if not connection.alive:
+            raise ConnectionError("Connection reset")
+
+    async def _close_connection(self, connection: Connection) -> None:
+        connection.closed = True
+
+    def _is_connection_lost(self, exc: BaseException) -> bool:
+        return isinstance(exc, ConnectionError)
+
+
+class TestConnectionHealth(test.SimpleTestCase):
+    def test_checked_out(self):
+        health = ConnectionHealth(max_lifetime=60, max_idle=30, pre_ping=5)
+        connection = Connection()
+        with patch("tortoise.health.time.monotonic", return_value=100):
+            self.assertIsNone(health.checked_out(connection))
+            health.checked_in(connection)
+        for now, reason in ((104, None), (110, PING), (140, IDLE), (170, LIFETIME)):
+            with patch("tortoise.health.time.monotonic", return_value=now):
+                self.assertEqual(health.checked_out(connection), reason)
+        health.forget(connection)
+        with patch("tortoise.health.time.monotonic", return_value=170):
+            self.assertIsNone(health.checked_out(connection))
+
+    def test_config(self):
+        client = SqliteClient(file_path=":memory:", connection_name="health", pre_ping="5")
+        self.assertEqual((client.health.pre_ping, client.health.max_idle), (5, None))
+        self.assertNotIn("pre_ping", client.pragmas)
+        self.assertIsNone(SqliteClient(file_path=":memory:", connection_name="health").health)
+
+    def test_url_flags(self):
+        def client(query: str) -> SqliteClient:
+            credentials = expand_db_url(f"sqlite://:memory:?{query}")["credentials"]
+            return SqliteClient(connection_name="health", **credentials)
+
+        for value in ("false", "0", "off", "False"):
+            flags = client(f"retry_reads={value}&warm_up={value}")
+            self.assertEqual((flags.retry_reads, flags._warm_up), (False, False))
+        flags = client("retry_reads=true&warm_up=1")
+        self.assertEqual((flags.retry_reads, flags._warm_up), (True, True))
+        self.assertNotIn("warm_up", flags.pragmas)
+
+
+class TestCheckout(test.SimpleTestCase):
+    async def test_ping_and_recycle(self):
+        client = Client(file_path=":memory:", connection_name="health", pre_ping=0, max_idle=60)
+        dead, alive = Connection(alive=False), Connection()
+        pool = Pool(dead, alive)
+        for connection in (dead, alive):
+            client.health.checked_out(connection)
+            client.health.checked_in(connection)
+        # The dead connection is closed, and the next one pinged
+        self.assertIs(await client._checkout(pool), alive)
+        self.assertTrue(dead.closed)
+        self.assertEqual(pool.released, [dead])
+        await client._checkin(pool, alive)
+        with patch("tortoise.health.time.monotonic", return_value=10**9):
+            # Idle too long, replaced by a new connection
+            connection = await client._checkout(pool)
+        self.assertTrue(alive.closed)
+        self.assertNotIn(connection, (dead, alive))
+
+    async def test_checkin_lost(self):
+        client = Client(file_path=":memory:", connection_name="health")
+        connection = Connection()
+        pool = Pool()
+        await client._checkin(pool, connection, ConnectionError("Connection reset"))
+        self.assertTrue(connection.closed)
+        self.assertEqual(pool.free, [])
+
+
+class TestRetryReads(test.SimpleTestCase):
+    def setUp(self):
+        self.client = Client(file_path=":memory:", connection_name="health")
+        self.calls = []
+
+    async def test_retry_select(self):
+        self.assertEqual(await retry_reads(self._execute)(self.client, " SELECT 1"), " SELECT 1")
+        self.assertEqual(len(self.calls), 2)
+
+    async def test_no_retry(self):
+        with self.assertRaises(ConnectionError):
+            await retry_reads(self._execute)(self.client, "DELETE FROM t")
+        self.client.retry_reads = False
+        self.calls = []
+        with self.assertRaises(ConnectionError):
+            await retry_reads(self._execute)(self.client, "SELECT 1")
+
+    async def _execute(self, client, query):
+        self.calls.append(query)
+        if len(self.calls) == 1:
+            raise ConnectionError("Connection reset")
+        return query
+
+
+@test.requireCapability(daemon=True)
+class TestPrePing(test.IsolatedTestCase):
+    async def test_pre_ping(self):
+        client = connections.get("models")
+        await Tournament.create(name="1")
+        with patch.object(client, "health", ConnectionHealth(pre_ping=0)):
+            await client._expire_connections()
+            self.assertEqual(await Tournament.all().count(), 1)
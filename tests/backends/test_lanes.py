@@ -0,0 +1,122 @@
+import asyncio
+from unittest.mock import patch
+
+from tests.testmodels import Tournament
+from tortoise import connections, lane
+from tortoise.backends.sqlite.client import SqliteClient
+from tortoise.contrib import test
+from tortoise.exceptions import ConfigurationError
+from tortoise.lanes import LaneScheduler, current_lane
+
+
+class TestLaneScheduler(test.SimpleTestCase):
+    async def test_reserved_and_max(self):
+        scheduler = LaneScheduler({"interactive": {"reserved": 2}, "batch": {"max": 2}}, lambda: 4)
+        await scheduler.acquire("batch")
+        await scheduler.acquire("batch")
+        # Over the max of the lane
+        waiting = asyncio.ensure_future(scheduler.acquire("batch"))
+        await asyncio.sleep(0)
+        self.assertFalse(waiting.done())
+        # The two connections left are reserved
+        await scheduler.acquire("interactive")
+        await scheduler.acquire("interactive")
+        blocked = asyncio.ensure_future(scheduler.acquire("default"))
+        await asyncio.sleep(0)
+        self.assertFalse(blocked.done())
+        self.assertEqual(
+            scheduler.snapshot()["batch"], {"in_use": 2, "waiters": 1, "reserved": 0, "max": 2}
+        )
+        scheduler.release(scheduler.lanes["batch"])
+        self.assertEqual(await waiting, scheduler.lanes["batch"])
+        self.assertFalse(blocked.done())
+        blocked.cancel()
+        await asyncio.sleep(0)
+        self.assertEqual(scheduler.lanes["default"].waiters, 0)
+
+    async def test_unknown_lane(self):
+        scheduler = LaneScheduler({"batch": {"max": 1}}, lambda: 2)
+        self.assertEqual((await scheduler.acquire("other")).name, "default")
+
+    async def test_priority(self):
+        scheduler = LaneScheduler(
+            {"batch": {"priority": 0}, "interactive": {"priority": 10}},
+            lambda: 1,
+            fairness="priority",
+        )
+        await scheduler.acquire("default")
+        order = []
+
+        async def acquire(name):
+            order.append((await scheduler.acquire(name)).name)
+            scheduler.release(scheduler.lanes[name])
+
+        tasks = [asyncio.ensure_future(acquire(name)) for name in ("batch", "interactive")]
+        await asyncio.sleep(0)
+        scheduler.release(scheduler.lanes["default"])
+        await asyncio.gather(*tasks)
+        self.assertEqual(order, ["interactive", "batch"])
+
+    async def test_over_reserved(self):
+        scheduler = LaneScheduler({"a": {"reserved": 2}, "b": {"reserved": 2}}, lambda: 3)
+        with self.assertRaises(ConfigurationError):
+            await scheduler.acquire("a")
+
+    def test_fairness(self):
+        with self.assertRaises(ConfigurationError):
+            LaneScheduler({}, lambda: 1, fairness="random")
+
+    async def test_context(self):
+        self.assertEqual(current_lane.get(), "default")
+        with lane("batch"):
+            self.assertEqual(current_lane.get(), "batch")
+            async with lane("interactive"):
+                self.assertEqual(current_lane.get(), "interactive")
+            self.assertEqual(current_lane.get(), "batch")
+        self.assertEqual(current_lane.get(), "default")
+
+    def test_config(self):
+        client = SqliteClient(
+            file_path=":memory:",
+            connection_name="lanes",
+            lanes={"batch": {"max": "1"}},
+            lane_fairness="priority",
+        )
+        self.assertEqual(client.lanes.lanes["batch"].max, 1)
+        self.assertEqual(client.lanes.capacity, 1)
+        self.assertNotIn("lanes", client.pragmas)
+        with self.assertRaises(ConfigurationError):
+            client.lane("other")
+
+
+class TestLanes(test.TruncationTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.client = connections.get("models")
+        self.scheduler = LaneScheduler(
+            {"batch": {"max": 1}, "interactive": {"priority": 1}},
+            lambda: self.client._pool_size()["max_size"],
+            fairness="priority",
+        )
+
+    async def test_lanes(self):
+        with patch.object(self.client, "lanes", self.scheduler):
+            order = []
+
+            async def create(name):
+                async with self.client.lane(name):
+                    order.append((await Tournament.create(name=name)).name)
+
+            async with self.client.lane("batch"):
+                async with self.client.acquire_connection():
+                    tasks = [
+                        asyncio.ensure_future(create(name)) for name in ("batch", "interactive")
+                    ]
+                    await asyncio.sleep(0.01)
+                    stats = connections.stats()["models"]["lanes"]
+                    self.assertEqual(stats["batch"]["in_use"], 1)
+                    self.assertEqual(stats["interactive"]["waiters"], 1)
+            await asyncio.gather(*tasks)
+            stats = connections.stats()["models"]["lanes"]
+        self.assertEqual(order, ["interactive", "batch"])
+        self.assertEqual(sum(lane["in_use"] + lane["waiters"] for lane in stats.values()), 0)
@@ -0,0 +1,86 @@
+import asyncio
+from unittest.mock import patch
+
+from tests.testmodels import Tournament
+from tortoise import connections
+from tortoise.backends.base.client import ConcurrencyLimiter
+from tortoise.backends.sqlite.client import SqliteClient
+from tortoise.contrib import test
+from tortoise.exceptions import PoolExhaustedError
+from tortoise.metrics import reset_stats
+
+
+class TestConcurrencyLimiter(test.SimpleTestCase):
+    def test_shed_above_limit(self):
+        limiter = ConcurrencyLimiter(2)
+        self.assertIsNotNone(limiter.acquire())
+        self.assertIsNotNone(limiter.acquire())
+        self.assertIsNone(limiter.acquire())
+        self.assertEqual(limiter.in_flight, 2)
+
+    def test_aimd(self):
+        limiter = ConcurrencyLimiter(8, min_limit=2, latency_target=60)
+        admitted = [limiter.acquire() for _ in range(3)]
+        # Only one decrease for the statements admitted before it
+        limiter.release(admitted[0], overloaded=True)
+        limiter.release(admitted[1], overloaded=True)
+        self.assertEqual(limiter.limit, 4)
+        limiter.release(limiter.acquire(), overloaded=True)
+        self.assertEqual(limiter.limit, 2)
+        limiter.release(limiter.acquire(), overloaded=True)
+        self.assertEqual(limiter.limit, 2)
+        # Additive increase, by 1 / limit per statement completing in time
+        limiter.release(admitted[2])
+        self.assertEqual(limiter.limit, 2.5)
+        limiter.release(limiter.acquire())
+        self.assertAlmostEqual(limiter.limit, 2.9)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_config(self):
+        client = SqliteClient(
+            file_path=":memory:",
+            connection_name="saturation",
+            acquire_timeout="1.5",
+            max_waiters="3",
+            max_concurrency="10",
+            min_concurrency="2",
+        )
+        self.assertEqual((client.acquire_timeout, client.max_waiters), (1.5, 3))
+        self.assertEqual((client.limiter.max_limit, client.limiter.min_limit), (10, 2))
+        self.assertNotIn("max_waiters", client.pragmas)
+
+
+class TestPoolSaturation(test.TruncationTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        reset_stats()
+        self.client = connections.get("models")
+
+    async def test_acquire_timeout(self):
+        with patch.object(self.client, "acquire_timeout", 0.01):
+            async with self.client.acquire_connection():
+                with self.assertRaises(PoolExhaustedError):
+                    await Tournament.all()
+        stats = connections.stats()["models"]
+        self.assertEqual((stats["errors"], stats["waiters"], stats["in_use"]), (1, 0, 0))
+        await Tournament.all()
+
+    async def test_max_waiters(self):
+        with patch.object(self.client, "max_waiters", 1):
+            async with self.client.acquire_connection():
+                waiting = asyncio.ensure_future(Tournament.all())
+                await asyncio.sleep(0)
+                with self.assertRaises(PoolExhaustedError):
+                    await Tournament.all()
+            await waiting
+        self.assertEqual(connections.stats()["models"]["rejected"], 1)
+
+    async def test_limiter(self):
+        with patch.object(self.client, "limiter", ConcurrencyLimiter(1)):
+            async with self.client.acquire_connection():
+                with self.assertRaises(PoolExhaustedError):
+                    await Tournament.all()
+                self.assertEqual(connections.stats()["models"]["in_flight"], 1)
+            await Tournament.all()
+            stats = connections.stats()["models"]
+        self.assertEqual((stats["rejected"], stats["in_flight"]), (1, 0))
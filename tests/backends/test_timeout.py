@@ -0,0 +1,101 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+from tests.testmodels import Tournament
+from tortoise import connections
+from tortoise.backends.base.client import BaseDBAsyncClient, StatementDeadline
+from tortoise.contrib import test
+from tortoise.exceptions import ParamsError, QueryTimeoutError
+from tortoise.transactions import in_transaction
+
+# Counts rows of a recursive CTE, long enough to be cancelled on every backend
+SLOW_SQL = (
+    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 100000000)"
+    " SELECT COUNT(*) AS id FROM c"
+)
+
+
+@test.requireCapability(dialect="sqlite")
+class TestQueryTimeout(test.TruncationTestCase):
+    async def test_queryset_timeout(self):
+        with self.assertRaises(QueryTimeoutError):
+            await Tournament.raw(SLOW_SQL).timeout(0.05)
+        # The connection is usable again
+        await Tournament.create(name="1")
+        self.assertEqual(await Tournament.all().timeout(5).count(), 1)
+
+    async def test_connection_timeout(self):
+        client = connections.get("models")
+        client.query_timeout = 0.05
+        try:
+            with self.assertRaises(QueryTimeoutError):
+                await client.execute_query(SLOW_SQL)
+            # A query timeout overrides the one of the connection
+            with self.assertRaises(QueryTimeoutError):
+                await Tournament.raw(SLOW_SQL).timeout(0.01)
+        finally:
+            client.query_timeout = None
+        self.assertEqual(await client.execute_query_dict("SELECT 1 AS x"), [{"x": 1}])
+
+    async def test_progress_handler(self):
+        # The statement is aborted from within even if the interrupt misses it
+        client = connections.get("models")
+        with patch.object(type(client), "_cancel_statement", new_callable=AsyncMock):
+            with self.assertRaises(QueryTimeoutError):
+                await Tournament.raw(SLOW_SQL).timeout(0.05)
+        self.assertEqual(await client.execute_query_dict("SELECT 1 AS x"), [{"x": 1}])
+
+    async def test_timeout_in_transaction(self):
+        async with in_transaction():
+            await Tournament.create(name="1")
+            with self.assertRaises(QueryTimeoutError):
+                await Tournament.raw(SLOW_SQL).timeout(0.05)
+            await Tournament.create(name="2")
+        self.assertEqual(await Tournament.all().count(), 2)
+
+
+class TestQueryTimeoutParams(test.TestCase):
+    def test_derived_queries(self):
+        queryset = Tournament.filter(name="1").timeout(2)
+        self.assertIsNone(Tournament.all()._timeout)
+        self.assertEqual(queryset.filter(id=1)._timeout, 2)
+        self.assertEqual(queryset.count()._timeout, 2)
+        self.assertEqual(queryset.update(name="2")._timeout, 2)
+        self.assertEqual(queryset.delete()._timeout, 2)
+        self.assertEqual(queryset.values("name")._timeout, 2)
+        self.assertEqual(queryset.raw("SELECT 1")._timeout, 2)
+
+    def test_invalid_timeout(self):
+        with self.assertRaises(ParamsError):
+            Tournament.all().timeout(0)
+
+
+class TestStatementDeadline(test.SimpleTestCase):
+    def client(self, cancel: AsyncMock) -> Mock:
+        return Mock(
+            spec=BaseDBAsyncClient, connection_name="models", log=Mock(), _cancel_statement=cancel
+        )
+
+    async def test_expired(self):
+        client = self.client(AsyncMock())
+        deadline = StatementDeadline(client, None, 0.01)
+        await asyncio.sleep(0.02)
+        # The statement completed after its deadline
+        with self.assertRaises(QueryTimeoutError):
+            await deadline.finish(None)
+        client._cancel_statement.assert_awaited_once_with(None)
+
+    async def test_cancel_failed(self):
+        client = self.client(AsyncMock(side_effect=RuntimeError))
+        deadline = StatementDeadline(client, None, 0.01)
+        await asyncio.sleep(0.02)
+        with self.assertRaises(QueryTimeoutError):
+            await deadline.finish(RuntimeError())
+        client.log.warning.assert_called_once()
+
+    async def test_not_expired(self):
+        client = self.client(AsyncMock())
+        deadline = StatementDeadline(client, None, 5)
+        await deadline.finish(None)
+        self.assertFalse(deadline.expired)
+        client._cancel_statement.assert_not_called()
@@ -0,0 +1,113 @@
+import os
+import tempfile
+from decimal import Decimal
+
+from tests.testmodels import (
+    Currency,
+    DecimalFields,
+    DefaultOrderedDesc,
+    EnumFields,
+    Event,
+    IntFields,
+    JSONFields,
+    Service,
+    Tournament,
+)
+from tortoise.contrib import test
+from tortoise.exceptions import ConfigurationError
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: nocoverage
+    HAS_PYARROW = False
+else:
+    HAS_PYARROW = True
+
+
+@test.skipIf(not HAS_PYARROW, "pyarrow is not installed")
+class TestArrow(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        for val in range(10):
+            await IntFields.create(intnum=val, intnum_null=val if val % 2 else None)
+
+    async def test_to_arrow(self):
+        table = await IntFields.all().to_arrow()
+        self.assertEqual(table.column_names, ["id", "intnum", "intnum_null"])
+        self.assertEqual(table.schema.field("intnum").type, pyarrow.int32())
+        self.assertEqual(table.column("intnum").to_pylist(), list(range(10)))
+        self.assertEqual(table.column("intnum_null").null_count, 5)
+
+    async def test_to_arrow_batches(self):
+        batches = [batch async for batch in IntFields.all().to_arrow("intnum", batch_size=4)]
+        self.assertEqual([batch.num_rows for batch in batches], [4, 4, 2])
+        self.assertEqual(batches[0].schema.names, ["intnum"])
+        self.assertEqual(
+            [val for batch in batches for val in batch.column(0).to_pylist()], list(range(10))
+        )
+
+    async def test_to_arrow_batches_exact_multiple(self):
+        batches = [batch async for batch in IntFields.all().to_arrow("intnum", batch_size=5)]
+        self.assertEqual([batch.num_rows for batch in batches], [5, 5])
+
+    async def test_to_arrow_ordered(self):
+        table = (
+            await IntFields.filter(intnum__gte=3)
+            .order_by("-intnum")
+            .to_arrow("intnum", batch_size=3)
+        )
+        self.assertEqual(table.column("intnum").to_pylist(), [9, 8, 7, 6, 5, 4, 3])
+
+    async def test_to_arrow_default_ordering(self):
+        for one in "cabed":
+            await DefaultOrderedDesc.create(one=one, second=0)
+        table = await DefaultOrderedDesc.all().to_arrow("one")
+        self.assertEqual(table.column("one").to_pylist(), ["e", "d", "c", "b", "a"])
+        # The order doesn't depend on the batch size
+        batches = [batch async for batch in DefaultOrderedDesc.all().to_arrow("one", batch_size=2)]
+        self.assertEqual(
+            [val for batch in batches for val in batch.column(0).to_pylist()],
+            ["e", "d", "c", "b", "a"],
+        )
+
+    async def test_to_arrow_empty(self):
+        table = await IntFields.filter(intnum__gt=100).to_arrow(batch_size=4)
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.schema.field("intnum").type, pyarrow.int32())
+
+    async def test_to_arrow_field_types(self):
+        await DecimalFields.create(decimal=Decimal("1.2345"), decimal_nodec=1)
+        await JSONFields.create(data={"a": [1, 2]})
+        await EnumFields.create(service=Service.python_programming, currency=Currency.EUR)
+
+        table = await DecimalFields.all().to_arrow("decimal", "decimal_null")
+        self.assertEqual(table.schema.field("decimal").type, pyarrow.decimal128(18, 4))
+        self.assertEqual(table.column("decimal").to_pylist(), [Decimal("1.2345")])
+
+        table = await JSONFields.all().to_arrow("data")
+        self.assertEqual(table.schema.field("data").type, pyarrow.string())
+        self.assertEqual(table.column("data").to_pylist()[0].replace(" ", ""), '{"a":[1,2]}')
+
+        table = await EnumFields.all().to_arrow("service", "currency")
+        self.assertEqual(table.column("service").to_pylist(), [Service.python_programming.value])
+        self.assertEqual(table.column("currency").to_pylist(), ["EUR"])
+
+    async def test_to_arrow_related(self):
+        tournament = await Tournament.create(name="Tournament")
+        await Event.create(name="First", tournament=tournament)
+        table = await Event.all().to_arrow("name", "tournament__name", batch_size=10)
+        self.assertEqual(table.schema.field("tournament__name").type, pyarrow.string())
+        self.assertEqual(table.column("tournament__name").to_pylist(), ["Tournament"])
+
+    async def test_to_arrow_bad_batch_size(self):
+        with self.assertRaises(ConfigurationError):
+            IntFields.all().to_arrow(batch_size=0)
+
+    async def test_to_parquet(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "intfields.parquet")
+            rows = await IntFields.all().to_parquet(path, "id", "intnum", batch_size=3)
+            self.assertEqual(rows, 10)
+            table = pyarrow.parquet.read_table(path)
+        self.assertEqual(table.column("intnum").to_pylist(), list(range(10)))
@@ -0,0 +1,51 @@
+from tests.testmodels import Tournament
+from tortoise.contrib import test
+from tortoise.contrib.opentelemetry import (
+    OpenTelemetryHook,
+    instrument,
+    trace,
+    uninstrument,
+)
+from tortoise.exceptions import ConfigurationError
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+except ImportError:  # pragma: nocoverage
+    TracerProvider = None  # type: ignore
+
+
+@test.skipIf(TracerProvider is None, "opentelemetry-sdk is not installed")
+class TestOpenTelemetry(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        self.hook = instrument(provider)
+
+    async def asyncTearDown(self):
+        uninstrument(self.hook)
+        await super().asyncTearDown()
+
+    async def test_spans(self):
+        await Tournament.create(name="1")
+        await Tournament.filter(name="1")
+        insert, select = self.exporter.get_finished_spans()
+        self.assertEqual(insert.name, "insert tournament")
+        self.assertEqual(select.name, "select tournament")
+        self.assertEqual(select.attributes["db.operation"], "select")
+        self.assertEqual(select.attributes["db.sql.table"], "tournament")
+        self.assertEqual(select.attributes["tortoise.rows"], 1)
+        self.assertTrue(select.attributes["db.statement"].startswith("SELECT"))
+        self.assertGreater(select.end_time, select.start_time)
+
+
+@test.skipIf(trace is not None, "opentelemetry-api is installed")
+class TestOpenTelemetryMissing(test.SimpleTestCase):
+    def test_not_installed(self):
+        with self.assertRaises(ConfigurationError):
+            OpenTelemetryHook()
@@ -1,7 +1,7 @@
 import copy
 
 import pytest
-from pydantic import ConfigDict, ValidationError
+from pydantic import ConfigDict, ValidationError, field_serializer
 
 from tests.testmodels import (
     Address,
@@ -9,6 +9,8 @@ from tests.testmodels import (
     Employee,
     Event,
     JSONFields,
+    M2MOne,
+    M2MTwo,
     Reporter,
     Team,
     Tournament,
@@ -20,6 +22,9 @@ from tortoise.contrib.pydantic import (
     pydantic_model_creator,
     pydantic_queryset_creator,
 )
+from tortoise.contrib.pydantic.base import _optimise_queryset
+from tortoise.contrib.pydantic import creator
+from tortoise.contrib.pydantic.creator import _CREATOR_CACHE
 
 
 class TestPydantic(test.TestCase):
@@ -974,6 +979,103 @@ class TestPydantic(test.TestCase):
             ],
         )
 
+    async def test_from_queryset_projection(self):
+        Event_Pydantic = pydantic_model_creator(
+            Event,
+            exclude=("modified", "token", "alias", "reporter", "address"),
+            name="EventProjection",
+        )
+        queryset = _optimise_queryset(Event_Pydantic, Event.filter(name="Test"))
+        self.assertEqual(
+            set(queryset._fields_for_select), {"event_id", "name", "tournament_id", "reporter_id"}
+        )
+        self.assertEqual(queryset._select_related, {"tournament"})
+        self.assertEqual(list(queryset._prefetch_queries), ["participants"])
+
+        eventp = await Event_Pydantic.from_queryset_single(Event.get(name="Test"))
+        eventdict = eventp.model_dump()
+        del eventdict["tournament"]["created"]
+        self.assertEqual(
+            eventdict,
+            {
+                "event_id": self.event.event_id,
+                "name": "Test",
+                "tournament": {"id": self.tournament.id, "name": "New Tournament", "desc": None},
+                "reporter_id": self.reporter.id,
+                "participants": [
+                    {"id": self.team1.id, "name": "Onesies", "alias": None},
+                    {"id": self.team2.id, "name": "T-Shirts", "alias": None},
+                ],
+            },
+        )
+
+    async def test_from_queryset_matches_from_tortoise_orm(self):
+        for model, pydantic_model in (
+            (Event, self.Event_Pydantic),
+            (Tournament, self.Tournament_Pydantic),
+            (Team, self.Team_Pydantic),
+            (Address, self.Address_Pydantic),
+        ):
+            expected = [
+                (await pydantic_model.from_tortoise_orm(obj)).model_dump()
+                for obj in await model.all().order_by(model._meta.pk_attr)
+            ]
+            result = await pydantic_model.from_queryset(model.all().order_by(model._meta.pk_attr))
+            self.assertEqual([obj.model_dump() for obj in result], expected)
+
+    async def test_json_from_queryset(self):
+        for model, pydantic_model in (
+            (Event, self.Event_Pydantic),
+            (Tournament, self.Tournament_Pydantic),
+            (Team, self.Team_Pydantic),
+            (Address, self.Address_Pydantic),
+        ):
+            queryset = model.all().order_by(model._meta.pk_attr)
+            objs = await pydantic_model.from_queryset(queryset)
+            expected = b"[" + b",".join(obj.model_dump_json().encode() for obj in objs) + b"]"
+            self.assertEqual(await pydantic_model.json_from_queryset(queryset), expected)
+
+    async def test_json_from_queryset_single(self):
+        result = await self.Event_Pydantic.json_from_queryset_single(Event.get(name="Test"))
+        expected = await self.Event_Pydantic.from_queryset_single(Event.get(name="Test"))
+        self.assertEqual(result, expected.model_dump_json().encode())
+        result = await self.Event_Pydantic.json_from_queryset_single(
+            Event.get_or_none(name="Missing")
+        )
+        self.assertEqual(result, b"null")
+
+    async def test_json_from_queryset_list_model(self):
+        queryset = Event.all().order_by("event_id")
+        result = await self.Event_Pydantic_List.json_from_queryset(queryset)
+        expected = await self.Event_Pydantic_List.from_queryset(queryset)
+        self.assertEqual(result, expected.model_dump_json().encode())
+
+    async def test_json_from_queryset_m2m_order(self):
+        twos = [await M2MTwo.create(name=str(i)) for i in range(4)]
+        one = await M2MOne.create(name="one")
+        for i in (2, 0, 3, 1):
+            await one.two.add(twos[i])
+        pydantic_model = pydantic_model_creator(M2MOne)
+        expected = await pydantic_model.from_queryset_single(M2MOne.get(pk=one.pk))
+        result = await pydantic_model.json_from_queryset_single(M2MOne.get(pk=one.pk))
+        self.assertEqual(result, expected.model_dump_json().encode())
+
+    async def test_json_from_queryset_serializers_and_aliases(self):
+        class TeamSerialized(self.Team_Pydantic):
+            @field_serializer("name")
+            def serialize_name(self, value):
+                return value.upper()
+
+        await CamelCaseAliasPerson.create(first_name="A", last_name="B")
+        for model, pydantic_model in (
+            (Team, TeamSerialized),
+            (CamelCaseAliasPerson, pydantic_model_creator(CamelCaseAliasPerson)),
+        ):
+            queryset = model.all().order_by("id")
+            objs = await pydantic_model.from_queryset(queryset)
+            expected = b"[" + b",".join(obj.model_dump_json().encode() for obj in objs) + b"]"
+            self.assertEqual(await pydantic_model.json_from_queryset(queryset), expected)
+
     async def test_event(self):
         eventp = await self.Event_Pydantic.from_tortoise_orm(await Event.get(name="Test"))
         # print(eventp.json(indent=4))
@@ -1531,6 +1633,13 @@ class TestPydanticCycle(test.TestCase):
             },
         )
 
+    async def test_from_queryset_computed(self):
+        empp = await self.Employee_Pydantic.from_queryset_single(Employee.get(name="Root"))
+        expected = await self.Employee_Pydantic.from_tortoise_orm(await Employee.get(name="Root"))
+        self.assertEqual(empp.model_dump(), expected.model_dump())
+        result = await self.Employee_Pydantic.json_from_queryset_single(Employee.get(name="Root"))
+        self.assertEqual(result, expected.model_dump_json().encode())
+
 
 class TestPydanticUpdate(test.TestCase):
     def setUp(self) -> None:
@@ -1678,3 +1787,49 @@ class TestPydanticOptionalUpdate(test.TestCase):
             ).model_dump(),
             {"username": "name", "mail": "a@example.com", "bio": ""},
         )
+
+
+class TestPydanticCreatorCache(test.SimpleTestCase):
+    def test_memoised(self):
+        model = pydantic_model_creator(Event, exclude=("modified",))
+        self.assertIs(pydantic_model_creator(Event, exclude=("modified",)), model)
+        self.assertIsNot(pydantic_model_creator(Event, exclude=("alias",)), model)
+        self.assertIs(pydantic_queryset_creator(Event), pydantic_queryset_creator(Event))
+
+    def test_submodels_shared(self):
+        _CREATOR_CACHE.clear()
+        model = pydantic_model_creator(Tournament)
+        cached = len(_CREATOR_CACHE)
+        self.assertGreater(cached, 1)
+        list_model = pydantic_queryset_creator(Tournament)
+        self.assertIs(list_model.model_config["submodel"], model)
+        self.assertEqual(len(_CREATOR_CACHE), cached + 1)
+
+    def test_submodels_keyed_by_path(self):
+        model = pydantic_model_creator(Tournament)
+        named = pydantic_model_creator(Tournament, name="TournamentNamed")
+        events = model.model_fields["events"].annotation.__args__[0]
+        self.assertIs(named.model_fields["events"].annotation.__args__[0], events)
+        # Built at the top level, the model is named and cut off differently
+        self.assertIsNot(pydantic_model_creator(Event), events)
+
+    def test_bounded(self):
+        _CREATOR_CACHE.clear()
+        size = creator.CREATOR_CACHE_SIZE
+        creator.CREATOR_CACHE_SIZE = 2
+        try:
+            model = pydantic_model_creator(Reporter, exclude=("events",))
+            pydantic_model_creator(Team, exclude=("events",))
+            self.assertIs(pydantic_model_creator(Reporter, exclude=("events",)), model)
+            pydantic_model_creator(User)
+            self.assertEqual(len(_CREATOR_CACHE), 2)
+            self.assertIs(pydantic_model_creator(Reporter, exclude=("events",)), model)
+            self.assertNotIn(Team, [key[0] for key in _CREATOR_CACHE])
+        finally:
+            creator.CREATOR_CACHE_SIZE = size
+
+    def test_unhashable_arguments_not_cached(self):
+        config = ConfigDict(json_schema_extra={"example": {}})
+        model = pydantic_model_creator(User, name="UserUncached", model_config=config)
+        self.assertEqual(model.model_config["json_schema_extra"], {"example": {}})
+        self.assertNotIn(model, _CREATOR_CACHE.values())
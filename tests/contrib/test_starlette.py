@@ -0,0 +1,48 @@
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from tests.testmodels import Tournament
+from tortoise.cache import current_identity_map
+from tortoise.contrib import test
+from tortoise.contrib.starlette import IdentityMapMiddleware
+
+
+async def same_instance(request):
+    tournament = await Tournament.get(name="Tournament")
+    return JSONResponse(
+        {
+            "active": current_identity_map.get() is not None,
+            "same": await Tournament.first() is tournament,
+        }
+    )
+
+
+class TestIdentityMapMiddleware(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await Tournament.create(name="Tournament")
+        app = Starlette(
+            routes=[Route("/", same_instance)], middleware=[Middleware(IdentityMapMiddleware)]
+        )
+        self.client = AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+        await super().asyncTearDown()
+
+    async def test_request_scoped(self):
+        response = await self.client.get("/")
+        self.assertEqual(response.json(), {"active": True, "same": True})
+        self.assertIsNone(current_identity_map.get())
+
+    async def test_lifespan_passed_through(self):
+        scopes = []
+
+        async def app(scope, receive, send):
+            scopes.append((scope["type"], current_identity_map.get()))
+
+        await IdentityMapMiddleware(app)({"type": "lifespan"}, None, None)
+        self.assertEqual(scopes, [("lifespan", None)])
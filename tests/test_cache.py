@@ -0,0 +1,150 @@
+from tests.testmodels import Event, Team, Tournament
+from tortoise.cache import LRUCacheStore, query_cache
+from tortoise.contrib import test
+from tortoise.transactions import in_transaction
+
+
+class TestLRUCacheStore(test.SimpleTestCase):
+    async def test_get_set(self):
+        store = LRUCacheStore(maxsize=2)
+        self.assertEqual(await store.get(("models", "a")), (False, None))
+        await store.set(("models", "a"), [1], None, ["t1"])
+        self.assertEqual(await store.get(("models", "a")), (True, [1]))
+        info = store.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    async def test_eviction(self):
+        store = LRUCacheStore(maxsize=2)
+        await store.set(("models", "a"), 1, None, ["t1"])
+        await store.set(("models", "b"), 2, None, ["t1"])
+        await store.get(("models", "a"))
+        await store.set(("models", "c"), 3, None, ["t2"])
+        self.assertEqual(await store.get(("models", "b")), (False, None))
+        self.assertEqual(await store.get(("models", "a")), (True, 1))
+        self.assertEqual(store.cache_info().evictions, 1)
+        self.assertEqual(len(store), 2)
+
+    async def test_ttl(self):
+        store = LRUCacheStore()
+        await store.set(("models", "a"), 1, 0, ["t1"])
+        self.assertEqual(await store.get(("models", "a")), (False, None))
+        self.assertEqual(len(store), 0)
+
+    async def test_invalidate(self):
+        store = LRUCacheStore()
+        await store.set(("models", "a"), 1, None, ["t1", "t2"])
+        await store.set(("models", "b"), 2, None, ["t2"])
+        await store.set(("models", "c"), 3, None, ["t3"])
+        await store.invalidate("t1")
+        self.assertEqual(await store.get(("models", "a")), (False, None))
+        self.assertEqual(await store.get(("models", "b")), (True, 2))
+        await store.invalidate("t2")
+        self.assertEqual(await store.get(("models", "b")), (False, None))
+        self.assertEqual(await store.get(("models", "c")), (True, 3))
+        self.assertEqual(store.cache_info().invalidations, 2)
+
+
+class TestQueryCache(test.TruncationTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.store = LRUCacheStore()
+        query_cache.set_store(self.store)
+
+    async def asyncTearDown(self):
+        query_cache.set_store(None)
+        await super().asyncTearDown()
+
+    async def test_cache_hit(self):
+        await Tournament.create(name="1")
+        first = await Tournament.all().cache()
+        second = await Tournament.all().cache()
+        self.assertEqual([t.name for t in second], ["1"])
+        self.assertIsNot(first[0], second[0])
+        info = query_cache.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    async def test_not_cached_by_default(self):
+        await Tournament.all()
+        self.assertEqual(len(self.store), 0)
+
+    async def test_invalidated_by_save_and_delete(self):
+        tournament = await Tournament.create(name="1")
+        await Tournament.all().cache()
+        tournament.name = "2"
+        await tournament.save()
+        self.assertEqual([t.name for t in await Tournament.all().cache()], ["2"])
+        await tournament.delete()
+        self.assertEqual(await Tournament.all().cache(), [])
+
+    async def test_invalidated_by_queries(self):
+        await Tournament.create(name="1")
+        await Tournament.all().cache()
+        await Tournament.filter(name="1").update(name="2")
+        self.assertEqual([t.name for t in await Tournament.all().cache()], ["2"])
+        await Tournament.bulk_create([Tournament(name="3")])
+        self.assertEqual(len(await Tournament.all().cache()), 2)
+        await Tournament.filter(name="3").delete()
+        self.assertEqual(len(await Tournament.all().cache()), 1)
+
+    async def test_invalidated_by_bulk_update(self):
+        tournament = await Tournament.create(name="1")
+        await Tournament.all().cache()
+        tournament.name = "2"
+        await Tournament.bulk_update([tournament], fields=["name"])
+        self.assertEqual([t.name for t in await Tournament.all().cache()], ["2"])
+
+    async def test_invalidated_by_joined_table(self):
+        tournament = await Tournament.create(name="1")
+        await Event.create(name="e", tournament=tournament)
+        self.assertEqual(len(await Event.filter(tournament__name="1").cache()), 1)
+        await Tournament.filter(id=tournament.id).update(name="2")
+        self.assertEqual(await Event.filter(tournament__name="1").cache(), [])
+
+    async def test_invalidated_by_m2m(self):
+        tournament = await Tournament.create(name="1")
+        event = await Event.create(name="e", tournament=tournament)
+        team = await Team.create(name="t")
+        self.assertEqual(await Team.filter(events__name="e").cache(), [])
+        await event.participants.add(team)
+        self.assertEqual(len(await Team.filter(events__name="e").cache()), 1)
+
+    async def test_invalidated_by_cascade(self):
+        tournament = await Tournament.create(name="1")
+        event = await Event.create(name="e", tournament=tournament)
+        await event.participants.add(await Team.create(name="t"))
+        self.assertEqual(len(await Event.all().cache()), 1)
+        self.assertEqual(len(await Team.filter(events__name="e").cache()), 1)
+        await tournament.delete()
+        self.assertEqual(await Event.all().cache(), [])
+        self.assertEqual(await Team.filter(events__name="e").cache(), [])
+
+    async def test_delete_tables(self):
+        tables = Tournament._meta.delete_tables
+        # Event cascades from Tournament, its m2m and Address cascade from Event
+        for table in ("tournament", "event", "event_team", "address"):
+            self.assertIn(table, tables)
+        self.assertNotIn("team", tables)
+
+    async def test_invalidated_on_commit(self):
+        await Tournament.create(name="1")
+        await Tournament.all().cache()
+        async with in_transaction():
+            await Tournament.filter(name="1").update(name="2")
+            self.assertEqual(len(self.store), 1)
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual([t.name for t in await Tournament.all().cache()], ["2"])
+
+    async def test_not_invalidated_on_rollback(self):
+        await Tournament.create(name="1")
+        await Tournament.all().cache()
+        with self.assertRaises(ValueError):
+            async with in_transaction():
+                await Tournament.filter(name="1").update(name="2")
+                raise ValueError()
+        self.assertEqual(len(self.store), 1)
+
+    async def test_bypassed_in_transaction(self):
+        await Tournament.create(name="1")
+        async with in_transaction():
+            await Tournament.all().cache()
+        self.assertEqual(len(self.store), 0)
@@ -253,6 +253,17 @@ class TestConnections(SimpleTestCase):
         mocked_get.assert_has_calls([call("default"), call("other")], any_order=True)
         self.assertEqual(ret_val, expected_result)
 
+    @patch("tortoise.connection.ConnectionHandler._create_connection")
+    @patch("tortoise.connection.ConnectionHandler._get_storage")
+    def test_stats(self, mocked_get_storage: Mock, mocked_create_connection: Mock):
+        client = Mock(spec=BaseDBAsyncClient, _parent=None)
+        client.stats.return_value = {"size": 1}
+        transaction = Mock(spec=BaseDBAsyncClient, _parent=client)
+        mocked_get_storage.return_value = {"default": transaction}
+        self.assertEqual(self.conn_handler.stats(), {"default": {"size": 1}})
+        transaction.stats.assert_not_called()
+        mocked_create_connection.assert_not_called()
+
     @patch("tortoise.connection.ConnectionHandler.all")
     @patch("tortoise.connection.ConnectionHandler.discard")
     @patch("tortoise.connection.ConnectionHandler.db_config", new_callable=PropertyMock)
@@ -0,0 +1,83 @@
+import asyncio
+
+from tests.testmodels import Event, Team, Tournament
+from tortoise import identity_map
+from tortoise.cache import current_identity_map
+from tortoise.contrib import test
+
+
+class TestIdentityMap(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.tournament = await Tournament.create(name="Tournament")
+        self.event = await Event.create(name="Event", tournament=self.tournament)
+        self.team = await Team.create(name="Team")
+        await self.event.participants.add(self.team)
+
+    async def test_inactive(self):
+        self.assertIsNot(
+            await Tournament.get(pk=self.tournament.pk), await Tournament.get(pk=self.tournament.pk)
+        )
+
+    async def test_same_instance(self):
+        async with identity_map() as instances:
+            tournament = await Tournament.get(pk=self.tournament.pk)
+            self.assertIs(await Tournament.filter(name="Tournament").first(), tournament)
+            self.assertIn(tournament, await Tournament.all())
+            self.assertEqual(len(instances), 1)
+        self.assertIsNone(current_identity_map.get())
+        self.assertIsNot(await Tournament.get(pk=self.tournament.pk), tournament)
+
+    async def test_loaded_instance_not_refreshed(self):
+        async with identity_map():
+            tournament = await Tournament.get(pk=self.tournament.pk)
+            tournament.name = "Changed"
+            self.assertEqual((await Tournament.get(pk=self.tournament.pk)).name, "Changed")
+
+    async def test_select_related(self):
+        async with identity_map():
+            tournament = await Tournament.get(pk=self.tournament.pk)
+            event = await Event.get(pk=self.event.pk).select_related("tournament")
+            self.assertIs(event.tournament, tournament)
+
+    async def test_prefetch_related(self):
+        async with identity_map():
+            tournament = await Tournament.get(pk=self.tournament.pk)
+            team = await Team.get(pk=self.team.pk)
+            event = await Event.get(pk=self.event.pk).prefetch_related("tournament", "participants")
+            self.assertIs(event.tournament, tournament)
+            self.assertIs(event.participants[0], team)
+            tournament = await Tournament.get(pk=self.tournament.pk).prefetch_related("events")
+            self.assertIs(tournament.events[0], event)
+
+    async def test_partial_not_registered(self):
+        async with identity_map() as instances:
+            partial = await Tournament.get(pk=self.tournament.pk).only("id", "name")
+            self.assertEqual(len(instances), 0)
+            tournament = await Tournament.get(pk=self.tournament.pk)
+            self.assertIsNot(tournament, partial)
+            self.assertIs(await Tournament.get(pk=self.tournament.pk).only("id"), tournament)
+
+    async def test_sync_context_and_tasks(self):
+        with identity_map():
+            tournament = await Tournament.get(pk=self.tournament.pk)
+            other = await asyncio.ensure_future(Tournament.get(pk=self.tournament.pk))
+            self.assertIs(other, tournament)
+
+    async def test_deleted_discarded(self):
+        async with identity_map() as instances:
+            tournament = await Tournament.get(pk=self.tournament.pk)
+            event = await Event.get(pk=self.event.pk)
+            await tournament.delete()
+            self.assertEqual(len(instances), 0)
+            await Tournament.create(id=tournament.pk, name="Recreated")
+            self.assertEqual((await Tournament.get(pk=tournament.pk)).name, "Recreated")
+            self.assertIsNone(await Event.get_or_none(pk=event.pk))
+
+    async def test_bulk_deleted_discarded(self):
+        async with identity_map() as instances:
+            await Tournament.get(pk=self.tournament.pk)
+            await Team.get(pk=self.team.pk)
+            await Tournament.filter(pk=self.tournament.pk).delete()
+            self.assertIsNone(instances.get(Tournament, self.tournament.pk))
+            self.assertIsNotNone(instances.get(Team, self.team.pk))
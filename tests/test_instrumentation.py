@@ -0,0 +1,136 @@
+from tests.testmodels import Event, Tournament
+from tortoise import connections
+from tortoise.backends.base_postgres.client import translate_exceptions
+from tortoise.contrib import test
+from tortoise.exceptions import OperationalError
+from tortoise.instrumentation import STAGES, add_hook, hooks, remove_hook
+from tortoise.transactions import in_transaction
+
+
+class TestInstrumentation(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.events = []
+        add_hook(self.events.append)
+
+    async def asyncTearDown(self):
+        remove_hook(self.events.append)
+        await super().asyncTearDown()
+
+    async def test_select(self):
+        await Tournament.create(name="1")
+        await Tournament.create(name="2")
+        self.events.clear()
+        await Tournament.filter(name__in=["1", "2"])
+        (event,) = self.events
+        self.assertEqual(event.operation, "select")
+        self.assertIs(event.model, Tournament)
+        self.assertEqual(event.connection_name, "models")
+        self.assertTrue(event.sql.startswith("SELECT"))
+        self.assertEqual(event.rows, 2)
+        self.assertIsNone(event.error)
+        self.assertEqual(set(event.timings), set(STAGES))
+        self.assertGreater(event.timings["build"], 0)
+        self.assertGreater(event.timings["execute"], 0)
+        self.assertGreater(event.timings["hydrate"], 0)
+        self.assertAlmostEqual(event.duration, sum(event.timings.values()))
+
+    async def test_prefetch(self):
+        tournament = await Tournament.create(name="1")
+        await Event.create(name="e", tournament=tournament)
+        self.events.clear()
+        await Tournament.all().prefetch_related("events")
+        self.assertEqual(
+            [(e.model, e.operation) for e in self.events],
+            [(Event, "select"), (Tournament, "select")],
+        )
+        self.assertGreater(self.events[1].timings["prefetch"], 0)
+        self.assertEqual(self.events[1].rows, 1)
+
+    async def test_save_and_delete(self):
+        tournament = await Tournament.create(name="1")
+        tournament.name = "2"
+        await tournament.save()
+        await tournament.delete()
+        self.assertEqual(
+            [(e.model, e.operation, e.rows) for e in self.events],
+            [(Tournament, "insert", 1), (Tournament, "update", 1), (Tournament, "delete", 1)],
+        )
+        self.assertEqual(self.events[0].params, 3)
+
+    async def test_update_and_bulk(self):
+        tournaments = [await Tournament.create(name=str(i)) for i in range(3)]
+        self.events.clear()
+        await Tournament.filter(name="0").update(name="a")
+        await Tournament.bulk_update(tournaments, fields=["name"], batch_size=2)
+        self.assertEqual(
+            [(e.operation, e.rows) for e in self.events], [("update", 1), ("update", 3)]
+        )
+
+    async def test_raw(self):
+        await connections.get("models").execute_query("SELECT 1")
+        (event,) = self.events
+        self.assertEqual((event.model, event.operation, event.sql), (None, "select", "SELECT 1"))
+
+    async def test_error(self):
+        with self.assertRaises(OperationalError):
+            await connections.get("models").execute_query("SELECT * FROM nonexistent")
+        (event,) = self.events
+        self.assertIsNotNone(event.error)
+
+    async def test_async_and_failing_hooks(self):
+        seen = []
+
+        async def async_hook(event):
+            seen.append(event)
+
+        def failing_hook(event):
+            raise ValueError()
+
+        add_hook(async_hook)
+        add_hook(failing_hook)
+        try:
+            with self.assertLogs("tortoise", "ERROR"):
+                await Tournament.all()
+        finally:
+            remove_hook(async_hook)
+            remove_hook(failing_hook)
+        self.assertEqual(seen, self.events)
+
+    async def test_no_hooks(self):
+        remove_hook(self.events.append)
+        self.assertEqual(hooks, [])
+        await Tournament.create(name="1")
+        await Tournament.all()
+        self.assertEqual(self.events, [])
+
+
+class TestInstrumentationTransactions(test.TruncationTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.events = []
+        add_hook(self.events.append)
+
+    async def asyncTearDown(self):
+        remove_hook(self.events.append)
+        await super().asyncTearDown()
+
+    async def test_transaction(self):
+        # Starts the transaction through the start() the client instruments, if any
+        async with in_transaction():
+            await Tournament.create(name="1")
+        self.assertEqual([e.operation for e in self.events], ["insert"])
+
+    async def test_statement_without_query(self):
+        class Client:
+            connection_name = "models"
+
+            async def _translate_exceptions(self, func, *args, **kwargs):
+                return await func(self, *args, **kwargs)
+
+            @translate_exceptions
+            async def start(self):
+                return "started"
+
+        self.assertEqual(await Client().start(), "started")
+        self.assertEqual(self.events, [])
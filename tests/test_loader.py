@@ -0,0 +1,181 @@
+import asyncio
+import gc
+import pickle
+import weakref
+
+from tests.testmodels import Address, Event, Team, Tournament
+from tortoise import batch_loader, identity_map
+from tortoise.contrib import test
+from tortoise.exceptions import DoesNotExist
+
+
+class TestBatchLoader(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.tournaments = [await Tournament.create(name=str(i)) for i in range(5)]
+        self.events = [
+            await Event.create(name=str(i), tournament=tournament)
+            for i, tournament in enumerate(self.tournaments)
+        ]
+
+    async def test_batched(self):
+        async with batch_loader() as loader:
+            tournaments = await asyncio.gather(
+                *(Tournament.get(pk=tournament.pk) for tournament in self.tournaments),
+                Tournament.get_or_none(id=self.tournaments[0].pk),
+                Tournament.get_or_none(pk=str(self.tournaments[1].pk)),
+            )
+        self.assertEqual(loader.batches, 1)
+        self.assertEqual([t.name for t in tournaments], ["0", "1", "2", "3", "4", "0", "1"])
+        self.assertIsNot(tournaments[0], tournaments[5])
+
+    async def test_identity_map_shares_instances(self):
+        async with identity_map(), batch_loader() as loader:
+            tournament = await Tournament.get(pk=self.tournaments[0].pk)
+            tournaments = await asyncio.gather(
+                Tournament.get(pk=self.tournaments[0].pk),
+                Tournament.get(pk=self.tournaments[0].pk),
+            )
+        self.assertEqual(loader.batches, 2)
+        self.assertIs(tournaments[0], tournament)
+        self.assertIs(tournaments[1], tournament)
+
+    async def test_fk_getter(self):
+        events = await Event.all().order_by("name")
+        async with batch_loader() as loader:
+            tournaments = await asyncio.gather(*(event.tournament for event in events))
+        self.assertEqual(loader.batches, 1)
+        self.assertEqual([t.name for t in tournaments], ["0", "1", "2", "3", "4"])
+
+    async def test_missing(self):
+        async with batch_loader():
+            tournament, missing = await asyncio.gather(
+                Tournament.get_or_none(pk=self.tournaments[0].pk), Tournament.get_or_none(pk=0)
+            )
+            self.assertEqual(tournament.name, "0")
+            self.assertIsNone(missing)
+            with self.assertRaises(DoesNotExist):
+                await Tournament.get(pk=0)
+
+    async def test_max_batch_size(self):
+        async with batch_loader(max_batch_size=2) as loader:
+            tournaments = await asyncio.gather(
+                *(Tournament.get(pk=tournament.pk) for tournament in self.tournaments)
+            )
+        self.assertEqual(loader.batches, 3)
+        self.assertEqual([t.name for t in tournaments], ["0", "1", "2", "3", "4"])
+
+    async def test_fetch_kept_alive(self):
+        async with batch_loader() as loader:
+            future = loader.load(Tournament, Tournament._meta.db, self.tournaments[0].pk)
+            await asyncio.sleep(0)
+            # The dispatched fetch is referenced by the loader while it runs
+            gc.collect()
+            self.assertEqual(len(loader._tasks), 1)
+            self.assertEqual((await future).name, "0")
+            await asyncio.sleep(0)
+            self.assertEqual(loader._tasks, set())
+
+    async def test_window(self):
+        async with batch_loader(window=0.01) as loader:
+
+            async def delayed_get(tournament):
+                await asyncio.sleep(0)
+                return await Tournament.get(pk=tournament.pk)
+
+            await asyncio.gather(
+                Tournament.get(pk=self.tournaments[0].pk),
+                *(delayed_get(tournament) for tournament in self.tournaments[1:]),
+            )
+        self.assertEqual(loader.batches, 1)
+
+    async def test_other_lookups_not_batched(self):
+        async with batch_loader() as loader:
+            await asyncio.gather(
+                Tournament.get(name="0"),
+                Tournament.filter(pk=self.tournaments[0].pk).only("id").first(),
+                Tournament.all(),
+            )
+        self.assertEqual(loader.batches, 0)
+
+
+class TestBatchLazyLoad(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.tournaments = [await Tournament.create(name=str(i)) for i in range(3)]
+        for i, tournament in enumerate(self.tournaments):
+            await Event.create(name=f"{i}a", tournament=tournament)
+            await Event.create(name=f"{i}b", tournament=tournament)
+
+    async def test_fk(self):
+        events = await Event.all().order_by("name").batch_lazy_load()
+        tournaments = [await event.tournament for event in events]
+        self.assertEqual([t.name for t in tournaments], ["0", "0", "1", "1", "2", "2"])
+        self.assertEqual(events[0]._relation_loader.batches, 1)
+        # Loaded once, so awaiting again returns the same object
+        self.assertIs(await events[0].tournament, tournaments[0])
+
+    async def test_concurrent(self):
+        events = await Event.all().order_by("name").batch_lazy_load()
+        tournaments = await asyncio.gather(*(event.tournament for event in events))
+        self.assertEqual([t.name for t in tournaments], ["0", "0", "1", "1", "2", "2"])
+        self.assertEqual(events[0]._relation_loader.batches, 1)
+
+    async def test_reverse_fk(self):
+        tournaments = await Tournament.all().order_by("name").batch_lazy_load()
+        names = [sorted(e.name for e in await tournament.events) for tournament in tournaments]
+        self.assertEqual(names, [["0a", "0b"], ["1a", "1b"], ["2a", "2b"]])
+        self.assertEqual(tournaments[0]._relation_loader.batches, 1)
+        self.assertEqual(len(tournaments[2].events), 2)
+
+    async def test_m2m(self):
+        team = await Team.create(name="team")
+        events = await Event.all().order_by("name").batch_lazy_load()
+        await events[0].participants.add(team)
+        participants = [await event.participants for event in events]
+        self.assertEqual([len(teams) for teams in participants], [1, 0, 0, 0, 0, 0])
+        self.assertEqual(events[0]._relation_loader.batches, 1)
+
+    async def test_reverse_o2o(self):
+        events = await Event.all().order_by("name").batch_lazy_load()
+        await Address.create(city="city", street="street", event=events[1])
+        addresses = [await event.address for event in events]
+        self.assertEqual([a.city if a else None for a in addresses][:3], [None, "city", None])
+        self.assertEqual(events[0]._relation_loader.batches, 1)
+
+    async def test_prefetched_not_reloaded(self):
+        events = await Event.all().prefetch_related("tournament").batch_lazy_load()
+        for event in events:
+            await event.tournament
+        self.assertEqual(events[0]._relation_loader.batches, 0)
+
+    async def test_refined_query(self):
+        events = await Event.all().order_by("name").batch_lazy_load()
+        tournament = await events[0].tournament.only("id", "name")
+        self.assertEqual(tournament.name, "0")
+        self.assertEqual(events[0]._relation_loader.batches, 0)
+        self.assertEqual(await events[1].address.values_list("city", flat=True), None)
+
+    async def test_pickle_and_clone(self):
+        events = await Event.all().order_by("name").batch_lazy_load()
+        event = pickle.loads(pickle.dumps(events[0]))
+        self.assertIsNone(event._relation_loader)
+        self.assertEqual((await event.tournament).name, "0")
+        self.assertIsNone(events[0].clone()._relation_loader)
+
+    async def test_instances_not_kept_alive(self):
+        events = await Event.all().order_by("name").batch_lazy_load()
+        loader = events[0]._relation_loader
+        ref = weakref.ref(events[1])
+        del events[1:]
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertEqual(loader.instances, events)
+        self.assertEqual((await events[0].tournament).name, "0")
+
+    async def test_not_enabled_by_default(self):
+        events = await Event.all()
+        self.assertIsNone(events[0]._relation_loader)
+        single = await Event.all().batch_lazy_load().first()
+        self.assertIsNone(single._relation_loader)
+        self.assertIsNone(events[0].clone()._relation_loader)
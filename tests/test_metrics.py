@@ -0,0 +1,89 @@
+import asyncio
+
+from unittest.mock import AsyncMock, patch
+
+from tests.testmodels import Tournament
+from tortoise import Tortoise, connections
+from tortoise.contrib import test
+from tortoise.metrics import (
+    Histogram,
+    _stats,
+    add_observer,
+    remove_observer,
+    reset_stats,
+)
+from tortoise.transactions import in_transaction
+
+
+class TestHistogram(test.SimpleTestCase):
+    def test_snapshot(self):
+        histogram = Histogram(buckets=(0.1, 1))
+        for value in (0.05, 0.1, 0.5, 2):
+            histogram.observe(value)
+        self.assertEqual(
+            histogram.snapshot(),
+            {"count": 4, "sum": 2.65, "buckets": {0.1: 2, 1: 3, float("inf"): 4}},
+        )
+
+
+class TestConnectionStats(test.TruncationTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        reset_stats()
+        self.observed = []
+        add_observer(self.observe)
+
+    async def asyncTearDown(self):
+        remove_observer(self.observe)
+        await super().asyncTearDown()
+
+    def observe(self, connection_name, metric, value):
+        self.observed.append((connection_name, metric))
+
+    async def test_acquire_and_hold(self):
+        await Tournament.create(name="1")
+        await Tournament.all()
+        stats = connections.stats()["models"]
+        self.assertEqual(stats["acquired"], 2)
+        self.assertEqual((stats["in_use"], stats["waiters"], stats["errors"]), (0, 0, 0))
+        self.assertEqual((stats["size"], stats["idle"], stats["max_size"]), (1, 1, 1))
+        self.assertEqual(stats["acquire_wait"]["count"], 2)
+        self.assertEqual(stats["hold"]["count"], 2)
+        self.assertEqual(stats["lock_wait"]["count"], 0)
+        self.assertEqual(
+            self.observed,
+            [("models", "acquire_wait"), ("models", "hold")] * 2,
+        )
+
+    async def test_in_use_and_waiters(self):
+        client = connections.get("models")
+        async with client.acquire_connection():
+            task = asyncio.ensure_future(Tournament.all())
+            while not connections.stats()["models"]["waiters"]:
+                await asyncio.sleep(0)
+            await asyncio.sleep(0.01)
+            stats = connections.stats()["models"]
+            self.assertEqual((stats["in_use"], stats["idle"], stats["waiters"]), (1, 0, 1))
+        await task
+        stats = connections.stats()["models"]
+        self.assertEqual((stats["in_use"], stats["waiters"]), (0, 0))
+        self.assertGreaterEqual(stats["acquire_wait"]["sum"], 0.01)
+
+    async def test_transaction(self):
+        async with in_transaction():
+            await asyncio.gather(Tournament.create(name="1"), Tournament.create(name="2"))
+            stats = connections.stats()["models"]
+            self.assertEqual((stats["in_use"], stats["acquired"]), (1, 1))
+        stats = connections.stats()["models"]
+        self.assertEqual(stats["in_use"], 0)
+        self.assertEqual(stats["hold"]["count"], 1)
+        self.assertEqual(stats["lock_wait"]["count"], 2)
+        self.assertIn(("models", "lock_wait"), self.observed)
+
+    async def test_close_connections_resets(self):
+        await Tournament.all()
+        self.assertIn("models", _stats)
+        with patch("tortoise.connections.close_all", new_callable=AsyncMock) as close_all:
+            await Tortoise.close_connections()
+        close_all.assert_awaited_once()
+        self.assertEqual(_stats, {})
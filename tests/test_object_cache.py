@@ -0,0 +1,139 @@
+from tests.testmodels import CachedUser, CachedUserNote, Tournament
+from tortoise.contrib import test
+from tortoise.exceptions import DoesNotExist
+from tortoise.transactions import in_transaction
+
+
+class TestObjectCache(test.TruncationTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.cache = CachedUser._meta.object_cache
+        self.user = await CachedUser.create(username="alice", name="Alice")
+        self.cache.clear()
+        self.cache.hits = self.cache.misses = 0
+
+    async def assertHit(self, awaitable):
+        hits = self.cache.hits
+        result = await awaitable
+        self.assertEqual(self.cache.hits, hits + 1)
+        return result
+
+    async def test_disabled_by_default(self):
+        self.assertIsNone(Tournament._meta.object_cache)
+
+    async def test_get_by_pk(self):
+        user = await CachedUser.get(pk=self.user.pk)
+        self.assertEqual(self.cache.misses, 1)
+        cached = await self.assertHit(CachedUser.get(id=self.user.pk))
+        self.assertEqual(cached.name, "Alice")
+        self.assertIsNot(cached, user)
+        await self.assertHit(CachedUser.get_or_none(pk=self.user.pk))
+        await self.assertHit(CachedUser[self.user.pk])
+
+    async def test_get_by_unique_field(self):
+        await CachedUser.all()
+        user = await self.assertHit(CachedUser.get(username="alice"))
+        self.assertEqual(user.pk, self.user.pk)
+
+    async def test_pk_value_normalised(self):
+        await CachedUser.all()
+        await self.assertHit(CachedUser.get(pk=str(self.user.pk)))
+
+    async def test_fk_getter(self):
+        note = await CachedUserNote.create(user=self.user)
+        note = await CachedUserNote.get(pk=note.pk)
+        await CachedUser.all()
+        user = await self.assertHit(note.user)
+        self.assertEqual(user.username, "alice")
+
+    async def test_other_lookups_not_served(self):
+        await CachedUser.all()
+        await CachedUser.get(name="Alice")
+        await CachedUser.filter(pk=self.user.pk).only("id", "name").first()
+        await CachedUser.filter(pk=self.user.pk, name="Alice").first()
+        self.assertEqual(self.cache.hits, 0)
+
+    async def test_missing_row(self):
+        with self.assertRaises(DoesNotExist):
+            await CachedUser.get(pk=self.user.pk + 100)
+
+    async def test_evicted_on_save_and_delete(self):
+        await CachedUser.all()
+        self.user.username = "bob"
+        await self.user.save()
+        self.assertEqual(len(self.cache), 0)
+        self.assertIsNone(await CachedUser.get_or_none(username="alice"))
+        user = await CachedUser.get(username="bob")
+        self.assertEqual(len(self.cache), 1)
+        await user.delete()
+        self.assertIsNone(await CachedUser.get_or_none(pk=self.user.pk))
+
+    async def test_cleared_on_update(self):
+        await CachedUser.all()
+        await CachedUser.filter(pk=self.user.pk).update(name="Bob")
+        user = await CachedUser.get(pk=self.user.pk)
+        self.assertEqual(user.name, "Bob")
+
+    async def test_evicted_on_commit(self):
+        await CachedUser.all()
+        async with in_transaction():
+            await self.user.delete()
+            self.assertEqual(len(self.cache), 1)
+        self.assertEqual(len(self.cache), 0)
+
+    async def test_not_evicted_on_rollback(self):
+        await CachedUser.all()
+        with self.assertRaises(ValueError):
+            async with in_transaction():
+                await self.user.delete()
+                raise ValueError
+        self.assertEqual(len(self.cache), 1)
+
+    async def test_cascaded_delete_clears_related(self):
+        note = await CachedUserNote.create(user=self.user)
+        note_cache = CachedUserNote._meta.object_cache
+        await CachedUserNote.all()
+        self.assertEqual(len(note_cache), 1)
+        await self.user.delete()
+        self.assertEqual(len(note_cache), 0)
+        self.assertIsNone(await CachedUserNote.get_or_none(pk=note.pk))
+
+    async def test_keyed_by_connection(self):
+        await CachedUser.all()
+        self.assertIsNotNone(self.cache.get("models", "id", self.user.pk))
+        self.assertIsNone(self.cache.get("other", "id", self.user.pk))
+        self.assertIsNone(self.cache.get("other", "username", "alice"))
+        self.cache.add("other", self.user, {"id": self.user.pk, "username": "alice", "name": ""})
+        self.assertEqual(len(self.cache), 2)
+        self.cache.evict(self.user.pk)
+        self.assertEqual(len(self.cache), 0)
+
+    async def test_unique_value_replaced(self):
+        await CachedUser.all()
+        self.user.username = "carol"
+        self.cache.add("models", self.user, {"id": self.user.pk, "username": "carol", "name": ""})
+        self.assertIsNone(self.cache.get("models", "username", "alice"))
+        self.assertEqual(self.cache.get("models", "username", "carol")["username"], "carol")
+
+    async def test_size_bound(self):
+        await CachedUser.create(username="bob")
+        await CachedUser.create(username="carol")
+        await CachedUser.all()
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.cache_info().evictions, 1)
+        self.assertIsNone(self.cache.get("models", "username", "alice"))
+
+    async def test_ttl(self):
+        self.cache.ttl = 0
+        try:
+            await CachedUser.all()
+            self.assertIsNone(self.cache.get("models", "id", self.user.pk))
+        finally:
+            self.cache.ttl = None
+
+    async def test_bypassed_in_transaction(self):
+        async with in_transaction():
+            await CachedUser.all()
+            self.assertEqual(len(self.cache), 0)
+            await CachedUser.get(pk=self.user.pk)
+        self.assertEqual(self.cache.hits, 0)
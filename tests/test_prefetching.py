@@ -1,6 +1,12 @@
+from unittest.mock import patch
+
+from pypika.dialects import PostgreSQLQuery
+
 from tests.testmodels import Address, Event, Team, Tournament
+from tortoise.backends.base_postgres.executor import BasePostgresExecutor
 from tortoise.contrib import test
 from tortoise.exceptions import FieldError, OperationalError
+from tortoise.fields.base import Field
 from tortoise.functions import Count
 from tortoise.query_utils import Prefetch
 
@@ -150,3 +156,136 @@ class TestPrefetching(test.TestCase):
             Prefetch("tournament", queryset=Tournament.all(), to_attr="to_attr_tournament")
         )
         self.assertEqual(event.to_attr_tournament.id, tournament.id)
+
+
+class TestPrefetchChunks(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.executor_class = Tournament._meta.db.executor_class
+        self.tournaments = [await Tournament.create(name=str(i)) for i in range(5)]
+        self.team = await Team.create(name="team")
+        for tournament in self.tournaments:
+            for name in "ab":
+                event = await Event.create(name=f"{tournament.name}{name}", tournament=tournament)
+                await event.participants.add(self.team)
+        await Address.create(city="city", street="street", event=event)
+
+    def test_key_chunks(self):
+        executor = self.executor_class(model=Tournament, db=Tournament._meta.db)
+        with patch.object(self.executor_class, "PREFETCH_CHUNK_SIZE", 2):
+            self.assertEqual(executor._prefetch_key_chunks([1, 2, 1, 3, 2]), [[1, 2], [3]])
+        with patch.object(self.executor_class, "PREFETCH_CHUNK_SIZE", None):
+            self.assertEqual(executor._prefetch_key_chunks([1, 2, 1, 3, 2]), [[1, 2, 3]])
+            self.assertEqual(executor._prefetch_key_chunks([]), [])
+        self.assertEqual(executor._prefetch_key_chunks([]), [])
+
+    def test_postgres_keys(self):
+        executor = BasePostgresExecutor(model=Tournament, db=Tournament._meta.db)
+        table = Tournament._meta.basetable
+        self.assertEqual(
+            PostgreSQLQuery.from_(table)
+            .select("id")
+            .where(executor._prefetch_criterion(table["id"], Tournament._meta.pk, [1, 2]))
+            .get_sql(),
+            'SELECT "id" FROM "tournament" WHERE "id"=ANY(ARRAY[1,2]::SMALLINT[])',
+        )
+        # Without a SQL type to cast the array to, the keys are matched with an IN list
+        self.assertEqual(
+            PostgreSQLQuery.from_(table)
+            .select("id")
+            .where(executor._prefetch_criterion(table["id"], Field(), [1, 2]))
+            .get_sql(),
+            'SELECT "id" FROM "tournament" WHERE "id" IN (1,2)',
+        )
+
+    async def test_chunked(self):
+        with patch.object(self.executor_class, "PREFETCH_CHUNK_SIZE", 2):
+            tournaments = await Tournament.all().order_by("name").prefetch_related("events")
+            events = (
+                await Event.all()
+                .order_by("name")
+                .prefetch_related("tournament", "participants", "address")
+            )
+            team = await Team.get(pk=self.team.pk).prefetch_related("events")
+        self.assertEqual(
+            [[e.name for e in t.events] for t in tournaments],
+            [["0a", "0b"], ["1a", "1b"], ["2a", "2b"], ["3a", "3b"], ["4a", "4b"]],
+        )
+        self.assertEqual([e.tournament.name for e in events], [e.name[0] for e in events])
+        self.assertEqual([len(e.participants) for e in events], [1] * 10)
+        self.assertIs(events[0].participants[0], events[1].participants[0])
+        self.assertEqual([e.address is not None for e in events], [False] * 9 + [True])
+        self.assertEqual(len(team.events), 10)
+
+
+class TestPrefetchLimitPerParent(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.teams = [await Team.create(name=str(i)) for i in range(3)]
+        for i in range(3):
+            tournament = await Tournament.create(name=str(i))
+            for name in "abc":
+                event = await Event.create(name=f"{i}{name}", tournament=tournament)
+                await event.participants.add(*self.teams[: i + 1])
+
+    async def test_reverse_fk_limit(self):
+        tournaments = (
+            await Tournament.all()
+            .order_by("name")
+            .prefetch_related(Prefetch("events", queryset=Event.all().order_by("-name").limit(2)))
+        )
+        self.assertEqual(
+            [[e.name for e in t.events] for t in tournaments],
+            [["0c", "0b"], ["1c", "1b"], ["2c", "2b"]],
+        )
+
+    async def test_reverse_fk_offset(self):
+        tournaments = (
+            await Tournament.all()
+            .order_by("name")
+            .prefetch_related(
+                Prefetch(
+                    "events",
+                    queryset=Event.filter(name__not="1b").order_by("name").offset(1).limit(5),
+                )
+            )
+        )
+        self.assertEqual(
+            [[e.name for e in t.events] for t in tournaments], [["0b", "0c"], ["1c"], ["2b", "2c"]]
+        )
+
+    async def test_reverse_fk_limit_related(self):
+        tournaments = (
+            await Tournament.all()
+            .order_by("name")
+            .prefetch_related(
+                Prefetch("events", queryset=Event.all().select_related("tournament").limit(1))
+            )
+        )
+        self.assertEqual([t.events[0].name for t in tournaments], ["0a", "1a", "2a"])
+        self.assertEqual([t.events[0].tournament.name for t in tournaments], ["0", "1", "2"])
+
+    async def test_m2m_limit(self):
+        events = (
+            await Event.filter(name__endswith="a")
+            .order_by("name")
+            .prefetch_related(
+                Prefetch("participants", queryset=Team.all().order_by("-name").limit(2))
+            )
+        )
+        self.assertEqual(
+            [[t.name for t in e.participants] for e in events], [["0"], ["1", "0"], ["2", "1"]]
+        )
+
+    def test_unordered_row_number(self):
+        # Rows without an ordering are numbered in the order of their primary key
+        queryset = Tournament.all()
+        queryset._make_query()
+        meta = Tournament._meta
+        executor = meta.db.executor_class(model=Tournament, db=meta.db)
+        query = executor._limit_per_parent(
+            queryset.query, meta.basetable["name"], meta.basetable[meta.db_pk_column], 1, None
+        )
+        self.assertIn(
+            'ROW_NUMBER() OVER(PARTITION BY "name" ORDER BY "id")', query.get_sql(quote_char='"')
+        )
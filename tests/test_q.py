@@ -1,8 +1,8 @@
 from unittest import TestCase as _TestCase
 
-from tests.testmodels import CharFields, IntFields
+from tests.testmodels import CharFields, Event, IntFields, Tournament
 from tortoise.contrib.test import TestCase
-from tortoise.exceptions import OperationalError
+from tortoise.exceptions import FieldError, OperationalError
 from tortoise.expressions import Q
 
 
@@ -222,3 +222,47 @@ class TestQCall(TestCase):
         q = Q() | Q(id__gt=5)
         r = q.resolve(CharFields, CharFields._meta.basequery)
         self.assertEqual(r.where_criterion.get_sql(), '"id">5')
+
+
+class TestFilterKeyCache(TestCase):
+    def test_cache_hit(self):
+        cache = IntFields._meta.filter_cache
+        cache.clear()
+        Q(intnum__gt=8).resolve(IntFields, IntFields._meta.basetable)
+        self.assertEqual(cache.cache_info(), (0, 1, cache.maxsize, 1))
+        r = Q(intnum__gt=9).resolve(IntFields, IntFields._meta.basetable)
+        self.assertEqual(r.where_criterion.get_sql(), '"intnum">9')
+        self.assertEqual(cache.cache_info(), (1, 1, cache.maxsize, 1))
+        self.assertEqual(cache.hit_rate, 0.5)
+
+    def test_cache_nested(self):
+        Event._meta.filter_cache.clear()
+        Tournament._meta.filter_cache.clear()
+        for _ in range(2):
+            r = Q(tournament__name__in=["a"]).resolve(Event, Event._meta.basetable)
+            self.assertEqual(r.where_criterion.get_sql(), "event__tournament.name IN ('a')")
+        self.assertEqual(Event._meta.filter_cache.hits, 1)
+        self.assertEqual(Tournament._meta.filter_cache.hits, 1)
+
+    def test_cache_nested_joins(self):
+        resolved = Event._meta.filter_cache.get("tournament__name")
+        joins = resolved.get_joins(Event._meta.basetable)
+        self.assertIs(resolved.get_joins(Event._meta.basetable), joins)
+        self.assertEqual(joins[-1][0].get_table_name(), "event__tournament")
+        sql = Event.filter(tournament__name="a").sql()
+        self.assertEqual(sql.count("LEFT OUTER JOIN"), 1)
+        self.assertIs(resolved.get_joins(Event._meta.basetable), joins)
+
+    def test_cache_maxsize(self):
+        cache = CharFields._meta.filter_cache
+        cache.clear()
+        cache.maxsize = 1
+        try:
+            Q(char="a", char__not="b").resolve(CharFields, CharFields._meta.basetable)
+            self.assertEqual(cache.cache_info().currsize, 1)
+        finally:
+            cache.maxsize = 1024
+
+    def test_unknown_key(self):
+        with self.assertRaises(FieldError):
+            Q(moo="cow").resolve(IntFields, IntFields._meta.basetable)
@@ -673,3 +673,22 @@ class TestQueryset(test.TestCase):
         t1 = await Tournament.create(name="1")
         ret = await Tournament.filter(pk=t1.pk).annotate(id=RawSQL("id + 1")).values("id")
         self.assertEqual(ret, [{"id": t1.pk + 1}])
+
+    async def test_clone_does_not_leak_state(self):
+        base = Event.filter(name="1")
+        event_qs = base.filter(name="2").select_related("tournament").annotate(idp=RawSQL("id + 1"))
+        event_qs.prefetch_related("participants")
+        self.assertEqual(len(base._q_objects), 1)
+        self.assertEqual(len(event_qs._q_objects), 2)
+        self.assertEqual(base._select_related, set())
+        self.assertEqual(base._annotations, {})
+        self.assertEqual(base._custom_filters, {})
+        self.assertEqual(base._prefetch_map, {})
+        self.assertIn("idp", event_qs._annotations)
+
+    async def test_clone_shares_unchanged_state(self):
+        base = Event.filter(name="1").annotate(idp=RawSQL("id + 1"))
+        clone = base.limit(5)
+        self.assertIs(clone._q_objects, base._q_objects)
+        self.assertIs(clone._annotations, base._annotations)
+        self.assertIs(clone._custom_filters, base._custom_filters)
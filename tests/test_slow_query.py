@@ -0,0 +1,72 @@
+import logging
+
+from tests.testmodels import Tournament
+from tortoise import connections
+from tortoise.contrib import test
+from tortoise.instrumentation import add_hook, remove_hook
+from tortoise.slow_query import SlowQueryMonitor
+from tortoise.transactions import in_transaction
+
+
+class TestSlowQueryMonitor(test.TruncationTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.monitor = SlowQueryMonitor(threshold=0, maxlen=3)
+        add_hook(self.monitor)
+
+    async def asyncTearDown(self):
+        remove_hook(self.monitor)
+        await self.monitor.wait()
+        await super().asyncTearDown()
+
+    async def test_record(self):
+        await Tournament.filter(name="1")
+        await self.monitor.wait()
+        (record,) = self.monitor.records
+        self.assertTrue(record.sql.startswith("SELECT"))
+        self.assertTrue(record.call_site.startswith(__file__), record.call_site)
+        self.assertIn("test_record", record.call_site)
+        self.assertIsNotNone(record.plan)
+        self.assertIsNone(record.plan_error)
+        self.assertGreaterEqual(record.duration, 0)
+
+    async def test_parameters(self):
+        await Tournament.filter(name="1").update(name="2")
+        await self.monitor.wait()
+        (record,) = self.monitor.records
+        self.assertTrue(record.sql.startswith("UPDATE"))
+        self.assertEqual(record.values, ["2"])
+        self.assertIsNotNone(record.plan)
+
+    async def test_threshold_and_maxlen(self):
+        self.monitor.threshold = 60
+        await Tournament.all()
+        self.assertEqual(len(self.monitor.records), 0)
+        self.monitor.threshold = 0
+        for name in "abcd":
+            await Tournament.create(name=name)
+        self.assertEqual(len(self.monitor.records), 3)
+        self.assertIn("b", self.monitor.records[0].values)
+        self.assertIn("d", self.monitor.records[2].values)
+        self.assertTrue(all(r.plan is None for r in self.monitor.records))
+
+    async def test_explained_outside_transaction(self):
+        async with in_transaction():
+            await Tournament.filter(name="1")
+        await self.monitor.wait()
+        # The EXPLAIN itself is not recorded
+        (record,) = self.monitor.records
+        self.assertIsNotNone(record.plan)
+
+    async def test_raw_not_explained(self):
+        await connections.get("models").execute_query("SELECT 1")
+        await self.monitor.wait()
+        (record,) = self.monitor.records
+        self.assertIsNone(record.plan)
+
+    async def test_logger(self):
+        self.monitor.logger = logging.getLogger("tortoise.slow")
+        with self.assertLogs("tortoise.slow", "WARNING") as logs:
+            await Tournament.filter(name="1")
+            await self.monitor.wait()
+        self.assertIn("Slow query", logs.output[0])
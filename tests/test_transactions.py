@@ -1,6 +1,19 @@
+import asyncio
+from unittest.mock import patch
+
 from tests.testmodels import CharPkModel, Event, Team, Tournament
+from tortoise import connections
+from tortoise.backends.sqlite.client import SqliteClient
+from tortoise.backends.sqlite.client import TransactionWrapper as SqliteTransactionWrapper
 from tortoise.contrib import test
-from tortoise.exceptions import OperationalError, TransactionManagementError
+from tortoise.exceptions import (
+    OperationalError,
+    ParamsError,
+    TransactionConflictError,
+    TransactionManagementError,
+)
+from tortoise.metrics import get_stats
+from tortoise.router import ConnectionRouter
 from tortoise.transactions import atomic, in_transaction
 
 
@@ -213,3 +226,156 @@ class TestTransactions(test.TruncationTestCase):
         self.assertEqual(
             await Tournament.all().values("id", "name"), [{"id": obj.id, "name": "Test1"}]
         )
+
+
+@test.requireCapability(supports_transactions=True)
+class TestAtomicRetries(test.TruncationTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.calls = 0
+        self.retries = get_stats("models").retries
+
+    async def create_conflicting(self, conflicts: int) -> Tournament:
+        self.calls += 1
+        tournament = await Tournament.create(name=f"Test{self.calls}")
+        if self.calls <= conflicts:
+            raise TransactionConflictError("could not serialize access")
+        return tournament
+
+    async def test_retry(self):
+        tournament = await atomic(retries=3, backoff=0)(self.create_conflicting)(2)
+        self.assertEqual(self.calls, 3)
+        self.assertEqual(await Tournament.all().values_list("name", flat=True), [tournament.name])
+        self.assertEqual(get_stats("models").retries - self.retries, 2)
+
+    async def test_retries_exhausted(self):
+        with self.assertRaises(TransactionConflictError):
+            await atomic(retries=1, backoff=0)(self.create_conflicting)(5)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(await Tournament.all().count(), 0)
+
+    async def test_no_retry(self):
+        with self.assertRaises(TransactionConflictError):
+            await atomic()(self.create_conflicting)(1)
+        self.assertEqual(self.calls, 1)
+
+    async def test_no_retry_in_transaction(self):
+        with self.assertRaises(TransactionConflictError):
+            async with in_transaction():
+                await atomic(retries=3, backoff=0)(self.create_conflicting)(1)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(get_stats("models").retries, self.retries)
+
+
+@test.requireCapability(dialect="postgres")
+class TestSerializableConflicts(test.TruncationTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.reads = 0
+        self.both_read = asyncio.Event()
+
+    async def count_and_create(self, name: str) -> None:
+        # Both transactions read before either writes, so they can't be serialized
+        async with in_transaction(isolation="SERIALIZABLE"):
+            count = await Tournament.all().count()
+            self.reads += 1
+            if self.reads == 2:
+                self.both_read.set()
+            await self.both_read.wait()
+            await Tournament.create(name=f"{name}{count}")
+
+    async def test_conflict(self):
+        results = await asyncio.gather(
+            self.count_and_create("a"), self.count_and_create("b"), return_exceptions=True
+        )
+        conflicts = [result for result in results if result is not None]
+        self.assertEqual(len(conflicts), 1)
+        self.assertIsInstance(conflicts[0], TransactionConflictError)
+        self.assertEqual(await Tournament.all().count(), 1)
+
+    async def test_retry(self):
+        retries = get_stats("models").retries
+        count_and_create = atomic(retries=3, backoff=0)(self.count_and_create)
+        await asyncio.gather(count_and_create("a"), count_and_create("b"))
+        names = await Tournament.all().values_list("name", flat=True)
+        self.assertEqual(sorted(name[1:] for name in names), ["0", "1"])
+        self.assertEqual(get_stats("models").retries - retries, 1)
+
+
+class ReplicaRouter:
+    def db_for_transaction(self, connection_name, read_only):
+        if read_only:
+            return "replica"
+
+
+class TestTransactionOptions(test.TruncationTestCase):
+    def test_isolation(self):
+        context = in_transaction(isolation="repeatable_read")
+        self.assertEqual(context.options, {"isolation": "REPEATABLE READ"})
+        with self.assertRaises(ParamsError):
+            in_transaction(isolation="snapshot")
+
+    @test.requireCapability(dialect="sqlite")
+    async def test_read_only(self):
+        await Tournament.create(name="Test")
+        with self.assertRaises(OperationalError):
+            async with in_transaction(read_only=True, isolation="serializable"):
+                self.assertEqual(await Tournament.all().count(), 1)
+                await Tournament.create(name="Test2")
+        await Tournament.create(name="Test3")
+        self.assertEqual(await Tournament.all().count(), 2)
+
+    @test.requireCapability(dialect="sqlite")
+    async def test_read_only_atomic(self):
+        @atomic(read_only=True)
+        async def create():
+            await Tournament.create(name="Test")
+
+        with self.assertRaises(OperationalError):
+            await create()
+        self.assertEqual(await Tournament.all().count(), 0)
+
+    @test.requireCapability(supports_transactions=True)
+    async def test_nested(self):
+        async with in_transaction():
+            # The nested transaction runs within the enclosing one
+            async with in_transaction(read_only=True):
+                await Tournament.create(name="Test")
+        self.assertEqual(await Tournament.all().count(), 1)
+
+    @test.requireCapability(dialect="sqlite")
+    async def test_start_failed(self):
+        client = connections.get("models")
+
+        async def start(self, **options):
+            await self._connection.execute("BEGIN")
+            raise OperationalError("Failed to set the transaction mode")
+
+        with patch.object(SqliteTransactionWrapper, "start", start):
+            with self.assertRaises(OperationalError):
+                async with in_transaction(read_only=True):
+                    pass  # pragma: nocoverage
+        # What was started is rolled back, and the connection released
+        self.assertIs(connections.get("models"), client)
+        self.assertFalse(client._connection.in_transaction)
+        self.assertFalse(client._lock.locked())
+        self.assertEqual(get_stats("models").in_use, 0)
+        async with in_transaction():
+            await Tournament.create(name="Test")
+        self.assertEqual(await Tournament.all().count(), 1)
+
+    async def test_router(self):
+        routers = ConnectionRouter()
+        routers.init_routers([ReplicaRouter])
+        # Routed to a connection that isn't configured
+        self.assertIsNone(routers.db_for_transaction("models", read_only=True))
+        replica = SqliteClient(file_path=":memory:", connection_name="replica")
+        token = connections.set("replica", replica)
+        try:
+            self.assertIsNone(routers.db_for_transaction("models", read_only=False))
+            self.assertIs(routers.db_for_transaction("models", read_only=True), replica)
+            with patch("tortoise.transactions.router", routers):
+                self.assertIs(in_transaction(read_only=True).connection._parent, replica)
+                self.assertIsNot(in_transaction().connection._parent, replica)
+        finally:
+            connections.reset(token)
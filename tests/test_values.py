@@ -1,9 +1,24 @@
-from tests.testmodels import Event, Team, Tournament
+from array import array
+
+from tests.testmodels import (
+    Currency,
+    EnumFields,
+    Event,
+    IntFields,
+    Service,
+    Team,
+    Tournament,
+)
 from tortoise.contrib import test
 from tortoise.contrib.test.condition import NotEQ
-from tortoise.exceptions import FieldError
+from tortoise.exceptions import DoesNotExist, FieldError
 from tortoise.functions import Length, Trim
 
+try:
+    import numpy
+except ImportError:  # pragma: nocoverage
+    numpy = None
+
 
 class TestValues(test.TestCase):
     async def test_values_related_fk(self):
@@ -178,3 +193,114 @@ class TestValues(test.TestCase):
             [{"name": "  x", "name_trim": "x"}, {"name": " y ", "name_trim": "y"}],
             sorted_key="name",
         )
+
+    async def test_values_columns(self):
+        tournament = await Tournament.create(name="New Tournament")
+        await Event.create(name="Test", tournament_id=tournament.id)
+        await Event.create(name="Test2", tournament_id=tournament.id)
+
+        columns = (
+            await Event.all()
+            .order_by("name")
+            .values_columns("name", "tournament_id", "tournament__name")
+        )
+        self.assertEqual(columns["name"], ["Test", "Test2"])
+        self.assertIsInstance(columns["tournament_id"], array)
+        self.assertEqual(columns["tournament_id"].tolist(), [tournament.id, tournament.id])
+        self.assertEqual(columns["tournament__name"], ["New Tournament", "New Tournament"])
+
+    async def test_values_columns_null(self):
+        await IntFields.create(intnum=1, intnum_null=None)
+        await IntFields.create(intnum=2, intnum_null=2)
+
+        columns = await IntFields.all().order_by("intnum").values_columns("intnum", "intnum_null")
+        self.assertEqual(columns["intnum"], array("q", [1, 2]))
+        self.assertEqual(columns["intnum_null"], [None, 2])
+
+    async def test_values_columns_enum(self):
+        await EnumFields.create(service=Service.python_programming, currency=Currency.EUR)
+        await EnumFields.create(service=Service.database_design, currency=Currency.USD)
+
+        queryset = EnumFields.all().order_by("id")
+        columns = await queryset.values_columns("service", "currency")
+        # Enum members, as values_list() returns them
+        self.assertEqual(columns["service"], await queryset.values_list("service", flat=True))
+        self.assertEqual(columns["service"], [Service.python_programming, Service.database_design])
+        self.assertEqual(columns["currency"], [Currency.EUR, Currency.USD])
+
+    async def test_values_columns_default(self):
+        await Tournament.create(name="New Tournament")
+
+        columns = await Tournament.all().values_columns()
+        self.assertEqual(set(columns), {"id", "name", "desc", "created"})
+
+    @test.skipIf(numpy is None, "NumPy is not installed")
+    async def test_values_columns_numpy(self):
+        await IntFields.create(intnum=1)
+        await IntFields.create(intnum=2)
+
+        columns = await IntFields.all().order_by("intnum").values_columns("intnum", numpy=True)
+        self.assertIsInstance(columns["intnum"], numpy.ndarray)
+        self.assertEqual(columns["intnum"].tolist(), [1, 2])
+
+    async def test_records(self):
+        tournament = await Tournament.create(name="New Tournament")
+        await Event.create(name="Test", tournament_id=tournament.id)
+
+        records = await Event.filter(name="Test").records("name", "tournament__name")
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].name, "Test")
+        self.assertEqual(records[0].tournament__name, "New Tournament")
+        self.assertEqual(
+            records[0]._asdict(), {"name": "Test", "tournament__name": "New Tournament"}
+        )
+        with self.assertRaises(AttributeError):
+            records[0].name = "Other"
+
+    async def test_records_default(self):
+        tournament = await Tournament.create(name="New Tournament")
+
+        record = await Tournament.get(name="New Tournament").records()
+        self.assertEqual(record._fields, ("id", "name", "desc", "created"))
+        self.assertEqual(record.id, tournament.id)
+        self.assertEqual(record.created, tournament.created)
+
+    async def test_records_class_reused(self):
+        await Tournament.create(name="New Tournament")
+
+        first = await Tournament.all().records("id", "name")
+        second = await Tournament.filter(name="New Tournament").records("id", "name")
+        third = await Tournament.all().records("name")
+        self.assertIs(type(first[0]), type(second[0]))
+        self.assertIsNot(type(first[0]), type(third[0]))
+
+    async def test_records_single(self):
+        self.assertIsNone(await Tournament.filter(name="x").first().records("name"))
+        with self.assertRaises(DoesNotExist):
+            await Tournament.get(name="x").records("name")
+
+    async def test_records_annotations(self):
+        await Tournament.create(name="  x")
+
+        records = await Tournament.annotate(name_trim=Trim("name")).records("name", "name_trim")
+        self.assertEqual(records[0].name_trim, "x")
+
+    async def test_records_bad_field(self):
+        with self.assertRaises(FieldError):
+            Tournament.all().records("_name")
+
+    async def test_records_pydantic(self):
+        from pydantic import BaseModel, ConfigDict
+
+        class TournamentOut(BaseModel):
+            model_config = ConfigDict(from_attributes=True)
+
+            id: int
+            name: str
+
+        tournament = await Tournament.create(name="New Tournament")
+        records = await Tournament.all().records("id", "name")
+        self.assertEqual(
+            TournamentOut.model_validate(records[0]),
+            TournamentOut(id=tournament.id, name="New Tournament"),
+        )
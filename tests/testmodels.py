@@ -294,6 +294,25 @@ class JSONFields(Model):
     data_validate = fields.JSONField(null=True, validators=[lambda v: JSONFields.dict_or_list(v)])
 
 
+class CachedUser(Model):
+    id = fields.IntField(pk=True)
+    username = fields.CharField(max_length=64, unique=True)
+    name = fields.CharField(max_length=255, default="")
+
+    class Meta:
+        object_cache_size = 2
+
+
+class CachedUserNote(Model):
+    id = fields.IntField(pk=True)
+    user: fields.ForeignKeyRelation[CachedUser] = fields.ForeignKeyField(
+        "models.CachedUser", related_name="notes"
+    )
+
+    class Meta:
+        object_cache_size = 2
+
+
 class UUIDFields(Model):
     id = fields.UUIDField(pk=True, default=uuid.uuid1)
     data = fields.UUIDField()
@@ -1,4 +1,9 @@
+import importlib
+import inspect
 import json
+import os
+import sys
+import tempfile
 import uuid
 from typing import Union
 
@@ -23,6 +28,7 @@ from tortoise.fields.relational import (
     ManyToManyFieldInstance,
     OneToOneFieldInstance,
 )
+from tortoise.models import Model, _get_class_source, _get_comments
 
 
 class TestDescribeModels(test.TestCase):
@@ -40,6 +46,51 @@ class TestDescribeModels(test.TestCase):
         self.assertIn("models.Event", val.keys())
 
 
+class TestClassSource(test.SimpleTestCase):
+    def test_class_source(self):
+        for model in (Event, Reporter, SourceFields, StraightFields, UUIDPkModel):
+            self.assertEqual(_get_class_source(model), inspect.getsource(model))
+
+    def test_local_class_comments(self):
+        class Local(Model):
+            #: The name
+            name = fields.CharField(max_length=10)
+
+            class Meta:
+                abstract = True
+
+        self.assertEqual(_get_class_source(Local), inspect.getsource(Local))
+        self.assertEqual(_get_comments(Local), {"name": "The name"})
+
+    def test_module_reloaded(self):
+        source = (
+            "from tortoise import fields\n"
+            "from tortoise.models import Model\n\n\n"
+            "class Reloaded(Model):\n"
+            "    #: {}\n"
+            "    name = fields.CharField(max_length=10)\n\n"
+            "    class Meta:\n"
+            "        abstract = True\n"
+        )
+        with tempfile.TemporaryDirectory() as path:
+            filename = os.path.join(path, "reloaded_models.py")
+            with open(filename, "w") as f:
+                f.write(source.format("Before"))
+            sys.path.insert(0, path)
+            try:
+                module = importlib.import_module("reloaded_models")
+                self.assertEqual(_get_comments(module.Reloaded), {"name": "Before"})
+                with open(filename, "w") as f:
+                    f.write("\n" + source.format("After"))
+                stat = os.stat(filename)
+                os.utime(filename, (stat.st_atime, stat.st_mtime + 10))
+                module = importlib.reload(module)
+                self.assertEqual(_get_comments(module.Reloaded), {"name": "After"})
+            finally:
+                sys.path.remove(path)
+                sys.modules.pop("reloaded_models", None)
+
+
 class TestDescribeModel(test.SimpleTestCase):
     maxDiff = None
 
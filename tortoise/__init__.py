@@ -13,6 +13,7 @@ from pypika import Table
 
 from tortoise.backends.base.client import BaseDBAsyncClient
 from tortoise.backends.base.config_generator import expand_db_url, generate_config, generate_app_config
+from tortoise.cache import identity_map, query_cache
 from tortoise.connection import connections
 from tortoise.exceptions import ConfigurationError
 from tortoise.fields.relational import (
@@ -23,7 +24,10 @@ from tortoise.fields.relational import (
     OneToOneFieldInstance,
 )
 from tortoise.filters import get_m2m_filters
+from tortoise.lanes import lane
+from tortoise.loader import batch_loader
 from tortoise.log import logger
+from tortoise.metrics import reset_stats
 from tortoise.models import Model, ModelMeta
 from tortoise.utils import generate_schema_for_client
 
@@ -626,6 +630,7 @@ class Tortoise:
            :meth:`connections.close_all<tortoise.connection.ConnectionHandler.close_all>` instead.
         """
         await connections.close_all()
+        reset_stats()
         logger.info("Tortoise-ORM shutdown")
 
     @classmethod
@@ -634,6 +639,8 @@ class Tortoise:
             for model in app.values():
                 if isinstance(model, ModelMeta):
                     model._meta.default_connection = None
+                    if model._meta.object_cache is not None:
+                        model._meta.object_cache.clear()
         cls.apps.clear()
 
     @classmethod
@@ -678,6 +685,7 @@ class Tortoise:
             await conn.db_delete()
             connections.discard(conn.connection_name)
 
+        await query_cache.clear()
         await cls._reset_apps()
 
     @classmethod
@@ -930,4 +938,7 @@ __all__ = [
     "BaseDBAsyncClient",
     "__version__",
     "connections",
+    "identity_map",
+    "batch_loader",
+    "lane",
 ]
@@ -0,0 +1,164 @@
+"""
+Adaptive sizing of connection pools, see :class:`PoolAutoscaler`.
+"""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Callable, List, Optional, Union
+
+from tortoise.log import logger
+from tortoise.metrics import get_stats
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.backends.base.client import BaseDBAsyncClient
+
+Budget = Union[int, Callable[[], Optional[int]], None]
+
+
+class PoolAutoscaler:
+    """
+    Limits the connections a pool opens to a size following the observed demand.
+
+    The pool is created with ``max_size`` connections at most, and the autoscaler lets ``size``
+    of them be used at once, starting at the size the pool is configured with. Every
+    ``interval`` seconds it grows the size by ``step`` if acquiring a connection took longer
+    than ``target_wait`` on average since the last check, or shrinks it by ``step`` down to the
+    connections used meanwhile if it didn't for ``cooldown`` seconds, closing idle connections
+    above it. The size stays between ``min_size`` and ``max_size``, and under ``budget``, the
+    number of connections the process may open, as an int or a function returning it, to share
+    a cluster-wide budget between processes.
+
+    :param client: The client of the pool.
+    :param min_size: The minimum size of the pool.
+    :param size: The initial size of the pool.
+    """
+
+    __slots__ = (
+        "client",
+        "min_size",
+        "max_size",
+        "size",
+        "target_wait",
+        "cooldown",
+        "interval",
+        "step",
+        "budget",
+        "in_use",
+        "peak",
+        "_waiting",
+        "_seen",
+        "_busy",
+        "_task",
+    )
+
+    def __init__(
+        self,
+        client: "BaseDBAsyncClient",
+        min_size: int,
+        size: int,
+        max_size: Optional[int] = None,
+        target_wait: float = 0.01,
+        cooldown: float = 60.0,
+        interval: float = 5.0,
+        step: int = 1,
+        budget: Budget = None,
+    ) -> None:
+        self.client = client
+        self.min_size = int(min_size)
+        self.max_size = max(int(max_size), self.min_size) if max_size is not None else int(size)
+        self.size = min(max(int(size), self.min_size), self.max_size)
+        self.target_wait = float(target_wait)
+        self.cooldown = float(cooldown)
+        self.interval = float(interval)
+        self.step = int(step)
+        self.budget = budget
+        #: Connections acquired
+        self.in_use = 0
+        #: Most connections acquired at once since the last check
+        self.peak = 0
+        self._waiting: List[asyncio.Future] = []
+        self._seen = (0, 0.0)
+        self._busy = time.monotonic()
+        self._task: Optional[asyncio.Future] = None
+
+    async def acquire(self) -> None:
+        """
+        Waits for fewer than ``size`` connections to be acquired.
+        """
+        if not self._waiting and self.in_use < self.size:
+            self._took()
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiting.append(future)
+        try:
+            await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # Granted while being cancelled
+                self.release()
+            else:
+                self._waiting.remove(future)
+            raise
+
+    def _took(self) -> None:
+        self.in_use += 1
+        self.peak = max(self.peak, self.in_use)
+
+    def release(self) -> None:
+        self.in_use -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiting and self.in_use < self.size:
+            self._took()
+            self._waiting.pop(0).set_result(None)
+
+    def _budget(self) -> Optional[int]:
+        budget = self.budget() if callable(self.budget) else self.budget
+        return int(budget) if budget is not None else None
+
+    def tick(self, now: Optional[float] = None) -> int:
+        """
+        Adjusts the size to the demand observed since the last call, and returns it.
+        """
+        now = time.monotonic() if now is None else now
+        acquire_wait = get_stats(self.client.connection_name).acquire_wait
+        count = acquire_wait.count - self._seen[0]
+        total = acquire_wait.sum - self._seen[1]
+        self._seen = (acquire_wait.count, acquire_wait.sum)
+        peak, self.peak = self.peak, self.in_use
+        if count > 0 and total / count > self.target_wait:
+            self._busy = now
+            size = self.size + self.step
+        elif now - self._busy >= self.cooldown:
+            size = max(self.size - self.step, peak)
+        else:
+            size = self.size
+        budget = self._budget()
+        if budget is not None:
+            size = min(size, budget)
+        self.size = min(max(size, self.min_size), self.max_size)
+        self._wake()
+        return self.size
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            size = self.size
+            if self.tick() < size:
+                try:
+                    await self.client._shrink_pool(self.size)
+                except Exception:
+                    logger.exception("Failed to shrink pool of %s", self.client.connection_name)
+
+    def start(self) -> None:
+        """
+        Starts adjusting the size periodically, if not started yet.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
@@ -1,5 +1,5 @@
 import asyncio
-from typing import Any, Callable, List, Optional, Tuple, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 import asyncpg
 from asyncpg.transaction import Transaction
@@ -13,6 +13,7 @@ from tortoise.backends.base.client import (
     PoolConnectionWrapper,
     TransactionContext,
     TransactionContextPooled,
+    retry_reads,
 )
 from tortoise.backends.base_postgres.client import (
     BasePostgresClient,
@@ -22,6 +23,8 @@ from tortoise.exceptions import (
     DBConnectionError,
     IntegrityError,
     OperationalError,
+    QueryTimeoutError,
+    TransactionConflictError,
     TransactionManagementError,
 )
 
@@ -49,12 +52,15 @@ class AsyncpgDBClient(BasePostgresClient):
             "user": self.user,
             "database": self.database if with_db else None,
             "min_size": self.pool_minsize,
-            "max_size": self.pool_maxsize,
+            "max_size": self._pool_max_size(self.pool_minsize, self.pool_maxsize),
             "connection_class": self.connection_class,
             "loop": self.loop,
             "server_settings": self.server_settings,
             **self.extra,
         }
+        if self.autoscaler is not None:
+            # Let asyncpg close the connections left idle by shrinking the pool
+            self._template.setdefault("max_inactive_connection_lifetime", self.autoscaler.cooldown)
         try:
             self._pool = await self.create_pool(password=self.password, **self._template)
             self.log.debug("Created connection pool %s with params: %s", self._pool, self._template)
@@ -69,6 +75,42 @@ class AsyncpgDBClient(BasePostgresClient):
     async def create_pool(self, **kwargs) -> asyncpg.Pool:
         return await asyncpg.create_pool(None, **kwargs)
 
+    def _pool_size(self) -> Dict[str, int]:
+        if self._pool is None:
+            return {"size": 0, "idle": 0, "max_size": self.pool_maxsize}
+        return {
+            "size": self._pool.get_size(),
+            "idle": self._pool.get_idle_size(),
+            "max_size": self.pool_maxsize,
+        }
+
+    async def _prepare_statements(self, connection: Any, statements: List[str]) -> None:
+        for statement in statements:
+            # Prepared in the statement cache of the connection, reused by queries
+            await connection._prepare(statement, use_cache=True)
+
+    def _raw_connection(self, connection: Any) -> Any:
+        # Pools hand out a new proxy of their connections on every acquisition
+        return getattr(connection, "_con", connection)
+
+    async def _ping(self, connection: Any) -> None:
+        await connection.execute("SELECT 1")
+
+    async def _close_connection(self, connection: Any) -> None:
+        connection.terminate()
+
+    def _is_connection_lost(self, exc: BaseException) -> bool:
+        return isinstance(
+            exc,
+            (
+                asyncpg.PostgresConnectionError,
+                asyncpg.AdminShutdownError,
+                asyncpg.CrashShutdownError,
+                asyncpg.CannotConnectNowError,
+                ConnectionError,
+            ),
+        )
+
     async def _expire_connections(self) -> None:
         if self._pool:  # pragma: nobranch
             await self._pool.expire_connections()
@@ -85,12 +127,18 @@ class AsyncpgDBClient(BasePostgresClient):
     async def _translate_exceptions(self, func, *args, **kwargs) -> Exception:
         try:
             return await func(self, *args, **kwargs)
+        except (asyncpg.SerializationError, asyncpg.DeadlockDetectedError) as exc:
+            raise TransactionConflictError(exc)
         except (asyncpg.SyntaxOrAccessError, asyncpg.exceptions.DataError) as exc:
             raise OperationalError(exc)
         except asyncpg.IntegrityConstraintViolationError as exc:
             raise IntegrityError(exc)
         except asyncpg.InvalidTransactionStateError as exc:  # pragma: nocoverage
             raise TransactionManagementError(exc)
+        except asyncio.TimeoutError as exc:
+            raise QueryTimeoutError(
+                f"Statement cancelled after {self._statement_timeout()}s on {self.connection_name}"
+            ) from exc
 
     async def db_delete(self) -> None:
         try:
@@ -102,15 +150,19 @@ class AsyncpgDBClient(BasePostgresClient):
     def acquire_connection(self) -> Union["PoolConnectionWrapper", "ConnectionWrapper"]:
         return PoolConnectionWrapper(self)
 
-    def _in_transaction(self) -> "TransactionContext":
-        return TransactionContextPooled(TransactionWrapper(self))
+    def _statement_deadline(self, connection: Any) -> None:
+        # asyncpg cancels statements itself, given their timeout
+        return None
+
+    def _in_transaction(self, **options: Any) -> "TransactionContext":
+        return TransactionContextPooled(TransactionWrapper(self), **options)
 
     @translate_exceptions
     async def execute_insert(self, query: str, values: list) -> Optional[asyncpg.Record]:
         async with self.acquire_connection() as connection:
             self.log.debug("%s: %s", query, values)
             # TODO: Cache prepared statement
-            return await connection.fetchrow(query, *values)
+            return await connection.fetchrow(query, *values, timeout=self._statement_timeout())
 
     @translate_exceptions
     async def execute_many(self, query: str, values: list) -> None:
@@ -120,7 +172,7 @@ class AsyncpgDBClient(BasePostgresClient):
             transaction = connection.transaction()
             await transaction.start()
             try:
-                await connection.executemany(query, values)
+                await connection.executemany(query, values, timeout=self._statement_timeout())
             except Exception:
                 await transaction.rollback()
                 raise
@@ -128,6 +180,7 @@ class AsyncpgDBClient(BasePostgresClient):
                 await transaction.commit()
 
     @translate_exceptions
+    @retry_reads
     async def execute_query(
         self, query: str, values: Optional[list] = None
     ) -> Tuple[int, List[dict]]:
@@ -138,23 +191,25 @@ class AsyncpgDBClient(BasePostgresClient):
             else:
                 params = [query]
             if query.startswith("UPDATE") or query.startswith("DELETE"):
-                res = await connection.execute(*params)
+                res = await connection.execute(*params, timeout=self._statement_timeout())
                 try:
                     rows_affected = int(res.split(" ")[1])
                 except Exception:  # pragma: nocoverage
                     rows_affected = 0
                 return rows_affected, []
 
-            rows = await connection.fetch(*params)
+            rows = await connection.fetch(*params, timeout=self._statement_timeout())
             return len(rows), rows
 
     @translate_exceptions
+    @retry_reads
     async def execute_query_dict(self, query: str, values: Optional[list] = None) -> List[dict]:
         async with self.acquire_connection() as connection:
             self.log.debug("%s: %s", query, values)
+            timeout = self._statement_timeout()
             if values:
-                return list(map(dict, await connection.fetch(query, *values)))
-            return list(map(dict, await connection.fetch(query)))
+                return list(map(dict, await connection.fetch(query, *values, timeout=timeout)))
+            return list(map(dict, await connection.fetch(query, timeout=timeout)))
 
 
 class TransactionWrapper(AsyncpgDBClient, BaseTransactionWrapper):
@@ -167,8 +222,9 @@ class TransactionWrapper(AsyncpgDBClient, BaseTransactionWrapper):
         self.transaction: Transaction = None
         self._finalized = False
         self._parent: AsyncpgDBClient = connection
+        self.query_timeout = connection.query_timeout
 
-    def _in_transaction(self) -> "TransactionContext":
+    def _in_transaction(self, **options: Any) -> "TransactionContext":
         return NestedTransactionPooledContext(self)
 
     def acquire_connection(self) -> "ConnectionWrapper":
@@ -179,13 +235,20 @@ class TransactionWrapper(AsyncpgDBClient, BaseTransactionWrapper):
         async with self.acquire_connection() as connection:
             self.log.debug("%s: %s", query, values)
             # TODO: Consider using copy_records_to_table instead
-            await connection.executemany(query, values)
+            await connection.executemany(query, values, timeout=self._statement_timeout())
 
     @translate_exceptions
-    async def start(self) -> None:
-        self.transaction = self._connection.transaction()
+    async def start(
+        self, isolation: Optional[str] = None, read_only: bool = False, deferrable: bool = False
+    ) -> None:
+        self.transaction = self._connection.transaction(
+            isolation=isolation.lower().replace(" ", "_") if isolation else None,
+            readonly=read_only,
+            deferrable=deferrable,
+        )
         await self.transaction.start()
 
+    @translate_exceptions
     async def commit(self) -> None:
         if self._finalized:
             raise TransactionManagementError("Transaction already finalised")
@@ -1,13 +1,98 @@
 import asyncio
-from typing import Any, List, Optional, Sequence, Tuple, Type, Union
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from pypika import Query
 
+from tortoise.autoscale import PoolAutoscaler
 from tortoise.backends.base.executor import BaseExecutor
 from tortoise.backends.base.schema_generator import BaseSchemaGenerator
 from tortoise.connection import connections
-from tortoise.exceptions import TransactionManagementError
+from tortoise.exceptions import (
+    ConfigurationError,
+    ParamsError,
+    PoolExhaustedError,
+    QueryTimeoutError,
+    TransactionManagementError,
+)
+from tortoise.health import PING, ConnectionHealth
+from tortoise.lanes import Lane, LaneContext, LaneScheduler, current_lane, lane
 from tortoise.log import db_client_logger
+from tortoise.metrics import ConnectionStats, get_stats
+
+T = TypeVar("T")
+FuncType = Callable[..., Any]
+F = TypeVar("F", bound=FuncType)
+
+#: Parameters of the clients handled by BaseDBAsyncClient, not passed on to the drivers
+BASE_PARAMS = (
+    "connection_name",
+    "fetch_inserted",
+    "query_timeout",
+    "acquire_timeout",
+    "max_waiters",
+    "max_concurrency",
+    "min_concurrency",
+    "latency_target",
+    "lanes",
+    "lane_fairness",
+    "autoscale",
+    "warm_up",
+    "hot_statements",
+    "max_lifetime",
+    "max_idle",
+    "pre_ping",
+    "retry_reads",
+)
+#: Isolation levels of transactions, as in SQL
+ISOLATION_LEVELS = ("READ UNCOMMITTED", "READ COMMITTED", "REPEATABLE READ", "SERIALIZABLE")
+#: Timeout of the statements run in the current context, overriding the one of the client
+query_timeout: ContextVar[Optional[float]] = ContextVar("query_timeout", default=None)
+
+
+def _to_bool(value: Any) -> bool:
+    # Parameters set in a DB URL are strings
+    if isinstance(value, str):
+        return value.strip().lower() not in ("", "0", "false", "off", "no")
+    return bool(value)
+
+
+def retry_reads(func: F) -> F:
+    """
+    Runs a ``SELECT`` statement again, once, on another connection, if the connection it ran on
+    was lost, unless it ran in a transaction or the client disables ``retry_reads``.
+    """
+
+    @wraps(func)
+    async def retry_reads_(self, query: str, *args, **kwargs):
+        try:
+            return await func(self, query, *args, **kwargs)
+        except Exception as exc:
+            if not (
+                self.retry_reads
+                and self._is_connection_lost(exc)
+                and query.lstrip()[:6].upper() == "SELECT"
+                and not isinstance(self, BaseTransactionWrapper)
+            ):
+                raise
+            self.log.warning("Connection lost on %s, retrying: %s", self.connection_name, exc)
+        return await func(self, query, *args, **kwargs)
+
+    return retry_reads_  # type: ignore
 
 
 class Capabilities:
@@ -69,11 +154,100 @@ class Capabilities:
         return str(self.__dict__)
 
 
+class ConcurrencyLimiter:
+    """
+    Adaptive limit of the statements running at once on a client, shedding the ones above it.
+
+    The limit grows by one once ``limit`` statements completed within ``latency_target`` of
+    being admitted (additive increase), and is multiplied by ``backoff`` when one takes longer
+    or times out (multiplicative decrease), at most once per statement admitted since the last
+    decrease. It stays between ``min_limit`` and ``max_limit``, which it starts at.
+    """
+
+    __slots__ = (
+        "limit",
+        "min_limit",
+        "max_limit",
+        "latency_target",
+        "backoff",
+        "in_flight",
+        "_decreased",
+    )
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        latency_target: float = 0.1,
+        backoff: float = 0.5,
+    ) -> None:
+        self.limit = float(max_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.backoff = backoff
+        #: Statements admitted and not completed yet
+        self.in_flight = 0
+        self._decreased = 0.0
+
+    def acquire(self) -> Optional[float]:
+        """
+        Admits a statement, returning the time it was admitted at, or ``None`` if it is shed.
+        """
+        if self.in_flight >= int(self.limit):
+            return None
+        self.in_flight += 1
+        return time.perf_counter()
+
+    def release(self, admitted: float, overloaded: bool = False) -> None:
+        """
+        Adjusts the limit once a statement admitted at the given time completed.
+
+        :param overloaded: The statement failed because of the load, e.g. it timed out.
+        """
+        self.in_flight -= 1
+        now = time.perf_counter()
+        if overloaded or now - admitted > self.latency_target:
+            if admitted >= self._decreased:
+                self.limit = max(self.limit * self.backoff, self.min_limit)
+                self._decreased = now
+        else:
+            self.limit = min(self.limit + 1 / self.limit, self.max_limit)
+
+
 class BaseDBAsyncClient:
     """
     Base class for containing a DB connection.
 
-    Parameters get passed as kwargs, and is mostly driver specific.
+    Parameters get passed as kwargs, and is mostly driver specific. All clients accept:
+
+    :param query_timeout: Seconds after which statements are cancelled.
+    :param acquire_timeout: Seconds after which waiting for a connection fails.
+    :param max_waiters: Number of tasks waiting for a connection above which acquiring
+        one fails immediately.
+    :param max_concurrency: Enables a :class:`ConcurrencyLimiter` shedding statements above
+        an adaptive limit of statements running at once, of at most this number.
+    :param min_concurrency: Minimum limit of the :class:`ConcurrencyLimiter`, defaults to 1.
+    :param latency_target: Seconds from being admitted to completing within which statements
+        let the :class:`ConcurrencyLimiter` increase its limit, defaults to 0.1.
+    :param lanes: Partitions the connections between lanes, see :meth:`lane`, as a dict of
+        lane names to dicts of their ``reserved`` and ``max`` number of connections and their
+        ``priority``.
+    :param lane_fairness: ``fifo`` to give released connections to the tasks waiting for one in
+        order of arrival, or ``priority`` to give them to the lanes of highest priority first.
+    :param autoscale: Adjusts the size of the pool to the demand with a :class:`PoolAutoscaler`,
+        given its parameters as a dict, ``max_size`` being the most connections it grows to.
+    :param warm_up: Opens the pool during :meth:`Tortoise.init<tortoise.Tortoise.init>`,
+        see :meth:`warm_up`.
+    :param hot_statements: SQL statements prepared on the connections opened by the warm-up.
+    :param max_lifetime: Seconds after which pooled connections are closed, see
+        :class:`~tortoise.health.ConnectionHealth`.
+    :param max_idle: Seconds pooled connections may stay idle before being closed.
+    :param pre_ping: Seconds pooled connections may stay idle before being pinged on checkout.
+    :param retry_reads: Runs ``SELECT`` statements again on another connection if theirs was
+        lost, outside of transactions, defaults to ``True``.
+
+    Failing to acquire a connection raises :class:`~tortoise.exceptions.PoolExhaustedError`.
 
     .. attribute:: query_class
         :annotation: Type[pypika.Query]
@@ -100,11 +274,59 @@ class BaseDBAsyncClient:
     executor_class: Type[BaseExecutor] = BaseExecutor
     schema_generator: Type[BaseSchemaGenerator] = BaseSchemaGenerator
     capabilities: Capabilities = Capabilities("")
+    query_timeout: Optional[float] = None
+    acquire_timeout: Optional[float] = None
+    max_waiters: Optional[int] = None
+    limiter: Optional[ConcurrencyLimiter] = None
+    lanes: Optional[LaneScheduler] = None
+    autoscaler: Optional[PoolAutoscaler] = None
+    _warm_up: bool = False
+    health: Optional[ConnectionHealth] = None
+    retry_reads: bool = True
 
-    def __init__(self, connection_name: str, fetch_inserted: bool = True, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        connection_name: str,
+        fetch_inserted: bool = True,
+        query_timeout: Optional[float] = None,
+        acquire_timeout: Optional[float] = None,
+        max_waiters: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        min_concurrency: int = 1,
+        latency_target: float = 0.1,
+        lanes: Optional[Dict[str, Dict[str, Any]]] = None,
+        lane_fairness: str = "fifo",
+        autoscale: Optional[Dict[str, Any]] = None,
+        warm_up: bool = False,
+        hot_statements: Optional[List[str]] = None,
+        max_lifetime: Optional[float] = None,
+        max_idle: Optional[float] = None,
+        pre_ping: Optional[float] = None,
+        retry_reads: bool = True,
+        **kwargs: Any,
+    ) -> None:
         self.log = db_client_logger
         self.connection_name = connection_name
         self.fetch_inserted = fetch_inserted
+        self.query_timeout = float(query_timeout) if query_timeout is not None else None
+        self.acquire_timeout = float(acquire_timeout) if acquire_timeout is not None else None
+        self.max_waiters = int(max_waiters) if max_waiters is not None else None
+        if max_concurrency is not None:
+            self.limiter = ConcurrencyLimiter(
+                int(max_concurrency), int(min_concurrency), float(latency_target)
+            )
+        if lanes:
+            self.lanes = LaneScheduler(lanes, lambda: self._pool_size()["max_size"], lane_fairness)
+        self.autoscale = autoscale
+        self._warm_up = _to_bool(warm_up)
+        self.hot_statements: List[str] = list(hot_statements or ())
+        if max_lifetime is not None or max_idle is not None or pre_ping is not None:
+            self.health = ConnectionHealth(
+                float(max_lifetime) if max_lifetime is not None else None,
+                float(max_idle) if max_idle is not None else None,
+                float(pre_ping) if pre_ping is not None else None,
+            )
+        self.retry_reads = _to_bool(retry_reads)
 
     async def create_connection(self, with_db: bool) -> None:
         """
@@ -148,9 +370,276 @@ class BaseDBAsyncClient:
         """
         raise NotImplementedError()  # pragma: nocoverage
 
-    def _in_transaction(self) -> "TransactionContext":
+    def _in_transaction(self, **options: Any) -> "TransactionContext":
+        raise NotImplementedError()  # pragma: nocoverage
+
+    def _admit(self, stats: ConnectionStats, statement: bool = True) -> Optional[float]:
+        """
+        Sheds the acquisition of a connection if ``max_waiters`` tasks already wait for one, or
+        if the limiter sheds the statement about to run.
+
+        :param stats: The metrics of the connection.
+        :param statement: The connection is acquired to run a statement, not a transaction.
+        :return: The time the limiter admitted the statement at, if it did.
+        :raises PoolExhaustedError: If the acquisition is shed.
+        """
+        if self.max_waiters is not None and stats.waiters >= self.max_waiters:
+            stats.reject()
+            raise PoolExhaustedError(
+                f"{stats.waiters} tasks already wait for a connection on {self.connection_name}"
+            )
+        if not statement or self.limiter is None:
+            return None
+        admitted = self.limiter.acquire()
+        if admitted is None:
+            stats.reject()
+            raise PoolExhaustedError(
+                f"Limit of {int(self.limiter.limit)} running statements reached"
+                f" on {self.connection_name}"
+            )
+        return admitted
+
+    async def _wait_for_connection(self, acquire: Awaitable[T]) -> T:
+        """
+        Waits for a connection, or the lock of one, within the acquire timeout.
+
+        :raises PoolExhaustedError: If the acquire timeout expired.
+        """
+        if self.acquire_timeout is None:
+            return await acquire
+        try:
+            return await asyncio.wait_for(acquire, self.acquire_timeout)
+        except asyncio.TimeoutError:
+            raise PoolExhaustedError(
+                f"No connection acquired within {self.acquire_timeout}s on {self.connection_name}"
+            ) from None
+
+    async def _acquire_slot(self, acquire: Callable[[], Awaitable[T]]) -> Tuple[Optional[Lane], T]:
+        """
+        Waits for the current lane to be granted a connection, if lanes are configured, and for
+        the autoscaler to let one more connection be used, if enabled, then acquires one.
+
+        :return: The lane granted the connection, and the connection.
+        """
+        granted = None
+        if self.lanes is not None:
+            granted = await self.lanes.acquire(current_lane.get())
+        autoscaler = self.autoscaler
+        try:
+            if autoscaler is not None:
+                autoscaler.start()
+                await autoscaler.acquire()
+            try:
+                return granted, await acquire()
+            except BaseException:
+                if autoscaler is not None:
+                    autoscaler.release()
+                raise
+        except BaseException:
+            self._release_lane(granted)
+            raise
+
+    def _release_slot(self, granted: Optional[Lane]) -> None:
+        if self.autoscaler is not None:
+            self.autoscaler.release()
+        self._release_lane(granted)
+
+    def _release_lane(self, granted: Optional[Lane]) -> None:
+        if granted is not None:
+            self.lanes.release(granted)  # type: ignore
+
+    async def _checkout(self, pool: Any) -> Any:
+        """
+        Acquires a connection from a pool, closing the ones past ``max_lifetime`` or
+        ``max_idle`` and the ones not responding to the pre-ping, and acquiring another instead.
+        """
+        while True:
+            connection = await pool.acquire()
+            if self.health is None:
+                return connection
+            reason = self.health.checked_out(self._raw_connection(connection))
+            if reason is None:
+                return connection
+            if reason == PING:
+                try:
+                    await self._ping(connection)
+                    return connection
+                except Exception as exc:
+                    reason = f"{PING} failed: {exc}"
+            self.log.debug("Closing connection of %s on checkout: %s", self.connection_name, reason)
+            await self._discard(pool, connection)
+
+    async def _checkin(
+        self, pool: Any, connection: Any, exc_val: Optional[BaseException] = None
+    ) -> None:
+        """
+        Releases a connection to a pool, closing it first if the statement or transaction that
+        used it failed because it was lost.
+        """
+        if exc_val is not None and (
+            self._is_connection_lost(exc_val)
+            or (exc_val.__context__ is not None and self._is_connection_lost(exc_val.__context__))
+        ):
+            await self._discard(pool, connection)
+            return
+        if self.health is not None:
+            self.health.checked_in(self._raw_connection(connection))
+        await pool.release(connection)
+
+    async def _discard(self, pool: Any, connection: Any) -> None:
+        # Closed connections are dropped by the pool when released, and replaced as needed
+        if self.health is not None:
+            self.health.forget(self._raw_connection(connection))
+        try:
+            await self._close_connection(connection)
+        except Exception:
+            self.log.debug("Failed to close connection of %s", self.connection_name, exc_info=True)
+        await pool.release(connection)
+
+    def _raw_connection(self, connection: Any) -> Any:
+        """
+        Returns the driver connection of a connection acquired from the pool, to track its health.
+        """
+        return connection
+
+    async def _ping(self, connection: Any) -> None:
+        """
+        Checks cheaply that a connection still works, raising if it doesn't.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+    async def _close_connection(self, connection: Any) -> None:
+        """
+        Closes a connection of the pool, possibly lost already.
+        """
+        await connection.close()
+
+    def _is_connection_lost(self, exc: BaseException) -> bool:
+        """
+        Tells if a driver exception means the connection it was raised on is lost.
+        """
+        return False
+
+    def _pool_max_size(self, min_size: int, max_size: int) -> int:
+        """
+        Returns the maximum size to create the pool of the client with, creating the autoscaler
+        of the pool if enabled.
+
+        :param min_size: The configured minimum size of the pool.
+        :param max_size: The configured maximum size of the pool.
+        """
+        if self.autoscale is None:
+            return max_size
+        if self.autoscaler is None:
+            self.autoscaler = PoolAutoscaler(self, min_size, max_size, **self.autoscale)
+        return self.autoscaler.max_size
+
+    async def _shrink_pool(self, size: int) -> None:
+        """
+        Closes idle connections of the pool above the given size, unless the driver closes idle
+        connections itself.
+        """
+
+    async def warm_up(self) -> None:
+        """
+        Opens the connections of the pool the driver opens initially, ahead of the first query,
+        and prepares the ``hot_statements`` on each of them on backends that cache prepared
+        statements per connection.
+
+        The connections are taken from the pool directly, so lanes, the concurrency limit,
+        ``max_waiters`` and the autoscaler don't apply to the warm-up.
+        """
+        await self.acquire_connection().ensure_connection()
+        pool = getattr(self, "_pool", None)
+        if not self.hot_statements or pool is None:
+            return
+        size = self._pool_size()["size"]
+        # Hold every connection at once, for each to be prepared
+        held: List[Any] = []
+        try:
+            for _ in range(size):
+                held.append(await self._checkout(pool))
+            for connection in held:
+                await self._prepare_statements(connection, self.hot_statements)
+        finally:
+            for connection in held:
+                await self._checkin(pool, connection)
+
+    async def _prepare_statements(self, connection: Any, statements: List[str]) -> None:
+        """
+        Prepares SQL statements on a connection, for the driver to reuse them.
+        """
+
+    def _stop_autoscaler(self) -> None:
+        if self.autoscaler is not None:
+            self.autoscaler.stop()
+
+    def lane(self, name: str) -> LaneContext:
+        """
+        Returns a context manager in which connections are acquired in the given lane, sharing
+        the connections of the pool as configured by the ``lanes`` parameter:
+
+        .. code-block:: python3
+
+            async with connections.get("default").lane("batch"):
+                await Event.filter(archived=False).update(archived=True)
+
+        The lane applies to every connection, as with :func:`tortoise.lane`.
+
+        :raises ConfigurationError: If the lane isn't configured on this client.
+        """
+        if self.lanes is None or name not in self.lanes.lanes:
+            raise ConfigurationError(f"Lane {name!r} isn't configured on {self.connection_name}")
+        return lane(name)
+
+    def _statement_timeout(self) -> Optional[float]:
+        """
+        Returns the timeout in seconds of the statements run now, ``None`` if there is none.
+        """
+        timeout = query_timeout.get()
+        return self.query_timeout if timeout is None else timeout
+
+    def _statement_deadline(self, connection: Any) -> "Optional[StatementDeadline]":
+        """
+        Returns the deadline of the statement about to run on a connection, ``None`` if there is
+        no timeout or the driver enforces it.
+        """
+        timeout = self._statement_timeout()
+        if timeout is None:
+            return None
+        return StatementDeadline(self, connection, timeout)
+
+    async def _cancel_statement(self, connection: Any) -> None:
+        """
+        Cancels on the server the statement running on a connection of the client.
+        """
         raise NotImplementedError()  # pragma: nocoverage
 
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns a snapshot of the metrics of the connections of this client, see
+        :meth:`connections.stats()<tortoise.connection.ConnectionHandler.stats>`.
+        """
+        stats = get_stats(self.connection_name).snapshot()
+        stats.update(self._pool_size())
+        if self.limiter is not None:
+            stats["concurrency_limit"] = int(self.limiter.limit)
+            stats["in_flight"] = self.limiter.in_flight
+        if self.lanes is not None:
+            stats["lanes"] = self.lanes.snapshot()
+        if self.autoscaler is not None:
+            stats["target_size"] = self.autoscaler.size
+        return stats
+
+    def _pool_size(self) -> Dict[str, int]:
+        """
+        Returns the ``size``, ``idle`` and ``max_size`` of the pool of the client.
+        """
+        # A single connection, shared through a lock
+        size = 1 if getattr(self, "_connection", None) else 0
+        in_use = get_stats(self.connection_name).in_use
+        return {"size": size, "idle": max(size - in_use, 0), "max_size": 1}
+
     async def execute_insert(self, query: str, values: list) -> Any:
         """
         Executes a RAW SQL insert statement, with provided parameters.
@@ -202,14 +691,67 @@ class BaseDBAsyncClient:
         raise NotImplementedError()  # pragma: nocoverage
 
 
+class StatementDeadline:
+    __slots__ = ("client", "connection", "timeout", "expires", "expired", "handle", "cancelling")
+
+    def __init__(self, client: BaseDBAsyncClient, connection: Any, timeout: float) -> None:
+        """Cancels the statement running on a connection once it ran longer than a timeout."""
+        self.client = client
+        self.connection = connection
+        self.timeout = timeout
+        #: ``time.monotonic()`` at which the statement must be done
+        self.expires = time.monotonic() + timeout
+        self.expired = False
+        self.handle = asyncio.get_running_loop().call_later(timeout, self._expire)
+        self.cancelling: Optional[asyncio.Future] = None
+
+    def _expire(self) -> None:
+        self.expired = True
+        self.cancelling = asyncio.ensure_future(self.client._cancel_statement(self.connection))
+
+    async def finish(self, exc_val: Optional[BaseException]) -> None:
+        """
+        Stops the deadline once the statement completed or failed, raising
+        :class:`QueryTimeoutError` if the deadline expired meanwhile.
+        """
+        self.handle.cancel()
+        if not self.expired:
+            return
+        if self.cancelling is not None:
+            # Don't let the connection run another statement before it was cancelled
+            try:
+                await self.cancelling
+            except Exception:
+                self.client.log.warning(
+                    "Failed to cancel statement after %ss on %s",
+                    self.timeout,
+                    self.client.connection_name,
+                    exc_info=True,
+                )
+        raise QueryTimeoutError(
+            f"Statement cancelled after {self.timeout}s on {self.client.connection_name}"
+        ) from exc_val
+
+
+def _release_admitted(client: BaseDBAsyncClient, admitted: Optional[float], deadline: Any) -> None:
+    # Let the limiter of the client adjust to the latency of the statement it admitted
+    if admitted is not None:
+        timed_out = deadline is not None and deadline.expired
+        client.limiter.release(admitted, timed_out)  # type: ignore
+
+
 class ConnectionWrapper:
-    __slots__ = ("connection", "lock", "client")
+    __slots__ = ("connection", "lock", "client", "acquired", "admitted", "deadline", "lane")
 
     def __init__(self, lock: asyncio.Lock, client: Any) -> None:
         """Wraps the connections with a lock to facilitate safe concurrent access."""
         self.lock: asyncio.Lock = lock
         self.client = client
         self.connection: Any = client._connection
+        self.acquired: Optional[float] = None
+        self.admitted: Optional[float] = None
+        self.deadline: Optional[StatementDeadline] = None
+        self.lane: Optional[Lane] = None
 
     async def ensure_connection(self) -> None:
         if not self.connection:
@@ -217,21 +759,66 @@ class ConnectionWrapper:
             self.connection = self.client._connection
 
     async def __aenter__(self):
-        await self.ensure_connection()
-        await self.lock.acquire()
+        stats = get_stats(self.client.connection_name)
+        if isinstance(self.client, BaseTransactionWrapper):
+            # The connection is already held by the transaction, wait for its other statements
+            started = time.perf_counter()
+            await self.lock.acquire()
+            stats.lock_done(started)
+        else:
+            self.admitted = self.client._admit(stats)
+            started = stats.acquiring()
+            try:
+                await self.ensure_connection()
+                self.lane, _ = await self.client._wait_for_connection(
+                    self.client._acquire_slot(self.lock.acquire)
+                )
+            except BaseException:
+                stats.acquire_failed()
+                _release_admitted(self.client, self.admitted, None)
+                raise
+            self.acquired = stats.acquire_done(started)
+        self.deadline = self.client._statement_deadline(self.connection)
         return self.connection
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        self.lock.release()
+        try:
+            if self.deadline is not None:
+                await self.deadline.finish(exc_val)
+        finally:
+            self.lock.release()
+            if self.acquired is not None:
+                get_stats(self.client.connection_name).released(self.acquired)
+                self.client._release_slot(self.lane)
+                _release_admitted(self.client, self.admitted, self.deadline)
 
 
 class TransactionContext:
-    __slots__ = ("connection", "connection_name", "token", "lock")
+    __slots__ = ("connection", "connection_name", "token", "lock", "acquired", "lane", "options")
 
-    def __init__(self, connection: Any) -> None:
+    def __init__(
+        self,
+        connection: Any,
+        isolation: Optional[str] = None,
+        read_only: bool = False,
+        deferrable: bool = False,
+    ) -> None:
         self.connection = connection
         self.connection_name = connection.connection_name
         self.lock = getattr(connection, "_trxlock", None)
+        self.acquired: Optional[float] = None
+        self.lane: Optional[Lane] = None
+        # Only the options given are passed on to start()
+        self.options: Dict[str, Any] = {}
+        if isolation is not None:
+            isolation = isolation.upper().replace("_", " ")
+            if isolation not in ISOLATION_LEVELS:
+                raise ParamsError(f"Unknown isolation level {isolation!r}: {ISOLATION_LEVELS}")
+            self.options["isolation"] = isolation
+        if read_only:
+            self.options["read_only"] = True
+        if deferrable:
+            self.options["deferrable"] = True
 
     async def ensure_connection(self) -> None:
         if not self.connection._connection:
@@ -239,22 +826,62 @@ class TransactionContext:
             self.connection._connection = self.connection._parent._connection
 
     async def __aenter__(self):
-        await self.ensure_connection()
-        await self.lock.acquire()  # type:ignore
-        self.token = connections.set(self.connection_name, self.connection)
-        await self.connection.start()
+        stats = get_stats(self.connection_name)
+        self.connection._parent._admit(stats, statement=False)
+        started = stats.acquiring()
+        try:
+            await self.ensure_connection()
+            parent = self.connection._parent
+            self.lane, _ = await parent._wait_for_connection(
+                parent._acquire_slot(self.lock.acquire)  # type:ignore
+            )
+        except BaseException:
+            stats.acquire_failed()
+            raise
+        self.acquired = stats.acquire_done(started)
+        await self._start()
         return self.connection
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        if not self.connection._finalized:
-            if exc_type:
-                # Can't rollback a transaction that already failed.
-                if exc_type is not TransactionManagementError:
-                    await self.connection.rollback()
-            else:
-                await self.connection.commit()
+        try:
+            if not self.connection._finalized:
+                if exc_type:
+                    # Can't rollback a transaction that already failed.
+                    if exc_type is not TransactionManagementError:
+                        await self.connection.rollback()
+                else:
+                    await self.connection.commit()
+        finally:
+            # Released even if the commit failed, for the transaction to be retried
+            await self._release(exc_val)
+        if not exc_type:
+            await self.connection._run_commit_callbacks()
+
+    async def _start(self) -> None:
+        """
+        Starts the transaction on the acquired connection, rolling back what was started of it
+        and releasing the connection if it fails.
+        """
+        self.token = connections.set(self.connection_name, self.connection)
+        try:
+            await self.connection.start(**self.options)
+        except BaseException as exc:
+            try:
+                await self.connection.rollback()
+            except Exception:
+                self.connection.log.debug(
+                    "Failed to roll back transaction not started on %s",
+                    self.connection_name,
+                    exc_info=True,
+                )
+            await self._release(exc)
+            raise
+
+    async def _release(self, exc_val: Optional[BaseException]) -> None:
         connections.reset(self.token)
         self.lock.release()  # type:ignore
+        get_stats(self.connection_name).released(self.acquired)  # type:ignore
+        self.connection._parent._release_slot(self.lane)
 
 
 class TransactionContextPooled(TransactionContext):
@@ -265,23 +892,47 @@ class TransactionContextPooled(TransactionContext):
             await self.connection._parent.create_connection(with_db=True)
 
     async def __aenter__(self):
-        await self.ensure_connection()
-        self.token = connections.set(self.connection_name, self.connection)
-        self.connection._connection = await self.connection._parent._pool.acquire()
-        await self.connection.start()
+        parent = self.connection._parent
+        stats = get_stats(self.connection_name)
+        parent._admit(stats, statement=False)
+        started = stats.acquiring()
+        try:
+            await self.ensure_connection()
+            self.lane, connection = await parent._wait_for_connection(
+                parent._acquire_slot(lambda: parent._checkout(parent._pool))
+            )
+        except BaseException:
+            stats.acquire_failed()
+            raise
+        self.acquired = stats.acquire_done(started)
+        self.connection._connection = connection
+        await self._start()
         return self.connection
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        if not self.connection._finalized:
-            if exc_type:
-                # Can't rollback a transaction that already failed.
-                if exc_type is not TransactionManagementError:
-                    await self.connection.rollback()
-            else:
-                await self.connection.commit()
-        if self.connection._parent._pool:
-            await self.connection._parent._pool.release(self.connection._connection)
+        try:
+            if not self.connection._finalized:
+                if exc_type:
+                    # Can't rollback a transaction that already failed.
+                    if exc_type is not TransactionManagementError:
+                        await self.connection.rollback()
+                else:
+                    await self.connection.commit()
+        except BaseException as exc:
+            # Released even if the commit failed, for the transaction to be retried
+            await self._release(exc)
+            raise
+        await self._release(exc_val)
+        if not exc_type:
+            await self.connection._run_commit_callbacks()
+
+    async def _release(self, exc_val: Optional[BaseException]) -> None:
+        parent = self.connection._parent
+        if parent._pool:
+            await parent._checkin(parent._pool, self.connection._connection, exc_val)
         connections.reset(self.token)
+        get_stats(self.connection_name).released(self.acquired)  # type:ignore
+        parent._release_slot(self.lane)
 
 
 class NestedTransactionContext(TransactionContext):
@@ -298,7 +949,9 @@ class NestedTransactionContext(TransactionContext):
 
 class NestedTransactionPooledContext(TransactionContext):
     async def __aenter__(self):
+        started = time.perf_counter()
         await self.lock.acquire()  # type:ignore
+        get_stats(self.connection_name).lock_done(started)
         return self.connection
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
@@ -316,6 +969,10 @@ class PoolConnectionWrapper:
         self.pool = client._pool
         self.client = client
         self.connection = None
+        self.acquired = 0.0
+        self.admitted: Optional[float] = None
+        self.deadline: Optional[StatementDeadline] = None
+        self.lane: Optional[Lane] = None
 
     async def ensure_connection(self) -> None:
         if not self.pool:
@@ -323,18 +980,66 @@ class PoolConnectionWrapper:
             self.pool = self.client._pool
 
     async def __aenter__(self):
-        await self.ensure_connection()
-        # get first available connection
-        self.connection = await self.pool.acquire()
+        stats = get_stats(self.client.connection_name)
+        self.admitted = self.client._admit(stats)
+        started = stats.acquiring()
+        try:
+            await self.ensure_connection()
+            # get first available connection
+            self.lane, self.connection = await self.client._wait_for_connection(
+                self.client._acquire_slot(lambda: self.client._checkout(self.pool))
+            )
+        except BaseException:
+            stats.acquire_failed()
+            _release_admitted(self.client, self.admitted, None)
+            raise
+        self.acquired = stats.acquire_done(started)
+        self.deadline = self.client._statement_deadline(self.connection)
         return self.connection
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        # release the connection back to the pool
-        await self.pool.release(self.connection)
+        try:
+            if self.deadline is not None:
+                await self.deadline.finish(exc_val)
+        finally:
+            # release the connection back to the pool
+            await self.client._checkin(self.pool, self.connection, exc_val)
+            get_stats(self.client.connection_name).released(self.acquired)
+            self.client._release_slot(self.lane)
+            _release_admitted(self.client, self.admitted, self.deadline)
 
 
 class BaseTransactionWrapper:
-    async def start(self) -> None:
+    _finalized: Optional[bool]
+    _commit_callbacks: Optional[List[Callable[[], Awaitable[Any]]]] = None
+
+    def on_commit(self, callback: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Registers a coroutine function to run once the transaction has committed.
+
+        Callbacks are dropped if the transaction block exits with an exception.
+        """
+        if self._commit_callbacks is None:
+            self._commit_callbacks = []
+        self._commit_callbacks.append(callback)
+
+    async def _run_commit_callbacks(self) -> None:
+        callbacks, self._commit_callbacks = self._commit_callbacks, None
+        for callback in callbacks or ():
+            await callback()
+
+    async def start(
+        self, isolation: Optional[str] = None, read_only: bool = False, deferrable: bool = False
+    ) -> None:
+        """
+        Starts the transaction.
+
+        :param isolation: Isolation level of the transaction, one of :data:`ISOLATION_LEVELS`,
+            or the default one of the database.
+        :param read_only: Whether the transaction only reads.
+        :param deferrable: Whether a serializable read-only transaction may wait to run without
+            serialization failures, on PostgreSQL.
+        """
         raise NotImplementedError()  # pragma: nocoverage
 
     def release(self) -> None:
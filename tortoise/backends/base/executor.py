@@ -1,11 +1,13 @@
 import asyncio
 import datetime
 import decimal
+import time
 from copy import copy
 from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
     Callable,
     Dict,
     Iterable,
@@ -20,8 +22,9 @@ from typing import (
 )
 
 from pypika import JoinType, Parameter, Query, Table
+from pypika.analytics import RowNumber
 from pypika.queries import QueryBuilder
-from pypika.terms import ArithmeticExpression, Function
+from pypika.terms import ArithmeticExpression, Criterion, Function, Term
 
 from tortoise.exceptions import OperationalError
 from tortoise.expressions import F, RawSQL
@@ -32,6 +35,7 @@ from tortoise.fields.relational import (
     ManyToManyFieldInstance,
     RelationalField,
 )
+from tortoise.instrumentation import current_event, hooks, instrument_query
 from tortoise.query_utils import QueryModifier
 from tortoise.utils import chunk
 
@@ -51,7 +55,11 @@ class BaseExecutor:
     TO_DB_OVERRIDE: Dict[Type[Field], Callable] = {}
     FILTER_FUNC_OVERRIDE: Dict[Callable, Callable] = {}
     EXPLAIN_PREFIX: str = "EXPLAIN"
+    #: Prefix to explain a query by running it, ``None`` if not supported
+    EXPLAIN_ANALYZE_PREFIX: Optional[str] = None
     DB_NATIVE = {bytes, str, int, float, decimal.Decimal, datetime.datetime, datetime.date}
+    #: Keys per query when prefetching relations, ``None`` fetches all keys with one query
+    PREFETCH_CHUNK_SIZE: Optional[int] = 1000
 
     def __init__(
         self,
@@ -66,7 +74,12 @@ class BaseExecutor:
         self.model = model
         self.db: "BaseDBAsyncClient" = db
         self.prefetch_map = prefetch_map or {}
-        self._prefetch_queries = prefetch_queries or {}
+        # Copied as prefetch resolution appends to it, and it may be shared between querysets
+        self._prefetch_queries = (
+            {field: list(queries) for field, queries in prefetch_queries.items()}
+            if prefetch_queries
+            else {}
+        )
         self.select_related_idx = select_related_idx
         key = (self.db.connection_name, self.model._meta.schema, self.model._meta.db_table)
         if key not in EXECUTOR_CACHE:
@@ -122,13 +135,36 @@ class BaseExecutor:
             ) = EXECUTOR_CACHE[key]
 
     async def execute_explain(self, query: Query) -> Any:
-        sql = " ".join((self.EXPLAIN_PREFIX, query.get_sql()))
-        return (await self.db.execute_query(sql))[1]
+        return await self.explain_sql(query.get_sql())
+
+    async def explain_sql(
+        self, sql: str, values: Optional[list] = None, analyze: bool = False
+    ) -> Any:
+        """
+        Returns the execution plan of a SQL statement.
+
+        :param sql: The SQL statement.
+        :param values: The parameters of the statement.
+        :param analyze: Run the statement to report actual timings, if the database
+            supports it.
+        """
+        prefix = self.EXPLAIN_PREFIX
+        if analyze and self.EXPLAIN_ANALYZE_PREFIX:
+            prefix = self.EXPLAIN_ANALYZE_PREFIX
+        return (await self.db.execute_query(" ".join((prefix, sql)), values))[1]
 
     async def execute_select(
-        self, query: Union[Query, RawSQL], custom_fields: Optional[list] = None
+        self,
+        query: Union[Query, RawSQL],
+        custom_fields: Optional[list] = None,
+        raw_results: Optional[Sequence[Any]] = None,
     ) -> list:
-        _, raw_results = await self.db.execute_query(query.get_sql())
+        if raw_results is None:
+            _, raw_results = await self.db.execute_query(query.get_sql())
+        event = current_event.get() if hooks else None
+        if event is not None:
+            event.rows = len(raw_results)
+            start = time.perf_counter()
         instance_list = []
         for row in raw_results:
             if self.select_related_idx:
@@ -175,7 +211,18 @@ class BaseExecutor:
                 for field in custom_fields:
                     setattr(instance, field, row[field])
             instance_list.append(instance)
-        await self._execute_prefetch_queries(instance_list)
+        if event is None:
+            await self._execute_prefetch_queries(instance_list)
+            return instance_list
+        hydrated = time.perf_counter()
+        event.timings["hydrate"] += hydrated - start
+        # Prefetch queries report events of their own
+        token = current_event.set(None)
+        try:
+            await self._execute_prefetch_queries(instance_list)
+        finally:
+            current_event.reset(token)
+            event.timings["prefetch"] += time.perf_counter() - hydrated
         return instance_list
 
     def _prepare_insert_columns(
@@ -219,6 +266,10 @@ class BaseExecutor:
         raise NotImplementedError()  # pragma: nocoverage
 
     async def execute_insert(self, instance: "Model") -> None:
+        if hooks and current_event.get() is None:
+            return await instrument_query(
+                self.db, self.model, "insert", None, lambda: self.execute_insert(instance)
+            )
         if not instance._custom_generated_pk:
             values = [
                 self.column_map[field_name](getattr(instance, field_name), instance)
@@ -302,6 +353,14 @@ class BaseExecutor:
     async def execute_update(
         self, instance: "Union[Type[Model], Model]", update_fields: Optional[Iterable[str]]
     ) -> int:
+        if hooks and current_event.get() is None:
+            return await instrument_query(
+                self.db,
+                self.model,
+                "update",
+                None,
+                lambda: self.execute_update(instance, update_fields),
+            )
         values = []
         arithmetic_or_function = {}
         for field in update_fields or self.model._meta.fields_db_projection.keys():
@@ -320,12 +379,148 @@ class BaseExecutor:
         )[0]
 
     async def execute_delete(self, instance: "Union[Type[Model], Model]") -> int:
+        if hooks and current_event.get() is None:
+            return await instrument_query(
+                self.db, self.model, "delete", None, lambda: self.execute_delete(instance)
+            )
         return (
             await self.db.execute_query(
                 self.delete_query, [self.model._meta.pk.to_db_value(instance.pk, instance)]
             )
         )[0]
 
+    def _prefetch_key_chunks(self, keys: Iterable[Any]) -> List[List[Any]]:
+        """
+        Deduplicates prefetch keys, keeping their order, and splits them into chunks of
+        ``PREFETCH_CHUNK_SIZE``.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return []
+        return [list(keys_chunk) for keys_chunk in chunk(unique_keys, self.PREFETCH_CHUNK_SIZE)]
+
+    def _prefetch_keys_term(self, field_object: Field, keys: List[Any]) -> Optional[Term]:
+        """
+        Returns a term compared with ``=`` to match any of ``keys``, or ``None`` to match
+        them with an ``IN`` list.
+        """
+        return None
+
+    def _prefetch_filter(
+        self, field_name: str, field_object: Field, keys: List[Any]
+    ) -> Dict[str, Any]:
+        keys_term = self._prefetch_keys_term(field_object, keys)
+        if keys_term is not None:
+            return {field_name: keys_term}
+        return {f"{field_name}__in": keys}
+
+    def _prefetch_criterion(self, term: Term, field_object: Field, keys: List[Any]) -> Criterion:
+        keys_term = self._prefetch_keys_term(field_object, keys)
+        if keys_term is not None:
+            return term == keys_term
+        return term.isin(keys)
+
+    async def _gather_prefetch_chunks(self, queries: Sequence[Awaitable[Sequence[Any]]]) -> list:
+        """
+        Awaits the queries fetching each chunk of keys, concurrently unless they share a
+        single connection, and returns their concatenated results.
+        """
+        # Imported here as the client module imports the executor
+        from tortoise.backends.base.client import BaseTransactionWrapper
+
+        if (
+            len(queries) > 1
+            and self.db.capabilities.daemon
+            and not isinstance(self.db, BaseTransactionWrapper)
+        ):
+            results = await asyncio.gather(*queries)
+        else:
+            results = [await query for query in queries]
+        return [row for result in results for row in result]
+
+    def _limit_per_parent(
+        self,
+        query: QueryBuilder,
+        partition: Term,
+        pk: Term,
+        limit: Optional[int],
+        offset: Optional[int],
+    ) -> QueryBuilder:
+        """
+        Wraps a prefetch query so ``limit`` and ``offset`` apply to the rows of each value of
+        ``partition`` instead of to the whole result, numbering them with ``ROW_NUMBER()``.
+
+        The rows are numbered in the order of the query, or of their primary key ``pk`` if it
+        isn't ordered. Window functions need SQLite 3.25 or MySQL 8.
+        """
+        row_number = RowNumber().over(partition)
+        for term, order in query._orderbys or [(pk, None)]:
+            row_number = row_number.orderby(term, order=order)
+        names = [term.alias or term.name for term in query._selects]
+        inner = query.select(row_number.as_("_row_number")).as_("_prefetch")
+        inner._orderbys = []
+        outer = self.db.query_class.from_(inner).select(*(inner.field(name) for name in names))
+        offset = offset or 0
+        if offset:
+            outer = outer.where(inner.field("_row_number") > offset)
+        if limit is not None:
+            outer = outer.where(inner.field("_row_number") <= offset + limit)
+        return outer.orderby(inner.field("_row_number"))
+
+    async def _execute_per_parent(self, related_query: "QuerySet", partition_field: str) -> list:
+        """
+        Executes a prefetch query with its ``limit()`` and ``offset()`` applied to the related
+        objects of each parent.
+        """
+        limit, offset = related_query._limit, related_query._offset
+        related_query._limit = related_query._offset = None
+        if related_query._db is None:
+            related_query._db = related_query._choose_db()  # type: ignore
+        related_query._make_query()
+        meta = related_query.model._meta
+        query = self._limit_per_parent(
+            related_query.query,
+            meta.basetable[meta.fields_db_projection[partition_field]],
+            meta.basetable[meta.db_pk_column],
+            limit,
+            offset,
+        )
+        return await related_query._db.executor_class(
+            model=related_query.model,
+            db=related_query._db,
+            prefetch_map=related_query._prefetch_map,
+            prefetch_queries=related_query._prefetch_queries,
+            select_related_idx=related_query._select_related_idx,
+        ).execute_select(query, custom_fields=list(related_query._annotations.keys()))
+
+    async def _prefetch_related_objects(
+        self,
+        related_query: "QuerySet",
+        field_name: str,
+        keys: Iterable[Any],
+        per_parent: bool = False,
+    ) -> list:
+        """
+        Returns the objects of ``related_query`` whose ``field_name`` is any of ``keys``.
+
+        With ``per_parent``, a limit or offset of ``related_query`` applies to the objects
+        of each key.
+        """
+        field_object = related_query.model._meta.fields_map[field_name]
+        per_parent = per_parent and (
+            related_query._limit is not None or bool(related_query._offset)
+        )
+        queries: List[Awaitable[list]] = []
+        for keys_chunk in self._prefetch_key_chunks(keys):
+            query = related_query.filter(
+                **self._prefetch_filter(field_name, field_object, keys_chunk)
+            )
+            if per_parent:
+                queries.append(self._execute_per_parent(query, field_name))
+            else:
+                queries.append(query)
+        return await self._gather_prefetch_chunks(queries)
+
     async def _prefetch_reverse_relation(
         self,
         instance_list: "Iterable[Model]",
@@ -333,27 +528,25 @@ class BaseExecutor:
         related_query: Tuple[Optional[str], "QuerySet"],
     ) -> "Iterable[Model]":
         to_attr, related_query = related_query
-        related_objects_for_fetch: Dict[str, list] = {}
         related_field: BackwardFKRelation = self.model._meta.fields_map[field]  # type: ignore
         related_field_name = related_field.to_field_instance.model_field_name
         relation_field = related_field.relation_field
 
-        for instance in instance_list:
-            if relation_field not in related_objects_for_fetch:
-                related_objects_for_fetch[relation_field] = []
-            related_objects_for_fetch[relation_field].append(
+        related_query.resolve_ordering(
+            related_query.model, related_query.model._meta.basetable, [], {}
+        )
+        related_object_list = await self._prefetch_related_objects(
+            related_query,
+            relation_field,
+            (
                 self._field_to_db(
                     instance._meta.fields_map[related_field_name],
                     getattr(instance, related_field_name),
                     instance,
                 )
-            )
-
-        related_query.resolve_ordering(
-            related_query.model, related_query.model._meta.basetable, [], {}
-        )
-        related_object_list = await related_query.filter(
-            **{f"{k}__in": v for k, v in related_objects_for_fetch.items()}
+                for instance in instance_list
+            ),
+            per_parent=True,
         )
 
         related_object_map: Dict[str, list] = {}
@@ -378,24 +571,21 @@ class BaseExecutor:
         related_query: Tuple[Optional[str], "QuerySet"],
     ) -> "Iterable[Model]":
         to_attr, related_query = related_query
-        related_objects_for_fetch: Dict[str, list] = {}
         related_field: BackwardOneToOneRelation = self.model._meta.fields_map[field]  # type: ignore
         related_field_name = related_field.to_field_instance.model_field_name
         relation_field = related_field.relation_field
 
-        for instance in instance_list:
-            if relation_field not in related_objects_for_fetch:
-                related_objects_for_fetch[relation_field] = []
-            related_objects_for_fetch[relation_field].append(
+        related_object_list = await self._prefetch_related_objects(
+            related_query,
+            relation_field,
+            (
                 self._field_to_db(
                     instance._meta.fields_map[related_field_name],
                     getattr(instance, related_field_name),
                     instance,
                 )
-            )
-
-        related_object_list = await related_query.filter(
-            **{f"{k}__in": v for k, v in related_objects_for_fetch.items()}
+                for instance in instance_list
+            ),
         )
 
         related_object_map = {}
@@ -418,82 +608,109 @@ class BaseExecutor:
         self,
         instance_list: "Iterable[Model]",
         field: str,
-        related_query: Tuple[Optional[str], "QuerySet"],
+        prefetch: Tuple[Optional[str], "QuerySet"],
     ) -> "Iterable[Model]":
-        to_attr, related_query = related_query
-        instance_id_set: set = {
-            self._field_to_db(instance._meta.pk, instance.pk, instance)
-            for instance in instance_list
-        }
-
+        # Unpacked to a new name, so it keeps its type inside make_query()
+        to_attr, related_query = prefetch
+        pk_field = self.model._meta.pk
         field_object: ManyToManyFieldInstance = self.model._meta.fields_map[field]  # type: ignore
 
         through_table = Table(field_object.through)
-
-        subquery = (
-            self.db.query_class.from_(through_table)
-            .select(
-                through_table[field_object.backward_key].as_("_backward_relation_key"),
-                through_table[field_object.forward_key].as_("_forward_relation_key"),
-            )
-            .where(through_table[field_object.backward_key].isin(instance_id_set))
-        )
-
-        related_query_table = related_query.model._meta.basetable
-        related_pk_field = related_query.model._meta.db_pk_column
-        related_query.resolve_ordering(related_query.model, related_query_table, [], {})
-        query = (
-            related_query.query.join(subquery)
-            .on(subquery._forward_relation_key == related_query_table[related_pk_field])
-            .select(
-                subquery._backward_relation_key.as_("_backward_relation_key"),
-                *[related_query_table[field].as_(field) for field in related_query.fields],
-            )
+        related_model = related_query.model
+        related_query_table = related_model._meta.basetable
+        related_pk_field = related_model._meta.db_pk_column
+        related_query.resolve_ordering(
+            related_model, related_query_table, related_query._orderings, related_query._annotations
         )
 
+        joins: list = []
+        where_criterion = having_criterion = None
         if related_query._q_objects:
-            joined_tables: List[Table] = []
             modifier = QueryModifier()
             for node in related_query._q_objects:
                 node._annotations = related_query._annotations
                 node._custom_filters = related_query._custom_filters
                 modifier &= node.resolve(
-                    model=related_query.model,
+                    model=related_model,
                     table=related_query_table,
                 )
-
             where_criterion, joins, having_criterion = modifier.get_query_modifiers()
+
+        def make_query(keys: List[Any]) -> str:
+            subquery = (
+                self.db.query_class.from_(through_table)
+                .select(
+                    through_table[field_object.backward_key].as_("_backward_relation_key"),
+                    through_table[field_object.forward_key].as_("_forward_relation_key"),
+                )
+                .where(
+                    self._prefetch_criterion(
+                        through_table[field_object.backward_key], pk_field, keys
+                    )
+                )
+            )
+            query = (
+                related_query.query.join(subquery)
+                .on(subquery._forward_relation_key == related_query_table[related_pk_field])
+                .select(
+                    subquery._backward_relation_key.as_("_backward_relation_key"),
+                    *[related_query_table[field].as_(field) for field in related_query.fields],
+                )
+            )
+            joined_tables: List[Table] = []
             for join in joins:
                 if join[0] not in joined_tables:
                     query = query.join(join[0], how=JoinType.left_outer).on(join[1])
                     joined_tables.append(join[0])
-
             if where_criterion:
                 query = query.where(where_criterion)
-
             if having_criterion:
                 query = query.having(having_criterion)
+            if related_query._limit is not None or related_query._offset:
+                query = self._limit_per_parent(
+                    query,
+                    subquery._backward_relation_key,
+                    related_query_table[related_pk_field],
+                    related_query._limit,
+                    related_query._offset,
+                )
+            return query.get_sql()
 
-        _, raw_results = await self.db.execute_query(query.get_sql())
-        # TODO: we should only resolve the PK's once
-        relations = [
-            (
-                self.model._meta.pk.to_python_value(e["_backward_relation_key"]),
-                field_object.related_model._meta.pk.to_python_value(e[related_pk_field]),
-            )
-            for e in raw_results
-        ]
-        related_object_list = [related_query.model._init_from_db(**e) for e in raw_results]
-        await self.__class__(
-            model=related_query.model, db=self.db, prefetch_map=related_query._prefetch_map
-        )._execute_prefetch_queries(related_object_list)
-        related_object_map = {e.pk: e for e in related_object_list}
-        relation_map: Dict[str, list] = {}
+        async def fetch_rows(keys: List[Any]) -> Sequence[dict]:
+            _, rows = await self.db.execute_query(make_query(keys))
+            return rows
+
+        raw_results = await self._gather_prefetch_chunks(
+            [
+                fetch_rows(keys_chunk)
+                for keys_chunk in self._prefetch_key_chunks(
+                    self._field_to_db(pk_field, instance.pk, instance) for instance in instance_list
+                )
+            ]
+        )
 
-        for object_id, related_object_id in relations:
-            if object_id not in relation_map:
-                relation_map[object_id] = []
-            relation_map[object_id].append(related_object_map[related_object_id])
+        # Each distinct key is converted, and each related object built, only once
+        instance_pks: Dict[Any, Any] = {}
+        related_object_map: Dict[Any, "Model"] = {}
+        relation_map: Dict[Any, list] = {}
+        for row in raw_results:
+            backward_key = row["_backward_relation_key"]
+            if backward_key not in instance_pks:
+                instance_pks[backward_key] = pk_field.to_python_value(backward_key)
+            related_key = row[related_pk_field]
+            related_object = related_object_map.get(related_key)
+            if related_object is None:
+                related_object = related_object_map[related_key] = related_model._init_from_db(
+                    **row
+                )
+            relation_map.setdefault(instance_pks[backward_key], []).append(related_object)
+
+        await self.__class__(
+            model=related_model,
+            db=self.db,
+            prefetch_map=related_query._prefetch_map,
+            prefetch_queries=related_query._prefetch_queries,
+        )._execute_prefetch_queries(list(related_object_map.values()))
 
         for instance in instance_list:
             relation_container = getattr(instance, field)
@@ -509,20 +726,19 @@ class BaseExecutor:
         # TODO: This will only work if instance_list is all of same type
         # TODO: If that's the case, then we can optimize the key resolver
         to_attr, related_query = related_query
-        related_objects_for_fetch: Dict[str, list] = {}
+        related_keys: List[Any] = []
         relation_key_field = f"{field}_id"
+        key = cast(RelationalField, self.model._meta.fields_map[field]).to_field
         for instance in instance_list:
-            if getattr(instance, relation_key_field) is not None:
-                key = cast(RelationalField, instance._meta.fields_map[field]).to_field
-                if key not in related_objects_for_fetch:
-                    related_objects_for_fetch[key] = []
-                related_objects_for_fetch[key].append(getattr(instance, relation_key_field))
+            value = getattr(instance, relation_key_field)
+            if value is not None:
+                related_keys.append(value)
             else:
                 setattr(instance, field, None)
 
-        if related_objects_for_fetch:
-            related_object_list = await related_query.filter(
-                **{f"{k}__in": v for k, v in related_objects_for_fetch.items()}
+        if related_keys:
+            related_object_list = await self._prefetch_related_objects(
+                related_query, key, related_keys
             )
             related_object_map = {getattr(obj, key): obj for obj in related_object_list}
             for instance in instance_list:
@@ -15,6 +15,7 @@ from typing import (
 from pypika import PostgreSQLQuery
 
 from tortoise.backends.base.client import (
+    BASE_PARAMS,
     BaseDBAsyncClient,
     Capabilities,
     ConnectionWrapper,
@@ -23,6 +24,7 @@ from tortoise.backends.base.client import (
 )
 from tortoise.backends.base_postgres.executor import BasePostgresExecutor
 from tortoise.backends.base_postgres.schema_generator import BasePostgresSchemaGenerator
+from tortoise.instrumentation import hooks, instrument_execute
 
 FuncType = Callable[..., Any]
 F = TypeVar("F", bound=FuncType)
@@ -31,6 +33,14 @@ F = TypeVar("F", bound=FuncType)
 def translate_exceptions(func: F) -> F:
     @wraps(func)
     async def _translate_exceptions(self, *args, **kwargs):
+        if hooks and args:
+            return await instrument_execute(
+                self,
+                func.__name__,
+                args[0],
+                args[1] if len(args) > 1 else kwargs.get("values"),
+                lambda: self._translate_exceptions(func, *args, **kwargs),
+            )
         return await self._translate_exceptions(func, *args, **kwargs)
 
     return _translate_exceptions  # type: ignore
@@ -73,8 +83,8 @@ class BasePostgresClient(BaseDBAsyncClient, abc.ABC):
         self.server_settings = (self.extra.pop("server_settings", None) or {}).copy()
         self.schema = self.extra.pop("schema", None)
         self.application_name = self.extra.pop("application_name", None)
-        self.extra.pop("connection_name", None)
-        self.extra.pop("fetch_inserted", None)
+        for param in BASE_PARAMS:
+            self.extra.pop(param, None)
         self.loop = self.extra.pop("loop", None)
         self.connection_class = self.extra.pop("connection_class", self.connection_class)
         self.pool_minsize = int(self.extra.pop("minsize", 1))
@@ -105,6 +115,7 @@ class BasePostgresClient(BaseDBAsyncClient, abc.ABC):
         raise NotImplementedError("translate_exceptions is not implemented")
 
     async def close(self) -> None:
+        self._stop_autoscaler()
         await self._close()
         self._template.clear()
 
@@ -124,7 +135,7 @@ class BasePostgresClient(BaseDBAsyncClient, abc.ABC):
         return PoolConnectionWrapper(self._pool)
 
     @abc.abstractmethod
-    def _in_transaction(self) -> "TransactionContext":
+    def _in_transaction(self, **options: Any) -> "TransactionContext":
         raise NotImplementedError("_in_transaction is not implemented")
 
     @abc.abstractmethod
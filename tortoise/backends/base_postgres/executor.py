@@ -1,9 +1,9 @@
 import uuid
-from typing import Optional, Sequence
+from typing import Any, List, Optional, Sequence
 
 from pypika import Parameter
 from pypika.dialects import PostgreSQLQueryBuilder
-from pypika.terms import Term
+from pypika.terms import Array, Term
 
 from tortoise import Model
 from tortoise.backends.base.executor import BaseExecutor
@@ -13,6 +13,7 @@ from tortoise.contrib.postgres.json_functions import (
     postgres_json_filter,
 )
 from tortoise.contrib.postgres.search import SearchCriterion
+from tortoise.fields.base import Field
 from tortoise.filters import json_contained_by, json_contains, json_filter, search
 
 
@@ -20,8 +21,23 @@ def postgres_search(field: Term, value: Term):
     return SearchCriterion(field, expr=value)
 
 
+class AnyArray(Term):  # type: ignore
+    """
+    ``ANY(ARRAY[...]::type[])``, matching any of the values when compared with ``=``.
+    """
+
+    def __init__(self, values: List[Any], sql_type: str) -> None:
+        super().__init__()
+        self.array = Array(*values)
+        self.sql_type = sql_type
+
+    def get_sql(self, **kwargs: Any) -> str:
+        return f"ANY({self.array.get_sql(**kwargs)}::{self.sql_type}[])"
+
+
 class BasePostgresExecutor(BaseExecutor):
     EXPLAIN_PREFIX = "EXPLAIN (FORMAT JSON, VERBOSE)"
+    EXPLAIN_ANALYZE_PREFIX = "EXPLAIN (ANALYZE, FORMAT JSON, VERBOSE)"
     DB_NATIVE = BaseExecutor.DB_NATIVE | {bool, uuid.UUID}
     FILTER_FUNC_OVERRIDE = {
         search: postgres_search,
@@ -29,10 +45,19 @@ class BasePostgresExecutor(BaseExecutor):
         json_contained_by: postgres_json_contained_by,
         json_filter: postgres_json_filter,
     }
+    # Keys are sent as one array, so the plan does not depend on how many there are
+    PREFETCH_CHUNK_SIZE = None
 
     def parameter(self, pos: int) -> Parameter:
         return Parameter("$%d" % (pos + 1,))
 
+    def _prefetch_keys_term(self, field_object: Field, keys: List[Any]) -> Optional[Term]:
+        sql_type = field_object.get_for_dialect("postgres", "SQL_TYPE")
+        if not sql_type:
+            # The array can't be cast, so the keys are matched with an IN list instead
+            return None
+        return AnyArray(keys, sql_type)
+
     def _prepare_insert_statement(
         self, columns: Sequence[str], has_generated: bool = True, ignore_conflicts: bool = False
     ) -> PostgreSQLQueryBuilder:
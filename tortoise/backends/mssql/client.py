@@ -1,4 +1,4 @@
-from typing import Any, SupportsInt
+from typing import Any, Optional, SupportsInt
 
 from pypika.dialects import MSSQLQuery
 
@@ -37,8 +37,8 @@ class MSSQLClient(ODBCClient):
         super().__init__(**kwargs)
         self.dsn = f"DRIVER={driver};SERVER={host},{port};UID={user};PWD={password};"
 
-    def _in_transaction(self) -> "TransactionContext":
-        return TransactionContextPooled(TransactionWrapper(self))
+    def _in_transaction(self, **options: Any) -> "TransactionContext":
+        return TransactionContextPooled(TransactionWrapper(self), **options)
 
     @translate_exceptions
     async def execute_insert(self, query: str, values: list) -> int:
@@ -51,6 +51,32 @@ class MSSQLClient(ODBCClient):
 
 
 class TransactionWrapper(ODBCTransactionWrapper, MSSQLClient):
-    async def start(self) -> None:
+    _isolation = False
+
+    async def start(
+        self, isolation: Optional[str] = None, read_only: bool = False, deferrable: bool = False
+    ) -> None:
+        # SQL Server has no read-only or deferrable transactions
+        if isolation:
+            # Applies to the session, so restored when the transaction ends
+            await self._connection.execute(f"SET TRANSACTION ISOLATION LEVEL {isolation}")
+            self._isolation = True
         await self._connection.execute("BEGIN TRANSACTION")
         await super().start()
+
+    async def _end(self) -> None:
+        if self._isolation:
+            await self._connection.execute("SET TRANSACTION ISOLATION LEVEL READ COMMITTED")
+            self._isolation = False
+
+    async def commit(self) -> None:
+        try:
+            await super().commit()
+        finally:
+            await self._end()
+
+    async def rollback(self) -> None:
+        try:
+            await super().rollback()
+        finally:
+            await self._end()
@@ -1,7 +1,5 @@
 from typing import Any, Optional, Type, Union
 
-from pypika import Query
-
 from tortoise import Model, fields
 from tortoise.backends.odbc.executor import ODBCExecutor
 from tortoise.exceptions import UnSupportedError
@@ -21,5 +19,7 @@ class MSSQLExecutor(ODBCExecutor):
         fields.BooleanField: to_db_bool,
     }
 
-    async def execute_explain(self, query: Query) -> Any:
+    async def explain_sql(
+        self, sql: str, values: Optional[list] = None, analyze: bool = False
+    ) -> Any:
         raise UnSupportedError("MSSQL does not support explain")
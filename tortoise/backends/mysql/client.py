@@ -1,6 +1,6 @@
 import asyncio
 from functools import wraps
-from typing import Any, Callable, List, Optional, SupportsInt, Tuple, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, SupportsInt, Tuple, TypeVar, Union
 
 try:
     import asyncmy as mysql
@@ -15,6 +15,7 @@ from pypika import MySQLQuery
 
 from tortoise import timezone
 from tortoise.backends.base.client import (
+    BASE_PARAMS,
     BaseDBAsyncClient,
     BaseTransactionWrapper,
     Capabilities,
@@ -23,6 +24,7 @@ from tortoise.backends.base.client import (
     PoolConnectionWrapper,
     TransactionContext,
     TransactionContextPooled,
+    retry_reads,
 )
 from tortoise.backends.mysql.executor import MySQLExecutor
 from tortoise.backends.mysql.schema_generator import MySQLSchemaGenerator
@@ -30,18 +32,32 @@ from tortoise.exceptions import (
     DBConnectionError,
     IntegrityError,
     OperationalError,
+    TransactionConflictError,
     TransactionManagementError,
 )
+from tortoise.instrumentation import hooks, instrument_execute
 
 FuncType = Callable[..., Any]
 F = TypeVar("F", bound=FuncType)
+#: Client errors of lost connections: server gone away, lost during query, lost at handshake
+CONNECTION_LOST_ERRORS = (2006, 2013, 2055)
+#: Server errors of transactions rolled back to be retried: deadlock
+TRANSACTION_CONFLICT_ERRORS = (1213,)
 
 
 def translate_exceptions(func: F) -> F:
     @wraps(func)
-    async def translate_exceptions_(self, *args):
+    async def translate_exceptions_(self, *args, **kwargs):
         try:
-            return await func(self, *args)
+            if hooks and args:
+                return await instrument_execute(
+                    self,
+                    func.__name__,
+                    args[0],
+                    args[1] if len(args) > 1 else None,
+                    lambda: func(self, *args, **kwargs),
+                )
+            return await func(self, *args, **kwargs)
         except (
             errors.OperationalError,
             errors.ProgrammingError,
@@ -49,6 +65,8 @@ def translate_exceptions(func: F) -> F:
             errors.InternalError,
             errors.NotSupportedError,
         ) as exc:
+            if exc.args and exc.args[0] in TRANSACTION_CONFLICT_ERRORS:
+                raise TransactionConflictError(exc)
             raise OperationalError(exc)
         except errors.IntegrityError as exc:
             raise IntegrityError(exc)
@@ -83,8 +101,8 @@ class MySQLClient(BaseDBAsyncClient):
         self.port = int(port)  # make sure port is int type
         self.extra = kwargs.copy()
         self.storage_engine = self.extra.pop("storage_engine", "")
-        self.extra.pop("connection_name", None)
-        self.extra.pop("fetch_inserted", None)
+        for param in BASE_PARAMS:
+            self.extra.pop(param, None)
         self.extra.pop("db", None)
         self.extra.pop("autocommit", None)
         self.extra.setdefault("sql_mode", "STRICT_TRANS_TABLES")
@@ -107,7 +125,7 @@ class MySQLClient(BaseDBAsyncClient):
             "autocommit": True,
             "charset": self.charset,
             "minsize": self.pool_minsize,
-            "maxsize": self.pool_maxsize,
+            "maxsize": self._pool_max_size(self.pool_minsize, self.pool_maxsize),
             **self.extra,
         }
         try:
@@ -129,6 +147,15 @@ class MySQLClient(BaseDBAsyncClient):
         except errors.OperationalError:
             raise DBConnectionError(f"Can't connect to MySQL server: {self._template}")
 
+    def _pool_size(self) -> Dict[str, int]:
+        if self._pool is None:
+            return {"size": 0, "idle": 0, "max_size": self.pool_maxsize}
+        return {
+            "size": self._pool.size,
+            "idle": self._pool.freesize,
+            "max_size": self.pool_maxsize,
+        }
+
     async def _expire_connections(self) -> None:
         if self._pool:  # pragma: nobranch
             for conn in self._pool._free:
@@ -141,7 +168,28 @@ class MySQLClient(BaseDBAsyncClient):
             self.log.debug("Closed connection %s with params: %s", self._connection, self._template)
             self._pool = None
 
+    async def _ping(self, connection: mysql.Connection) -> None:
+        await connection.ping(reconnect=False)
+
+    async def _close_connection(self, connection: mysql.Connection) -> None:
+        connection.close()
+
+    def _is_connection_lost(self, exc: BaseException) -> bool:
+        if isinstance(exc, (errors.InterfaceError, ConnectionError)):
+            return True
+        return (
+            isinstance(exc, errors.OperationalError)
+            and bool(exc.args)
+            and exc.args[0] in CONNECTION_LOST_ERRORS
+        )
+
+    async def _shrink_pool(self, size: int) -> None:
+        if self._pool:  # pragma: nobranch
+            while self._pool.size > size and self._pool._free:
+                await self._pool._free.popleft().ensure_closed()
+
     async def close(self) -> None:
+        self._stop_autoscaler()
         await self._close()
         self._template.clear()
 
@@ -161,8 +209,26 @@ class MySQLClient(BaseDBAsyncClient):
     def acquire_connection(self) -> Union["ConnectionWrapper", "PoolConnectionWrapper"]:
         return PoolConnectionWrapper(self)
 
-    def _in_transaction(self) -> "TransactionContext":
-        return TransactionContextPooled(TransactionWrapper(self))
+    async def _cancel_statement(self, connection: Any) -> None:
+        # The connection is busy with the statement, kill it from a connection of its own
+        client = getattr(self, "_parent", self)
+        params = {"ssl": client.extra["ssl"]} if "ssl" in client.extra else {}
+        killer = await mysql.connect(
+            host=client.host,
+            port=client.port,
+            user=client.user,
+            password=client.password,
+            charset=client.charset,
+            **params,
+        )
+        try:
+            async with killer.cursor() as cursor:
+                await cursor.execute(f"KILL QUERY {connection.thread_id()}")
+        finally:
+            await killer.ensure_closed()
+
+    def _in_transaction(self, **options: Any) -> "TransactionContext":
+        return TransactionContextPooled(TransactionWrapper(self), **options)
 
     @translate_exceptions
     async def execute_insert(self, query: str, values: list) -> int:
@@ -190,6 +256,7 @@ class MySQLClient(BaseDBAsyncClient):
                     await cursor.executemany(query, values)
 
     @translate_exceptions
+    @retry_reads
     async def execute_query(
         self, query: str, values: Optional[list] = None
     ) -> Tuple[int, List[dict]]:
@@ -224,8 +291,9 @@ class TransactionWrapper(MySQLClient, BaseTransactionWrapper):
         self._finalized: Optional[bool] = None
         self.fetch_inserted = connection.fetch_inserted
         self._parent = connection
+        self.query_timeout = connection.query_timeout
 
-    def _in_transaction(self) -> "TransactionContext":
+    def _in_transaction(self, **options: Any) -> "TransactionContext":
         return NestedTransactionPooledContext(self)
 
     def acquire_connection(self) -> ConnectionWrapper:
@@ -239,10 +307,22 @@ class TransactionWrapper(MySQLClient, BaseTransactionWrapper):
                 await cursor.executemany(query, values)
 
     @translate_exceptions
-    async def start(self) -> None:
-        await self._connection.begin()
+    async def start(
+        self, isolation: Optional[str] = None, read_only: bool = False, deferrable: bool = False
+    ) -> None:
+        # MySQL has no deferrable transactions
+        if isolation or read_only:
+            async with self._connection.cursor() as cursor:
+                if isolation:
+                    # Applies to the next transaction only
+                    await cursor.execute(f"SET TRANSACTION ISOLATION LEVEL {isolation}")
+                if read_only:
+                    await cursor.execute("START TRANSACTION READ ONLY")
+        if not read_only:
+            await self._connection.begin()
         self._finalized = False
 
+    @translate_exceptions
     async def commit(self) -> None:
         if self._finalized:
             raise TransactionManagementError("Transaction already finalised")
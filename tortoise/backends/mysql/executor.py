@@ -110,6 +110,7 @@ class MySQLExecutor(BaseExecutor):
         json_filter: mysql_json_filter,
     }
     EXPLAIN_PREFIX = "EXPLAIN FORMAT=JSON"
+    EXPLAIN_ANALYZE_PREFIX = "EXPLAIN ANALYZE"
 
     def parameter(self, pos: int) -> Parameter:
         return Parameter("%s")
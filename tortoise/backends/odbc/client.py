@@ -1,36 +1,50 @@
 import asyncio
 from abc import ABC
 from functools import wraps
-from typing import Any, Callable, List, Optional, Tuple, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 import asyncodbc
 import pyodbc
 
 from tortoise import BaseDBAsyncClient
 from tortoise.backends.base.client import (
+    BASE_PARAMS,
     BaseTransactionWrapper,
     ConnectionWrapper,
     NestedTransactionPooledContext,
     PoolConnectionWrapper,
     TransactionContext,
+    retry_reads,
 )
 from tortoise.backends.odbc.executor import ODBCExecutor
 from tortoise.exceptions import (
     DBConnectionError,
     IntegrityError,
     OperationalError,
+    TransactionConflictError,
     TransactionManagementError,
 )
+from tortoise.instrumentation import hooks, instrument_execute
 
 FuncType = Callable[..., Any]
 F = TypeVar("F", bound=FuncType)
+#: SQLSTATE of transactions rolled back to be retried: serialization failure or deadlock
+TRANSACTION_CONFLICT_STATE = "40001"
 
 
 def translate_exceptions(func: F) -> F:
     @wraps(func)
-    async def translate_exceptions_(self, *args):
+    async def translate_exceptions_(self, *args, **kwargs):
         try:
-            return await func(self, *args)
+            if hooks and args:
+                return await instrument_execute(
+                    self,
+                    func.__name__,
+                    args[0],
+                    args[1] if len(args) > 1 else None,
+                    lambda: func(self, *args, **kwargs),
+                )
+            return await func(self, *args, **kwargs)
         except (
             pyodbc.OperationalError,
             pyodbc.ProgrammingError,
@@ -41,6 +55,8 @@ def translate_exceptions(func: F) -> F:
         ) as exc:
             raise OperationalError(exc)
         except (pyodbc.IntegrityError, pyodbc.Error) as exc:
+            if exc.args and exc.args[0] == TRANSACTION_CONFLICT_STATE:
+                raise TransactionConflictError(exc)
             raise IntegrityError(exc)
 
     return translate_exceptions_  # type: ignore
@@ -48,6 +64,8 @@ def translate_exceptions(func: F) -> F:
 
 class ODBCClient(BaseDBAsyncClient, ABC):
     executor_class = ODBCExecutor
+    #: Cheapest statement checking that a connection works
+    PING_SQL = "SELECT 1"
 
     def __init__(
         self,
@@ -55,8 +73,8 @@ class ODBCClient(BaseDBAsyncClient, ABC):
     ) -> None:
         super().__init__(**kwargs)
         self._kwargs = kwargs.copy()
-        self._kwargs.pop("connection_name", None)
-        self._kwargs.pop("fetch_inserted", None)
+        for param in BASE_PARAMS:
+            self._kwargs.pop(param, None)
         self.database = self._kwargs.pop("database", None)
         self.minsize = self._kwargs.pop("minsize", 1)
         self.maxsize = self._kwargs.pop("maxsize", 10)
@@ -71,7 +89,7 @@ class ODBCClient(BaseDBAsyncClient, ABC):
     async def create_connection(self, with_db: bool) -> None:
         self._template = {
             "minsize": self.minsize,
-            "maxsize": self.maxsize,
+            "maxsize": self._pool_max_size(self.minsize, self.maxsize),
             "echo": self.echo,
             "pool_recycle": self.pool_recycle,
             "dsn": self.dsn,
@@ -88,6 +106,11 @@ class ODBCClient(BaseDBAsyncClient, ABC):
         except pyodbc.InterfaceError:
             raise DBConnectionError(f"Can't establish connection to database {self.database}")
 
+    def _pool_size(self) -> Dict[str, int]:
+        if self._pool is None:
+            return {"size": 0, "idle": 0, "max_size": self.maxsize}
+        return {"size": self._pool.size, "idle": self._pool.freesize, "max_size": self.maxsize}
+
     async def _expire_connections(self) -> None:
         if self._pool:  # pragma: nobranch
             for conn in self._pool._free:
@@ -103,7 +126,21 @@ class ODBCClient(BaseDBAsyncClient, ABC):
         await self.execute_script(f"DROP DATABASE {self.database}")
         await self.close()
 
+    async def _ping(self, connection: asyncodbc.Connection) -> None:
+        async with connection.cursor() as cursor:
+            await cursor.execute(self.PING_SQL)
+
+    def _is_connection_lost(self, exc: BaseException) -> bool:
+        # Connection exceptions are of the SQLSTATE class 08
+        return isinstance(exc, pyodbc.Error) and bool(exc.args) and str(exc.args[0])[:2] == "08"
+
+    async def _shrink_pool(self, size: int) -> None:
+        if self._pool:  # pragma: nobranch
+            while self._pool.size > size and self._pool._free:
+                await self._pool._free.popleft().close()
+
     async def close(self) -> None:
+        self._stop_autoscaler()
         if self._pool:
             self._pool.close()
             await self._pool.wait_closed()
@@ -113,6 +150,10 @@ class ODBCClient(BaseDBAsyncClient, ABC):
     def acquire_connection(self) -> Union["ConnectionWrapper", "PoolConnectionWrapper"]:
         return PoolConnectionWrapper(self)
 
+    def _statement_deadline(self, connection: Any) -> None:
+        # Statements can't be cancelled, they run to completion
+        return None
+
     @translate_exceptions
     async def execute_many(self, query: str, values: list) -> None:
         async with self.acquire_connection() as connection:
@@ -127,6 +168,7 @@ class ODBCClient(BaseDBAsyncClient, ABC):
                     await cursor.commit()
 
     @translate_exceptions
+    @retry_reads
     async def execute_query(
         self, query: str, values: Optional[list] = None
     ) -> Tuple[int, List[dict]]:
@@ -170,8 +212,9 @@ class ODBCTransactionWrapper(BaseTransactionWrapper):
         self._finalized: Optional[bool] = None
         self.fetch_inserted = connection.fetch_inserted
         self._parent = connection
+        self.query_timeout = connection.query_timeout
 
-    def _in_transaction(self) -> "TransactionContext":
+    def _in_transaction(self, **options: Any) -> "TransactionContext":
         return NestedTransactionPooledContext(self)
 
     def acquire_connection(self) -> Union["ConnectionWrapper", "PoolConnectionWrapper"]:
@@ -184,16 +227,21 @@ class ODBCTransactionWrapper(BaseTransactionWrapper):
             cursor = await connection.cursor()
             await cursor.executemany(query, values)
 
-    async def start(self) -> None:
+    async def start(
+        self, isolation: Optional[str] = None, read_only: bool = False, deferrable: bool = False
+    ) -> None:
         self._finalized = False
         self._connection._conn.autocommit = False
 
+    @translate_exceptions
     async def commit(self) -> None:
         if self._finalized:
             raise TransactionManagementError("Transaction already finalised")
-        await self._connection.commit()
+        try:
+            await self._connection.commit()
+        finally:
+            self._connection._conn.autocommit = True
         self._finalized = True
-        self._connection._conn.autocommit = True
 
     async def rollback(self) -> None:
         if self._finalized:
@@ -1,6 +1,6 @@
 import datetime
 import functools
-from typing import Any, SupportsInt, Union
+from typing import Any, Optional, SupportsInt, Union
 
 import pyodbc
 import pytz
@@ -34,6 +34,7 @@ class OracleClient(ODBCClient):
     schema_generator = OracleSchemaGenerator
     executor_class = OracleExecutor
     capabilities = Capabilities(dialect="oracle")
+    PING_SQL = "SELECT 1 FROM DUAL"
 
     def __init__(
         self,
@@ -53,8 +54,8 @@ class OracleClient(ODBCClient):
             dbq += f"/{self.database}"
         self.dsn = f"DRIVER={driver};DBQ={dbq};UID={user};PWD={password};"
 
-    def _in_transaction(self) -> "TransactionContext":
-        return TransactionContextPooled(TransactionWrapper(self))
+    def _in_transaction(self, **options: Any) -> "TransactionContext":
+        return TransactionContextPooled(TransactionWrapper(self), **options)
 
     def acquire_connection(self) -> Union["ConnectionWrapper", "PoolConnectionWrapper"]:
         return OraclePoolConnectionWrapper(self)
@@ -115,6 +116,16 @@ class OraclePoolConnectionWrapper(PoolConnectionWrapper):
 
 
 class TransactionWrapper(ODBCTransactionWrapper, OracleClient):
-    async def start(self) -> None:
-        await self._connection.execute("SET TRANSACTION READ WRITE")
+    async def start(
+        self, isolation: Optional[str] = None, read_only: bool = False, deferrable: bool = False
+    ) -> None:
+        # Oracle sets one characteristic per transaction, and only has two isolation levels
+        if read_only:
+            await self._connection.execute("SET TRANSACTION READ ONLY")
+        elif isolation in ("REPEATABLE READ", "SERIALIZABLE"):
+            await self._connection.execute("SET TRANSACTION ISOLATION LEVEL SERIALIZABLE")
+        elif isolation:
+            await self._connection.execute("SET TRANSACTION ISOLATION LEVEL READ COMMITTED")
+        else:
+            await self._connection.execute("SET TRANSACTION READ WRITE")
         await super().start()
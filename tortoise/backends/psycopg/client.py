@@ -64,7 +64,7 @@ class PsycopgClient(postgres_client.BasePostgresClient):
         self._template = {
             "conninfo": conninfo,
             "min_size": self.pool_minsize,
-            "max_size": self.pool_maxsize,
+            "max_size": self._pool_max_size(self.pool_minsize, self.pool_maxsize),
             "kwargs": {
                 "autocommit": True,
                 "row_factory": psycopg.rows.dict_row,
@@ -72,6 +72,9 @@ class PsycopgClient(postgres_client.BasePostgresClient):
             "connection_class": psycopg.AsyncConnection,
             **extra,
         }
+        if self.autoscaler is not None:
+            # Let the pool close the connections left idle by shrinking it
+            self._template.setdefault("max_idle", self.autoscaler.cooldown)
 
         try:
             self._pool = await self.create_pool(**self._template)
@@ -115,6 +118,7 @@ class PsycopgClient(postgres_client.BasePostgresClient):
                     await connection.commit()
 
     @postgres_client.translate_exceptions
+    @base_client.retry_reads
     async def execute_query(
         self,
         query: str,
@@ -147,6 +151,28 @@ class PsycopgClient(postgres_client.BasePostgresClient):
         rowcount, rows = await self.execute_query(query, values, row_factory=psycopg.rows.dict_row)
         return rows
 
+    def _pool_size(self) -> typing.Dict[str, int]:
+        if self._pool is None:
+            return {"size": 0, "idle": 0, "max_size": self.pool_maxsize}
+        stats = self._pool.get_stats()
+        return {
+            "size": stats.get("pool_size", 0),
+            "idle": stats.get("pool_available", 0),
+            "max_size": self.pool_maxsize,
+        }
+
+    async def _ping(self, connection: psycopg.AsyncConnection) -> None:
+        await connection.execute("SELECT 1")
+
+    def _is_connection_lost(self, exc: BaseException) -> bool:
+        if not isinstance(exc, psycopg.OperationalError) or isinstance(
+            exc, psycopg_pool.PoolTimeout
+        ):
+            return False
+        # Errors of the client have no SQLSTATE, connection exceptions and shutdowns of the
+        # server are of the classes 08 and 57P
+        return exc.sqlstate is None or exc.sqlstate.startswith(("08", "57P"))
+
     async def _expire_connections(self) -> None:
         if self._pool:  # pragma: nobranch
             await self._pool.close()
@@ -162,6 +188,8 @@ class PsycopgClient(postgres_client.BasePostgresClient):
     async def _translate_exceptions(self, func, *args, **kwargs) -> Exception:
         try:
             return await func(self, *args, **kwargs)
+        except (psycopg.errors.SerializationFailure, psycopg.errors.DeadlockDetected) as exc:
+            raise exceptions.TransactionConflictError(exc)
         except (
             psycopg.errors.SyntaxErrorOrAccessRuleViolation,
             psycopg.errors.DataException,
@@ -181,8 +209,14 @@ class PsycopgClient(postgres_client.BasePostgresClient):
     ) -> typing.Union[base_client.ConnectionWrapper, PoolConnectionWrapper]:
         return PoolConnectionWrapper(self)
 
-    def _in_transaction(self) -> base_client.TransactionContext:
-        return base_client.TransactionContextPooled(TransactionWrapper(self))
+    async def _cancel_statement(self, connection: psycopg.AsyncConnection) -> None:
+        if hasattr(connection, "cancel_safe"):  # psycopg >= 3.2
+            await connection.cancel_safe()
+        else:
+            await asyncio.get_running_loop().run_in_executor(None, connection.cancel)
+
+    def _in_transaction(self, **options: typing.Any) -> base_client.TransactionContext:
+        return base_client.TransactionContextPooled(TransactionWrapper(self), **options)
 
 
 class TransactionWrapper(PsycopgClient, base_client.BaseTransactionWrapper):
@@ -196,25 +230,44 @@ class TransactionWrapper(PsycopgClient, base_client.BaseTransactionWrapper):
         self.connection_name = connection.connection_name
         self._finalized = False
         self._parent = connection
+        self.query_timeout = connection.query_timeout
 
-    def _in_transaction(self) -> base_client.TransactionContext:
+    def _in_transaction(self, **options: typing.Any) -> base_client.TransactionContext:
         return base_client.NestedTransactionPooledContext(self)
 
     def acquire_connection(self) -> base_client.ConnectionWrapper:
         return base_client.ConnectionWrapper(self._lock, self)
 
     @postgres_client.translate_exceptions
-    async def start(self) -> None:
+    async def start(
+        self,
+        isolation: typing.Optional[str] = None,
+        read_only: bool = False,
+        deferrable: bool = False,
+    ) -> None:
         # We're not using explicit transactions here because psycopg takes care of that
         # automatically when autocommit is disabled.
         await self._connection.set_autocommit(False)
+        modes = []
+        if isolation:
+            modes.append(f"ISOLATION LEVEL {isolation}")
+        if read_only:
+            modes.append("READ ONLY")
+        if deferrable:
+            modes.append("DEFERRABLE")
+        if modes:
+            # Run first in the transaction psycopg begins, so it applies to it only
+            await self._connection.execute(f"SET TRANSACTION {', '.join(modes)}")
 
+    @postgres_client.translate_exceptions
     async def commit(self) -> None:
         if self._finalized:
             raise exceptions.TransactionManagementError("Transaction already finalised")
 
-        await self._connection.commit()
-        await self._connection.set_autocommit(True)
+        try:
+            await self._connection.commit()
+        finally:
+            await self._connection.set_autocommit(True)
         self._finalized = True
 
     async def rollback(self) -> None:
@@ -1,6 +1,7 @@
 import asyncio
 import os
 import sqlite3
+import time
 from functools import wraps
 from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
 
@@ -8,11 +9,13 @@ import aiosqlite
 from pypika import SQLLiteQuery
 
 from tortoise.backends.base.client import (
+    BASE_PARAMS,
     BaseDBAsyncClient,
     BaseTransactionWrapper,
     Capabilities,
     ConnectionWrapper,
     NestedTransactionContext,
+    StatementDeadline,
     TransactionContext,
 )
 from tortoise.backends.sqlite.executor import SqliteExecutor
@@ -22,15 +25,27 @@ from tortoise.exceptions import (
     OperationalError,
     TransactionManagementError,
 )
+from tortoise.instrumentation import hooks, instrument_execute
 
 FuncType = Callable[..., Any]
 F = TypeVar("F", bound=FuncType)
 
+#: Number of virtual machine instructions between two checks of the statement deadline
+PROGRESS_HANDLER_STEPS = 1000
+
 
 def translate_exceptions(func: F) -> F:
     @wraps(func)
     async def translate_exceptions_(self, query, *args):
         try:
+            if hooks:
+                return await instrument_execute(
+                    self,
+                    func.__name__,
+                    query,
+                    args[0] if args else None,
+                    lambda: func(self, query, *args),
+                )
             return await func(self, query, *args)
         except sqlite3.OperationalError as exc:
             raise OperationalError(exc)
@@ -40,6 +55,22 @@ def translate_exceptions(func: F) -> F:
     return translate_exceptions_  # type: ignore
 
 
+class ProgressHandler:
+    __slots__ = ("deadline",)
+
+    def __init__(self) -> None:
+        """Aborts the statement running on a connection from within once its deadline expired."""
+        self.deadline: Optional[StatementDeadline] = None
+
+    def __call__(self) -> int:
+        # Called by SQLite in the thread running the statement
+        deadline = self.deadline
+        if deadline is None or time.monotonic() < deadline.expires:
+            return 0
+        deadline.expired = True
+        return 1
+
+
 class SqliteClient(BaseDBAsyncClient):
     executor_class = SqliteExecutor
     query_class = SQLLiteQuery
@@ -53,14 +84,15 @@ class SqliteClient(BaseDBAsyncClient):
         self.filename = file_path
 
         self.pragmas = kwargs.copy()
-        self.pragmas.pop("connection_name", None)
-        self.pragmas.pop("fetch_inserted", None)
+        for param in BASE_PARAMS:
+            self.pragmas.pop(param, None)
         self.pragmas.setdefault("journal_mode", "WAL")
         self.pragmas.setdefault("journal_size_limit", 16384)
         self.pragmas.setdefault("foreign_keys", "ON")
 
         self._connection: Optional[aiosqlite.Connection] = None
         self._lock = asyncio.Lock()
+        self._progress_handler = ProgressHandler()
 
     async def create_connection(self, with_db: bool) -> None:
         if not self._connection:  # pragma: no branch
@@ -68,6 +100,9 @@ class SqliteClient(BaseDBAsyncClient):
             self._connection.start()
             await self._connection._connect()
             self._connection._conn.row_factory = sqlite3.Row
+            await self._connection.set_progress_handler(
+                self._progress_handler, PROGRESS_HANDLER_STEPS
+            )
             for pragma, val in self.pragmas.items():
                 cursor = await self._connection.execute(f"PRAGMA {pragma}={val}")
                 await cursor.close()
@@ -107,8 +142,18 @@ class SqliteClient(BaseDBAsyncClient):
     def acquire_connection(self) -> ConnectionWrapper:
         return ConnectionWrapper(self._lock, self)
 
-    def _in_transaction(self) -> "TransactionContext":
-        return TransactionContext(TransactionWrapper(self))
+    def _statement_deadline(self, connection: aiosqlite.Connection) -> Optional[StatementDeadline]:
+        # The progress handler of the connection checks the deadline while the statement runs
+        deadline = super()._statement_deadline(connection)
+        self._progress_handler.deadline = deadline
+        return deadline
+
+    async def _cancel_statement(self, connection: aiosqlite.Connection) -> None:
+        # Interrupts the statement from the event loop, while the worker thread runs it
+        await connection.interrupt()
+
+    def _in_transaction(self, **options: Any) -> "TransactionContext":
+        return TransactionContext(TransactionWrapper(self), **options)
 
     @translate_exceptions
     async def execute_insert(self, query: str, values: list) -> int:
@@ -163,10 +208,13 @@ class TransactionWrapper(SqliteClient, BaseTransactionWrapper):
         self._trxlock = connection._lock
         self.log = connection.log
         self._finalized = False
+        self._read_only = False
         self.fetch_inserted = connection.fetch_inserted
         self._parent = connection
+        self.query_timeout = connection.query_timeout
+        self._progress_handler = connection._progress_handler
 
-    def _in_transaction(self) -> "TransactionContext":
+    def _in_transaction(self, **options: Any) -> "TransactionContext":
         return NestedTransactionContext(self)
 
     @translate_exceptions
@@ -176,21 +224,38 @@ class TransactionWrapper(SqliteClient, BaseTransactionWrapper):
             # Already within transaction, so ideal for performance
             await connection.executemany(query, values)
 
-    async def start(self) -> None:
+    async def start(
+        self, isolation: Optional[str] = None, read_only: bool = False, deferrable: bool = False
+    ) -> None:
+        # SQLite transactions are always serializable, so only read_only has an effect
         try:
             await self._connection.commit()
             await self._connection.execute("BEGIN")
+            if read_only:
+                await self._connection.execute("PRAGMA query_only = ON")
+                self._read_only = True
         except sqlite3.OperationalError as exc:  # pragma: nocoverage
             raise TransactionManagementError(exc)
 
+    async def _end(self) -> None:
+        if self._read_only:
+            await self._connection.execute("PRAGMA query_only = OFF")
+            self._read_only = False
+
     async def rollback(self) -> None:
         if self._finalized:
             raise TransactionManagementError("Transaction already finalised")
-        await self._connection.rollback()
+        try:
+            await self._connection.rollback()
+        finally:
+            await self._end()
         self._finalized = True
 
     async def commit(self) -> None:
         if self._finalized:
             raise TransactionManagementError("Transaction already finalised")
-        await self._connection.commit()
+        try:
+            await self._connection.commit()
+        finally:
+            await self._end()
         self._finalized = True
@@ -0,0 +1,501 @@
+"""
+Opt-in caches of rows returned by the database.
+
+``QuerySet.cache()`` caches query results keyed by connection name and compiled SQL, and
+``Meta.object_cache_size`` caches single rows of a model by primary key and unique fields.
+Both keep the raw rows, so every hit still builds fresh model instances, and both are
+invalidated whenever Tortoise writes to the table.
+
+``identity_map()`` instead shares instances: within its scope every row of a model is
+built into a single instance.
+"""
+
+import time
+from collections import OrderedDict
+from contextvars import ContextVar, Token
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.backends.base.client import BaseDBAsyncClient
+    from tortoise.models import MetaInfo, Model
+
+CacheKey = Tuple[str, str]
+MODEL = TypeVar("MODEL", bound="Model")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class BaseCacheStore:
+    """
+    Base class for query cache stores.
+
+    Implement this to keep cached results in an external store. Subclasses are expected to
+    keep the ``hits``, ``misses``, ``evictions`` and ``invalidations`` counters up to date
+    so they are reported by :meth:`cache_info`.
+    """
+
+    maxsize: Optional[int] = None
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    async def get(self, key: CacheKey) -> Tuple[bool, Any]:
+        """
+        Returns ``(True, value)`` if the key is cached and not expired, else ``(False, None)``.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+    async def set(
+        self, key: CacheKey, value: Any, ttl: Optional[float], tables: Iterable[str]
+    ) -> None:
+        """
+        Caches a value for ``ttl`` seconds (forever if ``None``), tagged with the tables
+        it was read from.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+    async def invalidate(self, *tables: str) -> None:
+        """
+        Drops every entry that was read from any of the given tables.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+    async def clear(self) -> None:
+        """
+        Drops every entry.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+    def __len__(self) -> int:
+        raise NotImplementedError()  # pragma: nocoverage
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.invalidations, self.maxsize, len(self)
+        )
+
+
+class LRUCacheStore(BaseCacheStore):
+    """
+    In-process cache store that evicts the least recently used entry beyond ``maxsize``.
+    """
+
+    maxsize: int
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[CacheKey, Tuple[Any, Optional[float], Tuple[str, ...]]]" = (
+            OrderedDict()
+        )
+        self._keys_by_table: Dict[str, Set[CacheKey]] = {}
+
+    def _remove(self, key: CacheKey) -> None:
+        _, _, tables = self._entries.pop(key)
+        for table in tables:
+            keys = self._keys_by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_table[table]
+
+    async def get(self, key: CacheKey) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires, _ = entry
+            if expires is None or expires > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, value
+            self._remove(key)
+        self.misses += 1
+        return False, None
+
+    async def set(
+        self, key: CacheKey, value: Any, ttl: Optional[float], tables: Iterable[str]
+    ) -> None:
+        if key in self._entries:
+            self._remove(key)
+        tables = tuple(tables)
+        expires = None if ttl is None else time.monotonic() + ttl
+        self._entries[key] = (value, expires, tables)
+        for table in tables:
+            self._keys_by_table.setdefault(table, set()).add(key)
+        while len(self._entries) > self.maxsize:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    async def invalidate(self, *tables: str) -> None:
+        for table in tables:
+            for key in self._keys_by_table.pop(table, ()):
+                if key in self._entries:
+                    self._remove(key)
+                    self.invalidations += 1
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_table.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class QueryCache:
+    """
+    Entry point of the query result cache, available as ``tortoise.cache.query_cache``.
+
+    An :class:`LRUCacheStore` is created on first use unless another store was set
+    with :meth:`set_store`.
+    """
+
+    __slots__ = ("_store",)
+
+    def __init__(self) -> None:
+        self._store: Optional[BaseCacheStore] = None
+
+    @property
+    def store(self) -> BaseCacheStore:
+        if self._store is None:
+            self._store = LRUCacheStore()
+        return self._store
+
+    def set_store(self, store: Optional[BaseCacheStore]) -> None:
+        """
+        Replaces the cache store, ``None`` restores the default on next use.
+        """
+        self._store = store
+
+    async def execute(
+        self, db: "BaseDBAsyncClient", sql: str, tables: Iterable[str], ttl: Optional[float]
+    ) -> list:
+        """
+        Returns the rows of a select query from the cache, or executes and caches it.
+        """
+        key = (db.connection_name, sql)
+        store = self.store
+        found, rows = await store.get(key)
+        if not found:
+            _, rows = await db.execute_query(sql)
+            await store.set(key, rows, ttl, tables)
+        return rows
+
+    async def invalidate(self, *tables: str) -> None:
+        """
+        Drops cached results read from any of the given tables.
+        """
+        if self._store is not None:
+            await self._store.invalidate(*tables)
+
+    async def clear(self) -> None:
+        if self._store is not None:
+            await self._store.clear()
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns hit, miss, eviction and invalidation counters of the store.
+        """
+        return self.store.cache_info()
+
+
+query_cache = QueryCache()
+
+
+async def _after_write(db: "BaseDBAsyncClient", invalidate: Callable[[], Awaitable[Any]]) -> None:
+    from tortoise.backends.base.client import BaseTransactionWrapper
+
+    if isinstance(db, BaseTransactionWrapper) and not db._finalized:
+        # Readers outside the transaction still see the old rows until it commits, and
+        # could cache them again if this ran now
+        db.on_commit(invalidate)
+    else:
+        await invalidate()
+
+
+async def invalidate_tables(db: "BaseDBAsyncClient", *tables: str) -> None:
+    """
+    Drops cached results read from tables that were written through ``db``.
+
+    Inside a transaction this is deferred until it commits.
+    """
+    await _after_write(db, partial(query_cache.invalidate, *tables))
+
+
+async def _invalidate_model(meta: "MetaInfo", pk: Any, delete: bool) -> None:
+    await query_cache.invalidate(*(meta.delete_tables if delete else (meta.db_table,)))
+    if meta.object_cache is not None:
+        if pk is None:
+            meta.object_cache.clear()
+        else:
+            meta.object_cache.evict(pk)
+    if delete:
+        for related in meta.delete_related:
+            if related.object_cache is not None:
+                related.object_cache.clear()
+
+
+async def invalidate_model(
+    db: "BaseDBAsyncClient", meta: "MetaInfo", pk: Any = None, delete: bool = False
+) -> None:
+    """
+    Drops cached results and object cache rows after rows of a model were written
+    through ``db``.
+
+    Inside a transaction this is deferred until it commits.
+
+    :param pk: Primary key of the written row, ``None`` drops every cached row of the model.
+    :param delete: Whether the rows were deleted, which also invalidates the rows the
+        delete cascades to, see ``MetaInfo.delete_tables``.
+    """
+    await _after_write(db, partial(_invalidate_model, meta, pk, delete))
+
+
+class ObjectCache:
+    """
+    Per-model cache of rows by primary key and by ``unique=True`` fields.
+
+    Enabled by setting ``object_cache_size`` (and optionally ``object_cache_ttl`` in seconds)
+    in the model's ``Meta``, and available as ``Model._meta.object_cache``.
+    Rows are added when full instances are loaded outside of a transaction, and are kept
+    per connection so rows read from one database are never served for another.
+    The least recently used row is evicted beyond ``maxsize``, and rows are evicted when the
+    instance is saved or deleted.
+    """
+
+    __slots__ = (
+        "meta",
+        "maxsize",
+        "ttl",
+        "hits",
+        "misses",
+        "evictions",
+        "invalidations",
+        "_rows",
+        "_unique",
+        "_unique_fields",
+        "_connections",
+    )
+
+    def __init__(self, meta: "MetaInfo", maxsize: int, ttl: Optional[float] = None) -> None:
+        self.meta = meta
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._rows: "OrderedDict[Tuple[str, Any], Tuple[Any, Optional[float], Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._unique: Dict[str, Dict[Tuple[str, Any], Any]] = {}
+        self._unique_fields: Optional[Tuple[str, ...]] = None
+        self._connections: Set[str] = set()
+
+    @property
+    def unique_fields(self) -> Tuple[str, ...]:
+        """
+        Names of the non-pk unique fields rows are also looked up by.
+        """
+        if self._unique_fields is None:
+            self._unique_fields = tuple(
+                name
+                for name, field in self.meta.fields_map.items()
+                if field.unique and not field.pk and name in self.meta.fields_db_projection
+            )
+        return self._unique_fields
+
+    def _remove(self, key: Tuple[str, Any]) -> None:
+        _, _, unique_values = self._rows.pop(key)
+        connection_name, pk = key
+        for name, value in unique_values.items():
+            index = self._unique.get(name)
+            if index is not None and index.get((connection_name, value)) == pk:
+                del index[(connection_name, value)]
+
+    def get(self, connection_name: str, field_name: str, value: Any) -> Any:
+        """
+        Returns the row cached for the connection whose ``field_name`` (``pk`` or a unique
+        field) equals ``value``, or ``None``.
+        """
+        if field_name == self.meta.pk_attr:
+            pk = value
+        else:
+            pk = self._unique.get(field_name, {}).get((connection_name, value))
+        key = (connection_name, pk)
+        entry = self._rows.get(key)
+        if entry is not None:
+            row, expires, unique_values = entry
+            if expires is not None and expires <= time.monotonic():
+                self._remove(key)
+            elif field_name == self.meta.pk_attr or unique_values.get(field_name) == value:
+                self._rows.move_to_end(key)
+                self.hits += 1
+                return row
+        self.misses += 1
+        return None
+
+    def add(self, connection_name: str, instance: "Model", row: Any) -> None:
+        """
+        Caches the row an instance was loaded from through the connection.
+        """
+        key = (connection_name, instance.pk)
+        if key in self._rows:
+            self._remove(key)
+        unique_values = {name: getattr(instance, name) for name in self.unique_fields}
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        self._rows[key] = (row, expires, unique_values)
+        self._connections.add(connection_name)
+        for name, value in unique_values.items():
+            if value is not None:
+                self._unique.setdefault(name, {})[(connection_name, value)] = instance.pk
+        while len(self._rows) > self.maxsize:
+            self._remove(next(iter(self._rows)))
+            self.evictions += 1
+
+    def evict(self, pk: Any) -> None:
+        """
+        Drops the rows of the given primary key, for every connection.
+        """
+        for connection_name in self._connections:
+            key = (connection_name, pk)
+            if key in self._rows:
+                self._remove(key)
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """
+        Drops every row, used when rows are written in bulk.
+        """
+        self.invalidations += len(self._rows)
+        self._rows.clear()
+        self._unique.clear()
+        self._unique_fields = None
+        self._connections.clear()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.invalidations, self.maxsize, len(self)
+        )
+
+
+class IdentityMap:
+    """
+    Maps ``(model, pk)`` to the single instance loaded for it, see :func:`identity_map`.
+    """
+
+    __slots__ = ("_instances",)
+
+    def __init__(self) -> None:
+        self._instances: Dict[Tuple[Type["Model"], Any], "Model"] = {}
+
+    def get(self, model: Type[MODEL], pk: Any) -> Optional[MODEL]:
+        return cast(Optional[MODEL], self._instances.get((model, pk)))
+
+    def add(self, instance: "Model") -> None:
+        self._instances.setdefault((instance.__class__, instance.pk), instance)
+
+    def discard(self, instance: "Model") -> None:
+        self._instances.pop((instance.__class__, instance.pk), None)
+
+    def discard_model(self, model: Type["Model"]) -> None:
+        for key in [key for key in self._instances if key[0] is model]:
+            del self._instances[key]
+
+    def clear(self) -> None:
+        self._instances.clear()
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+
+current_identity_map: ContextVar[Optional[IdentityMap]] = ContextVar(
+    "current_identity_map", default=None
+)
+
+
+def discard_deleted(meta: "MetaInfo", instance: "Optional[Model]" = None) -> None:
+    """
+    Drops deleted rows from the current identity map, so later loads create new instances.
+
+    :param instance: The deleted instance, ``None`` drops every instance of the model.
+        Instances of the models the delete cascades to are always dropped.
+    """
+    identity_map = current_identity_map.get()
+    if identity_map is None:
+        return
+    if instance is None:
+        identity_map.discard_model(meta._model)
+    else:
+        identity_map.discard(instance)
+    for related in meta.delete_related:
+        identity_map.discard_model(related._model)
+
+
+class IdentityMapContext:
+    __slots__ = ("identity_map", "token")
+
+    def __init__(self) -> None:
+        self.identity_map = IdentityMap()
+        self.token: Optional[Token] = None
+
+    def __enter__(self) -> IdentityMap:
+        self.token = current_identity_map.set(self.identity_map)
+        return self.identity_map
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        current_identity_map.reset(self.token)  # type: ignore
+
+    async def __aenter__(self) -> IdentityMap:
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.__exit__(exc_type, exc_val, exc_tb)
+
+
+def identity_map() -> IdentityMapContext:
+    """
+    Scope in which each row is loaded into a single model instance.
+
+    While it is active, every query, ``select_related()`` and ``prefetch_related()``
+    returns the instance already loaded for a ``(model, pk)`` instead of building a new
+    one, so changes made to an instance are seen by every later load of it.
+    Instances that were already loaded are not refreshed from the database.
+
+    .. code-block:: python3
+
+        async with identity_map():
+            author = await Author.get(pk=1)
+            book = await Book.get(pk=1).prefetch_related("author")
+            assert book.author is author
+
+    The scope is stored in a context variable, so it covers the current task and any
+    task started from it.
+    """
+    return IdentityMapContext()
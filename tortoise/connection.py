@@ -88,6 +88,8 @@ class ConnectionHandler:
             connection: "BaseDBAsyncClient" = self.get(alias)
             if self._create_db:
                 await connection.db_create()
+            if connection._warm_up:
+                await connection.warm_up()
 
     def _create_connection(self, conn_alias: str) -> "BaseDBAsyncClient":
         db_info = self._get_db_info(conn_alias)
@@ -176,6 +178,29 @@ class ConnectionHandler:
         # appear in the returned list though it exists as part of the `db_config`.
         return [self.get(alias) for alias in self.db_config]
 
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns a snapshot of the pool metrics of each connection created so far, by alias.
+
+        Each snapshot is a dict of:
+
+        * ``size``, ``idle`` and ``max_size``: connections open, idle, and allowed in the pool.
+        * ``in_use``: connections acquired by queries or transactions.
+        * ``waiters``: tasks waiting to acquire a connection.
+        * ``acquired`` and ``errors``: total connections acquired and failed acquisitions.
+        * ``acquire_wait``, ``hold`` and ``lock_wait``: histograms of the seconds waited for a
+          connection, a connection was held for, and statements waited for the connection of
+          their transaction. See :class:`Histogram.snapshot()
+          <tortoise.metrics.Histogram.snapshot>`.
+        """
+        stats = {}
+        for alias, client in self._get_storage().items():
+            # Report the connection a transaction was started from
+            while getattr(client, "_parent", None) is not None:
+                client = client._parent  # type: ignore
+            stats[alias] = client.stats()
+        return stats
+
     async def close_all(self, discard: bool = True) -> None:
         """
         Closes all connections in the storage in the `current context`.
@@ -0,0 +1,243 @@
+"""
+Apache Arrow and Parquet export for QuerySets.
+
+Requires ``pyarrow``, install it with the ``arrow`` extra.
+"""
+
+import enum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generator,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from tortoise import fields
+from tortoise.exceptions import ConfigurationError
+from tortoise.timezone import get_timezone
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: nocoverage
+    HAS_PYARROW = False
+else:
+    HAS_PYARROW = True
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from os import PathLike
+
+    from tortoise.fields import Field
+    from tortoise.models import Model
+    from tortoise.queryset import QuerySet
+
+ColumnSpec = Tuple[Optional["pyarrow.DataType"], Optional[Callable[[Any], Any]]]
+
+
+def _uuid_to_str(value: Any) -> Any:
+    return None if value is None else str(value)
+
+
+def _enum_to_value(value: Any) -> Any:
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+def _json_encoder(field: fields.JSONField) -> Callable[[Any], Any]:
+    def encode(value: Any) -> Any:
+        if value is None:
+            return None
+        encoded: Union[str, bytes] = field.encoder(value)
+        return encoded.decode() if isinstance(encoded, bytes) else encoded
+
+    return encode
+
+
+def _column_spec(field: "Optional[Field]") -> ColumnSpec:
+    """
+    Returns the Arrow type and an optional value converter for a field.
+
+    Types of unknown fields and of annotations are left to Arrow to infer.
+    """
+    if field is None:
+        return None, None
+    if isinstance(field, (fields.data.IntEnumFieldInstance, fields.data.CharEnumFieldInstance)):
+        return (
+            pyarrow.int16() if isinstance(field, fields.SmallIntField) else pyarrow.string(),
+            _enum_to_value,
+        )
+    if isinstance(field, fields.JSONField):
+        return pyarrow.string(), _json_encoder(field)
+    if isinstance(field, fields.UUIDField):
+        return pyarrow.string(), _uuid_to_str
+    if isinstance(field, fields.DecimalField):
+        return pyarrow.decimal128(field.max_digits, field.decimal_places), None
+    if isinstance(field, fields.DatetimeField):
+        return pyarrow.timestamp("us", tz=get_timezone()), None
+    for field_type, arrow_type in (
+        (fields.BigIntField, pyarrow.int64),
+        (fields.SmallIntField, pyarrow.int16),
+        (fields.IntField, pyarrow.int32),
+        (fields.BooleanField, pyarrow.bool_),
+        (fields.FloatField, pyarrow.float64),
+        (fields.CharField, pyarrow.string),
+        (fields.TextField, pyarrow.string),
+        (fields.DateField, pyarrow.date32),
+        (fields.BinaryField, pyarrow.binary),
+    ):
+        if isinstance(field, field_type):
+            return arrow_type(), None
+    if isinstance(field, fields.TimeField):
+        return pyarrow.time64("us"), None
+    if isinstance(field, fields.TimeDeltaField):
+        return pyarrow.duration("us"), None
+    return None, None
+
+
+def _resolve_field(
+    model: "Type[Model]", name: str, annotations: Dict[str, Any]
+) -> "Optional[Field]":
+    if name in annotations:
+        return getattr(annotations[name], "field_object", None)
+    if name in model._meta.fetch_fields:
+        return None
+    if name in model._meta.fields_map:
+        return model._meta.fields_map[name]
+    field_, __, forwarded_fields = name.partition("__")
+    if field_ in model._meta.fetch_fields:
+        new_model = model._meta.fields_map[field_].related_model  # type: ignore
+        return _resolve_field(new_model, forwarded_fields, {})
+    return None
+
+
+class ArrowQuery:
+    """
+    Exports a QuerySet to Apache Arrow.
+
+    Awaiting it returns a ``pyarrow.Table``, iterating it with ``async for`` yields
+    ``pyarrow.RecordBatch`` objects of at most ``batch_size`` rows, one query per batch.
+
+    Batches are fetched with keyset pagination on the primary key, so only one batch is
+    held in memory at a time. If the QuerySet or its model (``Meta.ordering``) is ordered, or the
+    QuerySet is sliced, distinct, grouped or annotated, the result is fetched in one query and
+    then split into batches.
+    """
+
+    __slots__ = ("queryset", "fields", "batch_size", "_specs")
+
+    def __init__(
+        self, queryset: "QuerySet", fields_: Tuple[str, ...], batch_size: Optional[int]
+    ) -> None:
+        if not HAS_PYARROW:  # pragma: nocoverage
+            raise ConfigurationError("Arrow export requires pyarrow to be installed")
+        if batch_size is not None and batch_size < 1:
+            raise ConfigurationError("batch_size must be a positive integer")
+        model = queryset.model
+        self.queryset = queryset
+        self.fields: Tuple[str, ...] = fields_ or tuple(
+            [field for field in model._meta.fields_map if field in model._meta.db_fields]
+            + list(queryset._annotations)
+        )
+        self.batch_size = batch_size
+        self._specs: Dict[str, ColumnSpec] = {
+            name: _column_spec(_resolve_field(model, name, queryset._annotations))
+            for name in self.fields
+        }
+
+    @property
+    def schema(self) -> "pyarrow.Schema":
+        """
+        The Arrow schema derived from the field types.
+
+        Columns whose type cannot be derived (e.g. annotations) are typed ``null`` here,
+        their actual type is inferred from the data.
+        """
+        return pyarrow.schema(
+            [(name, arrow_type or pyarrow.null()) for name, (arrow_type, _) in self._specs.items()]
+        )
+
+    def _keyset_paginate(self) -> bool:
+        queryset = self.queryset
+        return bool(
+            self.batch_size
+            and not queryset._orderings
+            and not queryset.model._meta._default_ordering
+            and queryset._limit is None
+            and queryset._offset is None
+            and not queryset._distinct
+            and not queryset._group_bys
+            and not queryset._annotations
+        )
+
+    def _to_batch(self, columns: Dict[str, Any]) -> "pyarrow.RecordBatch":
+        arrays = []
+        for name in self.fields:
+            arrow_type, converter = self._specs[name]
+            values = columns[name]
+            if converter is not None:
+                values = list(map(converter, values))
+            arrays.append(pyarrow.array(values, type=arrow_type))
+        return pyarrow.RecordBatch.from_arrays(arrays, names=list(self.fields))
+
+    async def __aiter__(self) -> AsyncIterator["pyarrow.RecordBatch"]:
+        if not self._keyset_paginate():
+            batch = self._to_batch(await self.queryset.values_columns(*self.fields))
+            step = self.batch_size or batch.num_rows
+            for offset in range(0, batch.num_rows, step):
+                yield batch.slice(offset, step)
+            return
+
+        pk_attr = self.queryset.model._meta.pk_attr
+        fetch_fields = self.fields if pk_attr in self.fields else self.fields + (pk_attr,)
+        queryset = self.queryset.order_by(pk_attr).limit(self.batch_size)  # type: ignore
+        last_pk = None
+        while True:
+            batch_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+            columns = await batch_queryset.values_columns(*fetch_fields)
+            pks = columns[pk_attr]
+            if not pks:
+                return
+            yield self._to_batch(columns)
+            if len(pks) < self.batch_size:  # type: ignore
+                return
+            last_pk = pks[-1]
+
+    async def _execute(self) -> "pyarrow.Table":
+        batches = [batch async for batch in self]
+        if not batches:
+            return self.schema.empty_table()
+        return pyarrow.Table.from_batches(batches)
+
+    def __await__(self) -> Generator[Any, None, "pyarrow.Table"]:
+        return self._execute().__await__()
+
+    async def to_parquet(self, path: "Union[str, PathLike]", **kwargs: Any) -> int:
+        """
+        Streams the batches into a Parquet file.
+
+        Extra keyword arguments are passed to ``pyarrow.parquet.ParquetWriter``.
+
+        :return: The number of rows written.
+        """
+        writer = None
+        rows = 0
+        try:
+            async for batch in self:
+                if writer is None:
+                    writer = pyarrow.parquet.ParquetWriter(path, batch.schema, **kwargs)
+                writer.write_batch(batch)
+                rows += batch.num_rows
+            if writer is None:
+                pyarrow.parquet.write_table(self.schema.empty_table(), path, **kwargs)
+        finally:
+            if writer is not None:
+                writer.close()
+        return rows
+
+
+__all__ = ("ArrowQuery", "HAS_PYARROW")
@@ -10,6 +10,7 @@ from pydantic import BaseModel  # pylint: disable=E0611
 from starlette.routing import _DefaultLifespan
 
 from tortoise import Tortoise, connections
+from tortoise.contrib.starlette import IdentityMapMiddleware  # noqa: F401
 from tortoise.exceptions import DoesNotExist, IntegrityError
 from tortoise.log import logger
 
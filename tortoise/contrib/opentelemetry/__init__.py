@@ -0,0 +1,92 @@
+"""
+OpenTelemetry tracing of queries.
+
+Requires ``opentelemetry-api``, install it with the ``opentelemetry`` extra, and an
+OpenTelemetry SDK configured by the application.
+
+.. code-block:: python3
+
+    from tortoise.contrib.opentelemetry import instrument
+
+    instrument()
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from tortoise.exceptions import ConfigurationError
+from tortoise.instrumentation import STAGES, QueryEvent, add_hook, remove_hook
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from opentelemetry.util.types import AttributeValue
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:  # pragma: nocoverage
+    trace = None  # type: ignore
+
+#: ``db.system`` of each dialect
+DB_SYSTEMS = {"postgres": "postgresql", "mssql": "mssql", "mysql": "mysql", "oracle": "oracle"}
+
+
+class OpenTelemetryHook:
+    """
+    Instrumentation hook recording a client span for every query.
+
+    Spans are recorded once the query completed, with its start and end times, as children
+    of the span that was current when the query ran. The time spent in each stage is added
+    as ``tortoise.timing.<stage>`` attributes.
+
+    :param tracer_provider: The tracer provider to use, the global one by default.
+    """
+
+    __slots__ = ("tracer",)
+
+    def __init__(self, tracer_provider: Optional[Any] = None) -> None:
+        if trace is None:
+            raise ConfigurationError("opentelemetry-api is not installed")
+        self.tracer = trace.get_tracer("tortoise", tracer_provider=tracer_provider)
+
+    def __call__(self, event: QueryEvent) -> None:
+        attributes: Dict[str, "AttributeValue"] = {
+            "db.system": DB_SYSTEMS.get(event.dialect, event.dialect),
+            "db.operation": event.operation,
+            "tortoise.connection_name": event.connection_name,
+            "tortoise.params": event.params,
+        }
+        name = event.operation
+        if event.model is not None:
+            table = event.model._meta.db_table
+            attributes["db.sql.table"] = table
+            name = f"{name} {table}"
+        if event.sql is not None:
+            attributes["db.statement"] = event.sql
+        if event.rows is not None:
+            attributes["tortoise.rows"] = event.rows
+        for stage in STAGES:
+            attributes[f"tortoise.timing.{stage}"] = event.timings[stage]
+        span = self.tracer.start_span(
+            name, kind=SpanKind.CLIENT, attributes=attributes, start_time=event.started
+        )
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(Status(StatusCode.ERROR, str(event.error)))
+        span.end(end_time=event.started + int(event.duration * 1e9))
+
+
+def instrument(tracer_provider: Optional[Any] = None) -> OpenTelemetryHook:
+    """
+    Registers an :class:`OpenTelemetryHook` and returns it.
+
+    :param tracer_provider: The tracer provider to use, the global one by default.
+    """
+    hook = OpenTelemetryHook(tracer_provider)
+    add_hook(hook)
+    return hook
+
+
+def uninstrument(hook: OpenTelemetryHook) -> None:
+    """
+    Unregisters a hook registered with :func:`instrument`.
+    """
+    remove_hook(hook)
@@ -1,10 +1,12 @@
 import sys
-from typing import TYPE_CHECKING, List, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Type, Union, cast
 
 import pydantic
 from pydantic import BaseModel, ConfigDict, RootModel
+from pydantic_core import to_json
 
 from tortoise import fields
+from tortoise.query_utils import Prefetch
 
 if sys.version_info >= (3, 11):  # pragma: nocoverage
     from typing import Self
@@ -43,6 +45,263 @@ def _get_fetch_fields(
     return fetch_fields
 
 
+def _get_submodel(annotation: Any) -> "Optional[Type[PydanticModel]]":
+    origin = getattr(annotation, "__origin__", None)
+    if origin in (list, List, Union):
+        annotation = annotation.__args__[0]
+    if isinstance(annotation, type) and issubclass(annotation, PydanticModel):
+        return annotation
+    return None
+
+
+def _has_relations(pydantic_class: "Type[PydanticModel]") -> bool:
+    fetch_fields = pydantic_class.model_config["orig_model"]._meta.fetch_fields  # type: ignore
+    return any(field_name in fetch_fields for field_name in pydantic_class.model_fields)
+
+
+def _optimise_queryset(
+    pydantic_class: "Type[PydanticModel]",
+    queryset: "QuerySet",
+    required: Tuple[str, ...] = (),
+    joins: bool = True,
+) -> "QuerySet":
+    """
+    Restricts a queryset to what the pydantic model serialises.
+
+    Only the included columns are selected, embedded foreign keys and one-to-one fields without
+    relations of their own are joined with ``select_related()``, and other relations are
+    prefetched with querysets restricted the same way.
+
+    :param pydantic_class: The pydantic model class
+    :param queryset: A queryset on the tortoise model of the pydantic model
+    :param required: Fields to select even if the pydantic model does not include them
+    :param joins: If ``select_related()`` may be used, many-to-many prefetches ignore it
+    :return: The restricted queryset
+    """
+    model_class: "Type[Model]" = pydantic_class.model_config["orig_model"]  # type: ignore
+    meta = model_class._meta
+    columns: Set[str] = {meta.pk_attr, *required}
+    select_related: List[str] = []
+    prefetches: List[Union[str, Prefetch]] = []
+    for field_name, field_info in pydantic_class.model_fields.items():
+        if field_name in meta.fields_db_projection:
+            columns.add(field_name)
+            continue
+        if field_name not in meta.fetch_fields:
+            continue
+        field_object = meta.fields_map[field_name]
+        submodel = _get_submodel(field_info.annotation)
+        if field_name in meta.fk_fields or field_name in meta.o2o_fields:
+            columns.add(field_object.source_field)  # type: ignore
+            if joins and (submodel is None or not _has_relations(submodel)):
+                select_related.append(field_name)
+                continue
+            related_required: Tuple[str, ...] = (
+                field_object.to_field_instance.model_field_name,  # type: ignore
+            )
+        elif field_name in meta.m2m_fields:
+            related_required = ()
+        else:
+            columns.add(field_object.to_field_instance.model_field_name)  # type: ignore
+            related_required = (field_object.relation_field,)  # type: ignore
+        if submodel is None:
+            prefetches.append(field_name)
+        else:
+            related_model: "Type[Model]" = field_object.related_model  # type: ignore
+            related_query = _optimise_queryset(
+                submodel,
+                related_model.all(),
+                related_required,
+                joins=field_name not in meta.m2m_fields,
+            )
+            prefetches.append(Prefetch(field_name, queryset=related_query))
+
+    # Computed fields may read any attribute, so their model is always fully loaded
+    if (
+        not pydantic_class.model_computed_fields
+        and not queryset._fields_for_select
+        and not queryset._annotations
+    ):
+        queryset = queryset.only(*columns)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    return queryset.prefetch_related(*prefetches)
+
+
+_RELATION_KEY = "tortoise_relation_key"
+
+
+def _serialises_rows(pydantic_class: "Type[PydanticModel]", seen: Optional[Set] = None) -> bool:
+    """
+    Returns if rows can be serialised directly like the pydantic model, which is not the case
+    if it or a nested model has computed fields, serializers, aliases or custom JSON
+    serialisation settings.
+    """
+    seen = seen if seen is not None else set()
+    if pydantic_class in seen:
+        return True
+    seen.add(pydantic_class)
+    decorators = pydantic_class.__pydantic_decorators__
+    if (
+        pydantic_class.model_computed_fields
+        or decorators.field_serializers
+        or decorators.model_serializers
+        or pydantic_class.model_config.get("alias_generator")
+        or any(key.startswith("ser_json") for key in pydantic_class.model_config)
+    ):
+        return False
+    for field_info in pydantic_class.model_fields.values():
+        if field_info.alias or field_info.serialization_alias:
+            return False
+        submodel = _get_submodel(field_info.annotation)
+        if submodel is not None and not _serialises_rows(submodel, seen):
+            return False
+    return True
+
+
+async def _fetch_rows(
+    pydantic_class: "Type[PydanticModel]",
+    queryset: "Union[QuerySet, QuerySetSingle]",
+    keys: Dict[str, str],
+) -> List[dict]:
+    """
+    Fetches the values of a queryset, and of the relations the pydantic model includes,
+    as dicts without building model instances.
+
+    :param pydantic_class: The pydantic model class
+    :param queryset: A queryset on the tortoise model of the pydantic model
+    :param keys: Extra values to fetch, mapping their name to a field path
+    :return: The rows, with relations as nested rows
+    """
+    model_class: "Type[Model]" = pydantic_class.model_config["orig_model"]  # type: ignore
+    meta = model_class._meta
+    columns: Dict[str, str] = {meta.pk_attr: meta.pk_attr, **keys}
+    relations = []
+    for field_name, field_info in pydantic_class.model_fields.items():
+        if field_name in meta.fields_db_projection:
+            columns[field_name] = field_name
+        elif field_name in meta.fetch_fields:
+            field_object = meta.fields_map[field_name]
+            if field_name in meta.fk_fields or field_name in meta.o2o_fields:
+                columns[field_object.source_field] = field_object.source_field  # type: ignore
+            elif field_name not in meta.m2m_fields:
+                to_field = field_object.to_field_instance.model_field_name  # type: ignore
+                columns[to_field] = to_field
+            relations.append((field_name, field_object, _get_submodel(field_info.annotation)))
+
+    result: Union[List[dict], Dict[str, Any], None] = await queryset.values(**columns)
+    if result is None:
+        return []
+    rows = [result] if isinstance(result, dict) else result
+
+    for field_name, field_object, submodel in relations:
+        related_model: "Type[Model]" = field_object.related_model  # type: ignore
+        parent_key: str
+        if field_name in meta.fk_fields or field_name in meta.o2o_fields:
+            parent_key = cast(str, field_object.source_field)
+            child_key = field_object.to_field_instance.model_field_name  # type: ignore
+            many = False
+        elif field_name in meta.m2m_fields:
+            parent_key = meta.pk_attr
+            child_key = related_model._meta.pk_attr
+            many = True
+        else:
+            parent_key = field_object.to_field_instance.model_field_name  # type: ignore
+            child_key = field_object.relation_field  # type: ignore
+            many = field_name in meta.backward_fk_fields
+
+        parent_keys = list({row[parent_key] for row in rows if row[parent_key] is not None})
+        related_rows: Dict[Any, list] = {}
+        if parent_keys and submodel is not None:
+            if field_name in meta.m2m_fields:
+                related_rows = await _fetch_m2m_rows(submodel, model_class, field_name, parent_keys)
+            else:
+                for related_row in await _fetch_rows(
+                    submodel,
+                    related_model.filter(**{f"{child_key}__in": parent_keys}),
+                    {_RELATION_KEY: child_key},
+                ):
+                    related_rows.setdefault(related_row[_RELATION_KEY], []).append(related_row)
+        for row in rows:
+            found = related_rows.get(row[parent_key], [])
+            row[field_name] = found if many else (found[0] if found else None)
+    return rows
+
+
+async def _fetch_m2m_rows(
+    pydantic_class: "Type[PydanticModel]",
+    model_class: "Type[Model]",
+    field_name: str,
+    keys: List[Any],
+) -> Dict[Any, List[dict]]:
+    """
+    Fetches the rows related through a many-to-many field to each of ``keys``.
+
+    The relation is prefetched like ``from_queryset()`` does, so the rows come in the same
+    order, before the values of the related objects are fetched.
+    """
+    field_object = model_class._meta.fields_map[field_name]
+    related_model: "Type[Model]" = field_object.related_model  # type: ignore
+    related_pk = related_model._meta.pk_attr
+    instances = (
+        await model_class.filter(pk__in=keys)
+        .only(model_class._meta.pk_attr)
+        .prefetch_related(Prefetch(field_name, related_model.all().only(related_pk)))
+    )
+    related_keys = {
+        instance.pk: [related.pk for related in getattr(instance, field_name)]
+        for instance in instances
+    }
+    related_rows = {
+        row[_RELATION_KEY]: row
+        for row in await _fetch_rows(
+            pydantic_class,
+            related_model.filter(pk__in={pk for pks in related_keys.values() for pk in pks}),
+            {_RELATION_KEY: related_pk},
+        )
+    }
+    return {key: [related_rows[pk] for pk in pks] for key, pks in related_keys.items()}
+
+
+def _shape_row(pydantic_class: "Type[PydanticModel]", row: dict) -> dict:
+    """
+    Orders a fetched row like the pydantic model, dropping the extra values fetched for it.
+    """
+    shaped = {}
+    for field_name, field_info in pydantic_class.model_fields.items():
+        value = row[field_name]
+        submodel = _get_submodel(field_info.annotation)
+        if submodel is not None and value is not None:
+            if isinstance(value, list):
+                value = [_shape_row(submodel, item) for item in value]
+            else:
+                value = _shape_row(submodel, value)
+        shaped[field_name] = value
+    return shaped
+
+
+async def _json_from_queryset(
+    pydantic_class: "Type[PydanticModel]",
+    queryset: "Union[QuerySet, QuerySetSingle]",
+    single: bool = False,
+) -> bytes:
+    if not _serialises_rows(pydantic_class):
+        # Field names like model_dump_json(), to_json() defaults to aliases
+        if single:
+            return to_json(
+                await pydantic_class.from_queryset_single(cast("QuerySetSingle", queryset)),
+                by_alias=False,
+            )
+        return to_json(
+            await pydantic_class.from_queryset(cast("QuerySet", queryset)), by_alias=False
+        )
+    rows = await _fetch_rows(pydantic_class, queryset, {})
+    shaped = [_shape_row(pydantic_class, row) for row in rows]
+    if single:
+        return to_json(shaped[0] if shaped else None)
+    return to_json(shaped)
+
+
 class PydanticModel(BaseModel):
     """
     Pydantic BaseModel for Tortoise objects.
@@ -97,12 +356,12 @@ class PydanticModel(BaseModel):
         Returns a serializable pydantic model instance for a single model
         from the provided queryset.
 
-        This will prefetch all the relations automatically.
+        This will prefetch all the relations automatically, selecting only the columns
+        the pydantic model includes.
 
         :param queryset: a queryset on the model this PydanticModel is based on.
         """
-        fetch_fields = _get_fetch_fields(cls, cls.model_config["orig_model"])  # type: ignore
-        return cls.model_validate(await queryset.prefetch_related(*fetch_fields))
+        return cls.model_validate(await _optimise_queryset(cls, cast("QuerySet", queryset)))
 
     @classmethod
     async def from_queryset(cls, queryset: "QuerySet") -> List[Self]:
@@ -110,12 +369,40 @@ class PydanticModel(BaseModel):
         Returns a serializable pydantic model instance that contains a list of models,
         from the provided queryset.
 
-        This will prefetch all the relations automatically.
+        This will prefetch all the relations automatically, selecting only the columns
+        the pydantic model includes.
 
         :param queryset: a queryset on the model this PydanticModel is based on.
         """
-        fetch_fields = _get_fetch_fields(cls, cls.model_config["orig_model"])  # type: ignore
-        return [cls.model_validate(e) for e in await queryset.prefetch_related(*fetch_fields)]
+        return [cls.model_validate(e) for e in await _optimise_queryset(cls, queryset)]
+
+    @classmethod
+    async def json_from_queryset_single(cls, queryset: "QuerySetSingle") -> bytes:
+        """
+        Returns the JSON of a single model from the provided queryset, identical to
+        ``(await cls.from_queryset_single(queryset)).model_dump_json()``.
+
+        The values are fetched and serialised without building model instances or
+        validating them, unless the pydantic model has computed fields, serializers or
+        aliases.
+
+        :param queryset: a queryset on the model this PydanticModel is based on.
+        """
+        return await _json_from_queryset(cls, queryset, single=True)
+
+    @classmethod
+    async def json_from_queryset(cls, queryset: "QuerySet") -> bytes:
+        """
+        Returns the JSON list of the models from the provided queryset, identical to
+        serialising the result of ``from_queryset()``.
+
+        The values are fetched and serialised without building model instances or
+        validating them, unless the pydantic model has computed fields, serializers or
+        aliases.
+
+        :param queryset: a queryset on the model this PydanticModel is based on.
+        """
+        return await _json_from_queryset(cls, queryset)
 
 
 class PydanticListModel(RootModel):
@@ -132,12 +419,26 @@ class PydanticListModel(RootModel):
         Returns a serializable pydantic model instance that contains a list of models,
         from the provided queryset.
 
-        This will prefetch all the relations automatically.
+        This will prefetch all the relations automatically, selecting only the columns
+        the pydantic model includes.
 
         :param queryset: a queryset on the model this PydanticListModel is based on.
         """
         submodel = cls.model_config["submodel"]  # type: ignore
-        fetch_fields = _get_fetch_fields(submodel, submodel.model_config["orig_model"])
         return cls.model_validate(
-            [submodel.model_validate(e) for e in await queryset.prefetch_related(*fetch_fields)]
+            [submodel.model_validate(e) for e in await _optimise_queryset(submodel, queryset)]
         )
+
+    @classmethod
+    async def json_from_queryset(cls, queryset: "QuerySet") -> bytes:
+        """
+        Returns the JSON of the models from the provided queryset, identical to
+        ``(await cls.from_queryset(queryset)).model_dump_json()``.
+
+        The values are fetched and serialised without building model instances or
+        validating them, unless the pydantic model has computed fields, serializers or
+        aliases.
+
+        :param queryset: a queryset on the model this PydanticListModel is based on.
+        """
+        return await _json_from_queryset(cls.model_config["submodel"], queryset)  # type: ignore
@@ -1,7 +1,8 @@
 import inspect
 from base64 import b32encode
+from collections import OrderedDict
 from hashlib import sha3_224
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
 
 from pydantic import ConfigDict, Field, computed_field, create_model
 from pydantic._internal._decorators import PydanticDescriptorProxy
@@ -14,6 +15,10 @@ if TYPE_CHECKING:  # pragma: nocoverage
     from tortoise.models import Model
 
 _MODEL_INDEX: Dict[str, Type[PydanticModel]] = {}
+#: Created models memoised by the creators, the least recently used are dropped beyond it
+CREATOR_CACHE_SIZE = 1024
+# Created models by creator arguments, so repeated and nested calls reuse them
+_CREATOR_CACHE: "OrderedDict[tuple, Type[Union[PydanticModel, PydanticListModel]]]" = OrderedDict()
 
 
 class PydanticMeta:
@@ -71,6 +76,41 @@ def _cleandoc(obj: Any) -> str:
     return _br_it(inspect.cleandoc(obj.__doc__ or ""))
 
 
+def _creator_key(cls: "Type[Model]", **kwargs: Any) -> Optional[tuple]:
+    """
+    Returns the key of the creator arguments in ``_CREATOR_CACHE``, or ``None`` if they
+    are not hashable.
+    """
+    # The recursion stack is kept in the key, as submodel names and cut-offs depend on it
+    key = (cls, cls._meta._inited) + tuple(
+        (k, tuple(v.items()) if isinstance(v, dict) else v) for k, v in sorted(kwargs.items())
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _get_created(key: Optional[tuple]) -> Optional[Type[Union[PydanticModel, PydanticListModel]]]:
+    if key is None:
+        return None
+    model = _CREATOR_CACHE.get(key)
+    if model is not None:
+        _CREATOR_CACHE.move_to_end(key)
+    return model
+
+
+def _set_created(
+    key: Optional[tuple], model: Type[Union[PydanticModel, PydanticListModel]]
+) -> None:
+    if key is None:
+        return
+    _CREATOR_CACHE[key] = model
+    while len(_CREATOR_CACHE) > CREATOR_CACHE_SIZE:
+        _CREATOR_CACHE.popitem(last=False)
+
+
 def _pydantic_recursion_protector(
     cls: "Type[Model]",
     *,
@@ -165,8 +205,69 @@ def pydantic_model_creator(
             config_class as its Config class's bases(Only if provided!), but it
             ignores ``fields`` config. pydantic_model_creator will generate fields by
             include/exclude/computed parameters automatically.
+
+    Created models are memoised by their arguments, up to ``CREATOR_CACHE_SIZE`` of them,
+    so calling it again with the same arguments returns the same class. It is shared, so
+    must not be modified, subclass it instead. Submodels of relations are memoised by the
+    path of relations leading to them, as it decides their name and how deep they recurse,
+    so they are only shared by models reaching them through the same path.
     """
+    cache_key = _creator_key(
+        cls,
+        name=name,
+        exclude=exclude,
+        include=include,
+        computed=computed,
+        optional=optional,
+        allow_cycles=allow_cycles,
+        sort_alphabetically=sort_alphabetically,
+        _stack=_stack,
+        exclude_readonly=exclude_readonly,
+        meta_override=meta_override,
+        model_config=model_config,
+        validators=validators,
+        module=module,
+    )
+    cached = _get_created(cache_key)
+    if cached is not None:
+        return cached  # type: ignore
+    model = _pydantic_model_creator(
+        cls,
+        name=name,
+        exclude=exclude,
+        include=include,
+        computed=computed,
+        optional=optional,
+        allow_cycles=allow_cycles,
+        sort_alphabetically=sort_alphabetically,
+        _stack=_stack,
+        exclude_readonly=exclude_readonly,
+        meta_override=meta_override,
+        model_config=model_config,
+        validators=validators,
+        module=module,
+    )
+    _set_created(cache_key, model)
+    return model
+
 
+def _pydantic_model_creator(
+    cls: "Type[Model]",
+    *,
+    name,
+    exclude: Tuple[str, ...],
+    include: Tuple[str, ...],
+    computed: Tuple[str, ...],
+    optional: Tuple[str, ...],
+    allow_cycles: Optional[bool],
+    sort_alphabetically: Optional[bool],
+    _stack: tuple,
+    exclude_readonly: bool,
+    meta_override: Optional[Type],
+    model_config: Optional[ConfigDict],
+    validators: Optional[Dict[str, Any]],
+    module: str,
+) -> Type[PydanticModel]:
     # Fully qualified class name
     fqname = cls.__module__ + "." + cls.__qualname__
     postfix = ""
@@ -493,7 +594,23 @@ def pydantic_queryset_creator(
             * Field definition order +
             * order of reverse relations (as discovered) +
             * order of computed functions (as provided).
+
+    Like with :func:`pydantic_model_creator`, the created model is memoised and must not
+    be modified.
     """
+    cache_key = _creator_key(
+        cls,
+        list=True,
+        name=name,
+        exclude=exclude,
+        include=include,
+        computed=computed,
+        allow_cycles=allow_cycles,
+        sort_alphabetically=sort_alphabetically,
+    )
+    cached = _get_created(cache_key)
+    if cached is not None:
+        return cached  # type: ignore
 
     submodel = pydantic_model_creator(
         cls,
@@ -517,4 +634,5 @@ def pydantic_queryset_creator(
     # The title of the model to hide the hash postfix
     model.model_config["title"] = name or f"{submodel.model_config['title']}_list"
     model.model_config["submodel"] = submodel  # type: ignore
+    _set_created(cache_key, model)
     return model
@@ -2,11 +2,34 @@ from types import ModuleType
 from typing import Dict, Iterable, Optional, Union
 
 from starlette.applications import Starlette  # pylint: disable=E0401
+from starlette.types import ASGIApp, Receive, Scope, Send  # pylint: disable=E0401
 
-from tortoise import Tortoise, connections
+from tortoise import Tortoise, connections, identity_map
 from tortoise.log import logger
 
 
+class IdentityMapMiddleware:
+    """
+    ASGI middleware that runs every HTTP and WebSocket request inside
+    :func:`tortoise.identity_map`, so each row is loaded into a single instance
+    per request.
+
+    .. code-block:: python3
+
+        app = Starlette(middleware=[Middleware(IdentityMapMiddleware)])
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        async with identity_map():
+            await self.app(scope, receive, send)
+
+
 def register_tortoise(
     app: Starlette,
     config: Optional[dict] = None,
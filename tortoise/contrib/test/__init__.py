@@ -10,6 +10,7 @@ from unittest import SkipTest, expectedFailure, skip, skipIf, skipUnless
 
 from tortoise import Model, Tortoise, connections
 from tortoise.backends.base.config_generator import generate_config as _generate_config
+from tortoise.cache import query_cache
 from tortoise.exceptions import DBConnectionError, OperationalError
 
 __all__ = (
@@ -278,6 +279,9 @@ class TruncationTestCase(SimpleTestCase):
                 await model._meta.db.execute_script(  # nosec
                     f"DELETE FROM {quote_char}{model._meta.db_table}{quote_char}"
                 )
+                if model._meta.object_cache is not None:
+                    model._meta.object_cache.clear()
+        await query_cache.clear()
         await super()._tearDownDB()
 
 
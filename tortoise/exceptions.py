@@ -81,3 +81,24 @@ class UnSupportedError(BaseORMException):
     """
     The UnSupportedError is raised when operation is not supported.
     """
+
+
+class QueryTimeoutError(OperationalError):
+    """
+    The QueryTimeoutError is raised when a statement ran longer than its timeout,
+    and was cancelled.
+    """
+
+
+class PoolExhaustedError(OperationalError):
+    """
+    The PoolExhaustedError is raised when no connection was acquired within the acquire timeout,
+    or the acquisition was shed because too many tasks were waiting or running statements.
+    """
+
+
+class TransactionConflictError(OperationalError):
+    """
+    The TransactionConflictError is raised when the database aborted a transaction because of a
+    serialization failure or a deadlock, so that running it again may succeed.
+    """
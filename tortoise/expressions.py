@@ -27,7 +27,7 @@ from tortoise.fields.relational import (
     ForeignKeyFieldInstance,
     RelationalField,
 )
-from tortoise.query_utils import QueryModifier, _get_joins_for_related_field
+from tortoise.query_utils import QueryModifier, ResolvedFilterKey
 
 if TYPE_CHECKING:  # pragma: nocoverage
     from pypika.queries import Selectable
@@ -207,12 +207,11 @@ class Q(Expression):
         self._is_negated = not self._is_negated
 
     def _resolve_nested_filter(
-        self, model: "Type[Model]", key: str, value: Any, table: Table
+        self, model: "Type[Model]", resolved: ResolvedFilterKey, value: Any, table: Table
     ) -> QueryModifier:
-        related_field_name, __, forwarded_fields = key.partition("__")
-        related_field = cast(RelationalField, model._meta.fields_map[related_field_name])
-        required_joins = _get_joins_for_related_field(table, related_field, related_field_name)
-        q = Q(**{forwarded_fields: value})
+        related_field = cast(RelationalField, resolved.related_field)
+        required_joins = resolved.get_joins(table)
+        q = Q(**{resolved.forwarded_fields: value})
         q._annotations = self._annotations
         q._custom_filters = self._custom_filters
         modifier = q.resolve(
@@ -244,15 +243,20 @@ class Q(Expression):
         return modifier
 
     def _process_filter_kwarg(
-        self, model: "Type[Model]", key: str, value: Any, table: Table
+        self, model: "Type[Model]", resolved: ResolvedFilterKey, value: Any, table: Table
     ) -> Tuple[Criterion, Optional[Tuple[Table, Criterion]]]:
         join = None
 
-        if value is None and f"{key}__isnull" in model._meta.filters:
-            param = model._meta.get_filter(f"{key}__isnull")
+        if value is None and resolved.isnull_param is not None:
+            param = resolved.isnull_param
+            field_object = resolved.isnull_field_object
             value = True
+        elif resolved.param is not None:
+            param = resolved.param
+            field_object = resolved.field_object
         else:
-            param = model._meta.get_filter(key)
+            param = model._meta.get_filter(resolved.filter_key)
+            field_object = resolved.field_object
 
         pk_db_field = model._meta.db_pk_column
         if param.get("table"):
@@ -267,67 +271,55 @@ class Q(Expression):
             if isinstance(value, Term):
                 encoded_value = value
             else:
-                field_object = model._meta.fields_map[param["field"]]
                 encoded_value = (
                     param["value_encoder"](value, model, field_object)
                     if param.get("value_encoder")
-                    else model._meta.db.executor_class._field_to_db(field_object, value, model)
+                    else resolved.field_to_db(cast("Field", field_object), value, model)
                 )
             op = param["operator"]
             # this is an ugly hack
             if op == operator.eq:
-                encoded_value = model._meta.db.query_class._builder()._wrapper_cls(encoded_value)
+                encoded_value = resolved.wrapper_cls(encoded_value)
             criterion = op(table[param["source_field"]], encoded_value)
         return criterion, join
 
     def _resolve_regular_kwarg(
-        self, model: "Type[Model]", key: str, value: Any, table: Table
+        self, model: "Type[Model]", resolved: ResolvedFilterKey, value: Any, table: Table
     ) -> QueryModifier:
-        if key not in model._meta.filters and key.split("__")[0] in model._meta.fetch_fields:
-            modifier = self._resolve_nested_filter(model, key, value, table)
+        if resolved.related_field is not None:
+            modifier = self._resolve_nested_filter(model, resolved, value, table)
         else:
-            criterion, join = self._process_filter_kwarg(model, key, value, table)
+            criterion, join = self._process_filter_kwarg(model, resolved, value, table)
             joins = [join] if join else []
             modifier = QueryModifier(where_criterion=criterion, joins=joins)
         return modifier
 
     def _get_actual_filter_params(
-        self, model: "Type[Model]", key: str, value: Table
+        self, model: "Type[Model]", resolved: ResolvedFilterKey, value: Any
     ) -> Tuple[str, Any]:
-        filter_key = key
-        if key in model._meta.fk_fields or key in model._meta.o2o_fields:
-            field_object = model._meta.fields_map[key]
-            if hasattr(value, "pk"):
-                filter_value = value.pk
-            else:
-                filter_value = value
-            filter_key = cast(str, field_object.source_field)
-        elif key in model._meta.m2m_fields:
-            if hasattr(value, "pk"):
-                filter_value = value.pk
-            else:
-                filter_value = value
-        elif (
-            key.split("__")[0] in model._meta.fetch_fields
-            or key in self._custom_filters
-            or key in model._meta.filters
-        ):
+        if resolved.unwrap_pk:
+            filter_value = value.pk if hasattr(value, "pk") else value
+        elif resolved.known or resolved.filter_key in self._custom_filters:
             filter_value = value
         else:
             allowed = sorted(
                 model._meta.fields | model._meta.fetch_fields | set(self._custom_filters)
             )
-            raise FieldError(f"Unknown filter param '{key}'. Allowed base values are {allowed}")
-        return filter_key, filter_value
+            raise FieldError(
+                f"Unknown filter param '{resolved.filter_key}'. Allowed base values are {allowed}"
+            )
+        return resolved.filter_key, filter_value
 
     def _resolve_kwargs(self, model: "Type[Model]", table: Table) -> QueryModifier:
         modifier = QueryModifier()
+        filter_cache = model._meta.filter_cache
         for raw_key, raw_value in self.filters.items():
-            key, value = self._get_actual_filter_params(model, raw_key, raw_value)
+            resolved = filter_cache.get(raw_key)
+            key, value = self._get_actual_filter_params(model, resolved, raw_value)
             if key in self._custom_filters:
                 filter_modifier = self._resolve_custom_kwarg(model, key, value, table)
             else:
-                filter_modifier = self._resolve_regular_kwarg(model, key, value, table)
+                filter_modifier = self._resolve_regular_kwarg(model, resolved, value, table)
 
             if self.join_type == self.AND:
                 modifier &= filter_modifier
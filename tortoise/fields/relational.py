@@ -16,6 +16,7 @@ from typing import (
 from pypika import Table
 from typing_extensions import Literal
 
+from tortoise.cache import invalidate_tables
 from tortoise.exceptions import ConfigurationError, NoValuesFetched, OperationalError
 from tortoise.fields.base import CASCADE, SET_NULL, Field, OnDelete
 
@@ -51,11 +52,13 @@ class ReverseRelation(Generic[MODEL]):
         relation_field: str,
         instance: "Model",
         from_field: str,
+        field_name: Optional[str] = None,
     ) -> None:
         self.remote_model = remote_model
         self.relation_field = relation_field
         self.instance = instance
         self.from_field = from_field
+        self.field_name = field_name
         self._fetched = False
         self._custom_query = False
         self.related_objects: List[MODEL] = []
@@ -91,6 +94,9 @@ class ReverseRelation(Generic[MODEL]):
         return self.related_objects[item]
 
     def __await__(self) -> Generator[Any, None, List[MODEL]]:
+        loader = self.instance._relation_loader
+        if loader is not None and self.field_name is not None:
+            return loader.load(self.instance, self.field_name).__await__()
         return self._query.__await__()
 
     async def __aiter__(self) -> AsyncGenerator[Any, MODEL]:
@@ -149,7 +155,13 @@ class ManyToManyRelation(ReverseRelation[MODEL]):
     """
 
     def __init__(self, instance: "Model", m2m_field: "ManyToManyFieldInstance[MODEL]") -> None:
-        super().__init__(m2m_field.related_model, m2m_field.related_name, instance, "pk")
+        super().__init__(
+            m2m_field.related_model,
+            m2m_field.related_name,
+            instance,
+            "pk",
+            m2m_field.model_field_name,
+        )
         self.field = m2m_field
         self.instance = instance
 
@@ -216,6 +228,7 @@ class ManyToManyRelation(ReverseRelation[MODEL]):
             insert_is_required = True
         if insert_is_required:
             await db.execute_query(str(query))
+            await invalidate_tables(db, self.field.through)
 
     async def clear(self, using_db: "Optional[BaseDBAsyncClient]" = None) -> None:
         """
@@ -233,6 +246,7 @@ class ManyToManyRelation(ReverseRelation[MODEL]):
             .delete()
         )
         await db.execute_query(str(query))
+        await invalidate_tables(db, self.field.through)
 
     async def remove(
         self, *instances: MODEL, using_db: "Optional[BaseDBAsyncClient]" = None
@@ -268,6 +282,7 @@ class ManyToManyRelation(ReverseRelation[MODEL]):
             )
         query = db.query_class.from_(through_table).where(condition).delete()
         await db.execute_query(str(query))
+        await invalidate_tables(db, self.field.through)
 
 
 class RelationalField(Field[MODEL]):
@@ -0,0 +1,73 @@
+"""
+Health of pooled connections, see :class:`ConnectionHealth`.
+"""
+
+import time
+from typing import Any, Optional
+from weakref import WeakKeyDictionary
+
+#: Reasons to close a connection instead of using it
+LIFETIME = "lifetime"
+IDLE = "idle"
+#: Reason to ping a connection before using it
+PING = "ping"
+
+
+class ConnectionHealth:
+    """
+    Tracks when the connections of a pool were first used and last released, to replace the
+    ones that are too old or were idle too long on checkout, and ping the ones idle for a while.
+
+    :param max_lifetime: Seconds after which a connection is closed on checkout, counted from its
+        first checkout.
+    :param max_idle: Seconds a connection may stay idle in the pool before being closed on
+        checkout.
+    :param pre_ping: Seconds a connection may stay idle in the pool before being pinged on
+        checkout, and closed if it doesn't respond.
+    """
+
+    __slots__ = ("max_lifetime", "max_idle", "pre_ping", "_opened", "_released")
+
+    def __init__(
+        self,
+        max_lifetime: Optional[float] = None,
+        max_idle: Optional[float] = None,
+        pre_ping: Optional[float] = None,
+    ) -> None:
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.pre_ping = pre_ping
+        self._opened: "WeakKeyDictionary[Any, float]" = WeakKeyDictionary()
+        self._released: "WeakKeyDictionary[Any, float]" = WeakKeyDictionary()
+
+    def checked_out(self, connection: Any) -> Optional[str]:
+        """
+        Records a connection checked out, and returns why it shouldn't be used as is:
+        :data:`LIFETIME` or :data:`IDLE` to close it, :data:`PING` to ping it first, or ``None``.
+        """
+        now = time.monotonic()
+        opened = self._opened.setdefault(connection, now)
+        if self.max_lifetime is not None and now - opened > self.max_lifetime:
+            return LIFETIME
+        released = self._released.get(connection)
+        if released is None:
+            return None
+        idle = now - released
+        if self.max_idle is not None and idle > self.max_idle:
+            return IDLE
+        if self.pre_ping is not None and idle > self.pre_ping:
+            return PING
+        return None
+
+    def checked_in(self, connection: Any) -> None:
+        """
+        Records a connection released to the pool.
+        """
+        self._released[connection] = time.monotonic()
+
+    def forget(self, connection: Any) -> None:
+        """
+        Drops a closed connection.
+        """
+        self._opened.pop(connection, None)
+        self._released.pop(connection, None)
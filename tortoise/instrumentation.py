@@ -0,0 +1,269 @@
+"""
+Query lifecycle instrumentation.
+
+Hooks registered with :func:`add_hook` receive a :class:`QueryEvent` after every statement
+or query. Nothing is measured while no hook is registered.
+
+.. code-block:: python3
+
+    from tortoise.instrumentation import add_hook
+
+    def log_slow(event):
+        if event.duration > 0.1:
+            print(event.operation, event.model, event.sql, event.timings)
+
+    add_hook(log_slow)
+"""
+
+import inspect
+import time
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from tortoise.log import logger
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.backends.base.client import BaseDBAsyncClient
+    from tortoise.models import Model
+
+T = TypeVar("T")
+
+#: Stages of a query, in the order they run
+STAGES = ("build", "acquire", "execute", "hydrate", "prefetch")
+_OPERATIONS = {"select", "insert", "update", "delete"}
+
+
+class QueryEvent:
+    """
+    Describes one executed query.
+
+    A query run through a ``QuerySet`` or by saving or deleting an instance gets one event,
+    with every statement it ran (e.g. the batches of a bulk update) accounted for in it.
+    Statements that prefetch related objects, and raw statements executed on a connection,
+    get events of their own.
+    """
+
+    __slots__ = (
+        "connection_name",
+        "dialect",
+        "model",
+        "operation",
+        "sql",
+        "values",
+        "params",
+        "rows",
+        "timings",
+        "error",
+        "started",
+    )
+
+    def __init__(
+        self,
+        connection_name: str,
+        dialect: str,
+        model: "Optional[Type[Model]]" = None,
+        operation: str = "raw",
+    ) -> None:
+        #: Name of the connection the query ran on
+        self.connection_name = connection_name
+        #: Dialect of the connection, e.g. ``sqlite`` or ``postgres``
+        self.dialect = dialect
+        #: Model queried, ``None`` for raw statements
+        self.model = model
+        #: ``select``, ``insert``, ``update``, ``delete`` or ``raw``
+        self.operation = operation
+        #: SQL of the first statement run, with parameter placeholders if it has parameters
+        self.sql: Optional[str] = None
+        #: Parameters of that statement, a list of them for ``execute_many()``
+        self.values: Optional[list] = None
+        #: Number of parameters of the statement
+        self.params = 0
+        #: Number of rows returned or affected, ``None`` if unknown
+        self.rows: Optional[int] = None
+        #: Seconds spent in each of :data:`STAGES`
+        self.timings: Dict[str, float] = dict.fromkeys(STAGES, 0.0)
+        #: Exception the query raised, if any
+        self.error: Optional[BaseException] = None
+        #: Wall clock time the query started at, in nanoseconds since the epoch
+        self.started = time.time_ns()
+
+    @property
+    def duration(self) -> float:
+        """
+        Total seconds spent in all stages.
+        """
+        return sum(self.timings.values())
+
+    def __repr__(self) -> str:
+        model = self.model.__name__ if self.model else None
+        return (
+            f"<QueryEvent {self.operation} model={model} connection={self.connection_name}"
+            f" rows={self.rows} duration={self.duration:.6f}>"
+        )
+
+
+QueryHook = Callable[[QueryEvent], Union[None, Awaitable[None]]]
+
+#: Registered hooks, checked before measuring anything
+hooks: List[QueryHook] = []
+#: Event of the query running in the current context
+current_event: ContextVar[Optional[QueryEvent]] = ContextVar("current_query_event", default=None)
+_executing: ContextVar[bool] = ContextVar("executing_statement", default=False)
+
+
+def add_hook(hook: QueryHook) -> None:
+    """
+    Registers a function or coroutine function called with the :class:`QueryEvent` of every
+    query once it completed or failed.
+
+    Hooks run in the task that ran the query, before its result is returned, so they should
+    be quick. Exceptions raised by hooks are logged and otherwise ignored.
+    """
+    if hook not in hooks:
+        hooks.append(hook)
+
+
+def remove_hook(hook: QueryHook) -> None:
+    """
+    Unregisters a hook registered with :func:`add_hook`.
+    """
+    if hook in hooks:
+        hooks.remove(hook)
+
+
+async def emit(event: QueryEvent) -> None:
+    """
+    Calls the registered hooks with an event.
+    """
+    for hook in list(hooks):
+        try:
+            result = hook(event)
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            logger.exception("Query hook %r failed", hook)
+
+
+def add_timing(stage: str, seconds: float) -> None:
+    """
+    Adds the seconds spent in a stage to the event of the current query, if any.
+    """
+    event = current_event.get()
+    if event is not None:
+        event.timings[stage] += seconds
+
+
+async def instrument_query(
+    db: "BaseDBAsyncClient",
+    model: "Optional[Type[Model]]",
+    operation: str,
+    build: Optional[Callable[[], Any]],
+    execute: Callable[[], Awaitable[T]],
+) -> T:
+    """
+    Runs a query as the current query, and emits its event.
+
+    :param db: The connection the query runs on.
+    :param model: The model queried.
+    :param operation: The operation of the query.
+    :param build: Builds the query, timed as the ``build`` stage.
+    :param execute: Executes the query.
+    """
+    event = QueryEvent(db.connection_name, db.capabilities.dialect, model, operation)
+    token = current_event.set(event)
+    try:
+        if build is not None:
+            start = time.perf_counter()
+            build()
+            event.timings["build"] += time.perf_counter() - start
+        return await execute()
+    except BaseException as exc:
+        event.error = exc
+        raise
+    finally:
+        current_event.reset(token)
+        await emit(event)
+
+
+def _statement_rows(method: str, values: Any, result: Any) -> Optional[int]:
+    if method == "execute_query":
+        return result[0]
+    if method == "execute_query_dict":
+        return len(result)
+    if method == "execute_many":
+        return len(values)
+    if method == "execute_insert":
+        return 1
+    return None
+
+
+async def instrument_execute(
+    client: "BaseDBAsyncClient",
+    method: str,
+    query: str,
+    values: Any,
+    execute: Callable[[], Awaitable[T]],
+) -> T:
+    """
+    Runs a statement on a client, timing it as the ``execute`` stage of the current query.
+
+    Used by the ``execute_*`` methods of the clients. A statement run outside of a query
+    gets an event of its own.
+
+    :param client: The client executing the statement.
+    :param method: Name of the ``execute_*`` method.
+    :param query: The SQL of the statement.
+    :param values: The parameters of the statement.
+    :param execute: Executes the statement.
+    """
+    if _executing.get():
+        # Statement run by another execute_* method that is already timed
+        return await execute()
+    event = current_event.get()
+    token = None
+    if event is None:
+        keyword = query.lstrip()[:6].lower()
+        event = QueryEvent(
+            client.connection_name,
+            client.capabilities.dialect,
+            operation=keyword if keyword in _OPERATIONS else "raw",
+        )
+        token = current_event.set(event)
+    if event.sql is None:
+        event.sql = query
+        event.values = values
+        if values:
+            event.params = len(values[0] if method == "execute_many" else values)
+    executing = _executing.set(True)
+    acquired = event.timings["acquire"]
+    start = time.perf_counter()
+    try:
+        result = await execute()
+    except BaseException as exc:
+        if token is not None:
+            event.error = exc
+        raise
+    else:
+        rows = _statement_rows(method, values, result)
+        if rows is not None:
+            event.rows = (event.rows or 0) + rows
+        return result
+    finally:
+        event.timings["execute"] += (
+            time.perf_counter() - start - (event.timings["acquire"] - acquired)
+        )
+        _executing.reset(executing)
+        if token is not None:
+            current_event.reset(token)
+            await emit(event)
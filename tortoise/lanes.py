@@ -0,0 +1,188 @@
+"""
+Priority lanes, partitioning the connections of a pool between kinds of work, see :func:`lane`.
+"""
+
+import asyncio
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tortoise.exceptions import ConfigurationError
+
+#: Lane of connections acquired outside of any :func:`lane` scope
+DEFAULT_LANE = "default"
+#: Fairness policies, ordering the waiters of different lanes
+FAIRNESS = ("fifo", "priority")
+
+current_lane: ContextVar[str] = ContextVar("current_lane", default=DEFAULT_LANE)
+
+
+class LaneContext:
+    __slots__ = ("name", "token")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.token: Optional[Token] = None
+
+    def __enter__(self) -> str:
+        self.token = current_lane.set(self.name)
+        return self.name
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        current_lane.reset(self.token)  # type: ignore
+
+    async def __aenter__(self) -> str:
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.__exit__(exc_type, exc_val, exc_tb)
+
+
+def lane(name: str) -> LaneContext:
+    """
+    Scope in which connections are acquired in the given lane, on every connection that has
+    ``lanes`` configured and the lane among them, and in the default lane elsewhere:
+
+    .. code-block:: python3
+
+        with lane("batch"):
+            await Event.filter(archived=False).update(archived=True)
+
+    Tasks started in the scope inherit it.
+    """
+    return LaneContext(name)
+
+
+class Lane:
+    """
+    Share of the connections of a pool.
+
+    :param name: Name of the lane.
+    :param reserved: Connections kept available to the lane, which other lanes can't use.
+    :param max: Connections the lane can use at most, all of them by default.
+    :param priority: Lanes with a higher priority are served first by the ``priority`` policy.
+    """
+
+    __slots__ = ("name", "reserved", "max", "priority", "in_use", "waiters")
+
+    def __init__(
+        self, name: str, reserved: int = 0, max: Optional[int] = None, priority: int = 0
+    ) -> None:
+        self.name = name
+        self.reserved = int(reserved)
+        self.max = int(max) if max is not None else None
+        self.priority = int(priority)
+        #: Connections acquired in the lane
+        self.in_use = 0
+        #: Tasks waiting for a connection in the lane
+        self.waiters = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "in_use": self.in_use,
+            "waiters": self.waiters,
+            "reserved": self.reserved,
+            "max": self.max,
+        }
+
+
+class LaneScheduler:
+    """
+    Grants the connections of a pool to lanes.
+
+    A lane gets a connection while it uses fewer than its ``reserved`` ones, or fewer than its
+    ``max`` ones if some connection isn't in use nor reserved by another lane. Tasks that can't
+    get one wait, and are granted released connections in order of arrival with the ``fifo``
+    fairness policy, or by descending lane priority, then arrival, with ``priority``.
+
+    :param lanes: The lanes, by name, as keyword arguments of :class:`Lane`.
+    :param capacity: Returns the maximum number of connections of the pool.
+    :param fairness: ``fifo`` or ``priority``.
+    :raises ConfigurationError: If the fairness policy is unknown.
+    """
+
+    __slots__ = ("lanes", "fairness", "_capacity", "_get_capacity", "_waiting", "_arrivals")
+
+    def __init__(
+        self,
+        lanes: Dict[str, Dict[str, Any]],
+        capacity: Callable[[], int],
+        fairness: str = "fifo",
+    ) -> None:
+        if fairness not in FAIRNESS:
+            raise ConfigurationError(f"Unknown lane fairness policy {fairness!r}")
+        self.lanes = {name: Lane(name, **params) for name, params in lanes.items()}
+        self.lanes.setdefault(DEFAULT_LANE, Lane(DEFAULT_LANE))
+        self.fairness = fairness
+        self._capacity: Optional[int] = None
+        self._get_capacity = capacity
+        self._waiting: List[Tuple[int, Lane, asyncio.Future]] = []
+        self._arrivals = 0
+
+    @property
+    def capacity(self) -> int:
+        """
+        Maximum number of connections of the pool, checked against the lanes on first use.
+
+        :raises ConfigurationError: If the lanes reserve more connections than the pool has.
+        """
+        if self._capacity is None:
+            capacity = self._get_capacity()
+            if sum(lane.reserved for lane in self.lanes.values()) > capacity:
+                raise ConfigurationError(
+                    f"Lanes reserve more than the {capacity} connections of the pool"
+                )
+            self._capacity = capacity
+        return self._capacity
+
+    def _can_take(self, lane: Lane) -> bool:
+        capacity = self.capacity
+        if lane.max is not None and lane.in_use >= lane.max:
+            return False
+        if lane.in_use < lane.reserved:
+            return True
+        held = sum(max(other.in_use, other.reserved) for other in self.lanes.values())
+        return held < capacity
+
+    async def acquire(self, name: str) -> Lane:
+        """
+        Waits for a connection to be granted to a lane, the default lane if it isn't configured.
+        """
+        lane = self.lanes.get(name) or self.lanes[DEFAULT_LANE]
+        if not lane.waiters and self._can_take(lane):
+            lane.in_use += 1
+            return lane
+        future = asyncio.get_running_loop().create_future()
+        entry = (self._arrivals, lane, future)
+        self._arrivals += 1
+        self._waiting.append(entry)
+        lane.waiters += 1
+        try:
+            await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # Granted while being cancelled
+                self.release(lane)
+            else:
+                self._waiting.remove(entry)
+                lane.waiters -= 1
+            raise
+        return lane
+
+    def release(self, lane: Lane) -> None:
+        """
+        Releases a connection granted to a lane, and grants it to waiters that can take it.
+        """
+        lane.in_use -= 1
+        waiting = list(self._waiting)
+        if self.fairness == "priority":
+            waiting.sort(key=lambda entry: (-entry[1].priority, entry[0]))
+        for entry in waiting:
+            _, waiter, future = entry
+            if self._can_take(waiter):
+                self._waiting.remove(entry)
+                waiter.waiters -= 1
+                waiter.in_use += 1
+                future.set_result(None)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: lane.snapshot() for name, lane in self.lanes.items()}
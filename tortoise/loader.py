@@ -0,0 +1,250 @@
+"""
+DataLoader style batching of single object lookups, see :func:`batch_loader`, and of lazy
+relation loads across a result set, see :class:`RelationLoader`.
+"""
+
+import asyncio
+import weakref
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Set, Tuple, Type, Union
+
+from tortoise.fields.relational import ReverseRelation
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from typing_extensions import Literal
+
+    from tortoise.backends.base.client import BaseDBAsyncClient
+    from tortoise.functions import Function
+    from tortoise.models import Model
+    from tortoise.query_utils import Prefetch
+    from tortoise.queryset import QuerySetSingle, RecordsQuery, ValuesListQuery, ValuesQuery
+
+BatchKey = Tuple[Type["Model"], "BaseDBAsyncClient"]
+_MISSING = object()
+
+
+class BatchLoader:
+    """
+    Collects primary key lookups of the same model and connection, and loads each batch
+    with one ``WHERE pk IN (...)`` query.
+
+    A batch is dispatched ``window`` seconds after its first lookup (on the next event
+    loop iteration for ``0``), or as soon as it holds ``max_batch_size`` keys.
+    """
+
+    __slots__ = ("window", "max_batch_size", "batches", "_pending", "_tasks")
+
+    def __init__(self, window: float = 0, max_batch_size: int = 1000) -> None:
+        self.window = window
+        self.max_batch_size = max_batch_size
+        #: Number of queries run for dispatched batches
+        self.batches = 0
+        self._pending: Dict[BatchKey, Dict[Any, List[asyncio.Future]]] = {}
+        # Strong references to the running fetches, the event loop only keeps weak ones
+        self._tasks: Set[asyncio.Future] = set()
+
+    def load(self, model: Type["Model"], db: "BaseDBAsyncClient", pk: Any) -> asyncio.Future:
+        """
+        Returns a future resolving to the instance with the given primary key, or ``None``.
+
+        Concurrent lookups of the same key are loaded once, but each gets its own instance
+        unless an :func:`~tortoise.identity_map` is active.
+        """
+        loop = asyncio.get_running_loop()
+        key = (model, db)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = {}
+            if self.window:
+                loop.call_later(self.window, self._dispatch, key, batch)
+            else:
+                loop.call_soon(self._dispatch, key, batch)
+        future = loop.create_future()
+        batch.setdefault(pk, []).append(future)
+        if len(batch) >= self.max_batch_size:
+            self._dispatch(key, batch)
+        return future
+
+    def _dispatch(self, key: BatchKey, batch: Dict[Any, List[asyncio.Future]]) -> None:
+        if self._pending.get(key) is not batch:
+            # Already dispatched because it was full
+            return
+        del self._pending[key]
+        self.batches += 1
+        task = asyncio.ensure_future(self._fetch(*key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _fetch(
+        model: Type["Model"], db: "BaseDBAsyncClient", batch: Dict[Any, List[asyncio.Future]]
+    ) -> None:
+        try:
+            queryset = model.filter(pk__in=list(batch)).using_db(db)
+            queryset._make_query()
+            _, rows = await db.execute_query(str(queryset.query))
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        meta = model._meta
+        rows_by_pk = {meta.pk.to_python_value(row[meta.db_pk_column]): row for row in rows}
+        for pk, futures in batch.items():
+            row = rows_by_pk.get(pk)
+            for future in futures:
+                if not future.done():
+                    # Instances are built per lookup, the identity map shares them if active
+                    future.set_result(None if row is None else model._init_from_db(**row))
+
+
+current_batch_loader: ContextVar[Optional[BatchLoader]] = ContextVar(
+    "current_batch_loader", default=None
+)
+
+
+class BatchLoaderContext:
+    __slots__ = ("loader", "token")
+
+    def __init__(self, loader: BatchLoader) -> None:
+        self.loader = loader
+        self.token: Optional[Token] = None
+
+    def __enter__(self) -> BatchLoader:
+        self.token = current_batch_loader.set(self.loader)
+        return self.loader
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        current_batch_loader.reset(self.token)  # type: ignore
+
+    async def __aenter__(self) -> BatchLoader:
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.__exit__(exc_type, exc_val, exc_tb)
+
+
+def batch_loader(window: float = 0, max_batch_size: int = 1000) -> BatchLoaderContext:
+    """
+    Scope in which concurrent single object lookups by primary key are batched.
+
+    ``Model.get(pk=...)``, ``Model.get_or_none(pk=...)``, ``Model[pk]`` and awaiting a
+    foreign key made while it is active are collected per model and connection, and
+    loaded with one ``WHERE pk IN (...)`` query per batch:
+
+    .. code-block:: python3
+
+        async with batch_loader():
+            books = await asyncio.gather(*(Book.get(id=book_id) for book_id in book_ids))
+            authors = await asyncio.gather(*(book.author for book in books))
+
+    :param window: Seconds to wait for more lookups before running a batch,
+        ``0`` runs it on the next event loop iteration.
+    :param max_batch_size: Keys after which a batch is run immediately.
+    """
+    return BatchLoaderContext(BatchLoader(window, max_batch_size))
+
+
+def _is_loaded(instance: "Model", field: str) -> bool:
+    value = getattr(instance, f"_{field}", _MISSING)
+    if isinstance(value, ReverseRelation):
+        return value._fetched
+    return value is not _MISSING
+
+
+class RelationLoader:
+    """
+    Loads a relation for every instance of a result set at once.
+
+    Attached to each instance returned by a query with
+    :meth:`QuerySet.batch_lazy_load() <tortoise.queryset.QuerySet.batch_lazy_load>`:
+    the first time a relation that was not fetched is awaited on any of them, it is
+    fetched with ``fetch_for_list()`` for all instances that are still alive and have
+    not loaded it yet.
+    """
+
+    __slots__ = ("_instances", "db", "batches", "_loading")
+
+    def __init__(self, instances: List["Model"], db: "BaseDBAsyncClient") -> None:
+        # Weak, as every instance references the loader
+        self._instances = [weakref.ref(instance) for instance in instances]
+        self.db = db
+        #: Number of relations fetched for the result set
+        self.batches = 0
+        self._loading: Dict[str, asyncio.Future] = {}
+
+    @property
+    def instances(self) -> List["Model"]:
+        """
+        The instances of the result set that are still alive.
+        """
+        return [instance for instance in (ref() for ref in self._instances) if instance]
+
+    async def load(self, instance: "Model", field: str) -> Any:
+        """
+        Returns the related object, or the list of related objects, of ``instance``,
+        fetching the relation for the whole result set first if it is not loaded.
+        """
+        if not _is_loaded(instance, field):
+            future = self._loading.get(field)
+            if future is None or future.done():
+                future = self._loading[field] = asyncio.ensure_future(self._fetch(field))
+            # Shielded so one cancelled caller does not cancel the load for the others
+            await asyncio.shield(future)
+        value = getattr(instance, f"_{field}")
+        if isinstance(value, ReverseRelation):
+            return value.related_objects
+        return value
+
+    async def _fetch(self, field: str) -> None:
+        instances = [instance for instance in self.instances if not _is_loaded(instance, field)]
+        if instances:
+            self.batches += 1
+            await instances[0].fetch_for_list(instances, field, using_db=self.db)
+
+
+class RelationQuery:
+    """
+    Returned for a foreign key or a reverse one-to-one relation of an instance with a
+    :class:`RelationLoader`: awaiting it loads the relation through the loader, refining
+    it queries the related object of this instance alone.
+    """
+
+    __slots__ = ("loader", "instance", "field", "queryset")
+
+    def __init__(
+        self,
+        loader: RelationLoader,
+        instance: "Model",
+        field: str,
+        queryset: "QuerySetSingle[Optional[Model]]",
+    ) -> None:
+        self.loader = loader
+        self.instance = instance
+        self.field = field
+        self.queryset = queryset
+
+    def __await__(self) -> Generator[Any, None, Optional["Model"]]:
+        return self.loader.load(self.instance, self.field).__await__()
+
+    def prefetch_related(self, *args: Union[str, "Prefetch"]) -> "QuerySetSingle[Optional[Model]]":
+        return self.queryset.prefetch_related(*args)
+
+    def select_related(self, *args: str) -> "QuerySetSingle[Optional[Model]]":
+        return self.queryset.select_related(*args)
+
+    def annotate(self, **kwargs: "Function") -> "QuerySetSingle[Optional[Model]]":
+        return self.queryset.annotate(**kwargs)
+
+    def only(self, *fields_for_select: str) -> "QuerySetSingle[Optional[Model]]":
+        return self.queryset.only(*fields_for_select)
+
+    def values_list(self, *fields_: str, flat: bool = False) -> "ValuesListQuery[Literal[True]]":
+        return self.queryset.values_list(*fields_, flat=flat)
+
+    def values(self, *args: str, **kwargs: str) -> "ValuesQuery[Literal[True]]":
+        return self.queryset.values(*args, **kwargs)
+
+    def records(self, *fields_: str) -> "RecordsQuery[Literal[True]]":
+        return self.queryset.records(*fields_)
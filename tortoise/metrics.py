@@ -0,0 +1,244 @@
+"""
+Connection pool metrics.
+
+Every client records, per connection name, how long connections were waited for and held, and
+how long statements of a transaction waited for each other. :meth:`connections.stats()
+<tortoise.connection.ConnectionHandler.stats>` returns a snapshot of them, and observers
+registered with :func:`add_observer` receive every measurement as it is made.
+
+.. code-block:: python3
+
+    from tortoise import connections
+    from tortoise.metrics import add_observer
+
+    print(connections.stats()["default"]["acquire_wait"]["count"])
+
+    def observe(connection_name, metric, value):
+        if metric == "acquire_wait":
+            ACQUIRE_WAIT.labels(connection_name).observe(value)
+
+    add_observer(observe)
+"""
+
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Sequence
+
+from tortoise.instrumentation import add_timing, hooks
+from tortoise.log import logger
+
+#: Default upper bounds of histogram buckets, in seconds
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Observer = Callable[[str, str, float], None]
+
+#: Registered observers
+observers: List[Observer] = []
+
+
+def add_observer(observer: Observer) -> None:
+    """
+    Registers a function called with ``(connection_name, metric, value)`` for every
+    measurement, where metric is ``acquire_wait``, ``hold`` or ``lock_wait`` with a value in
+    seconds, or ``error``, ``rejected`` or ``retry`` with a value of 1.
+
+    Observers are called synchronously from the task using the connection, so they should be
+    quick. Exceptions raised by observers are logged and otherwise ignored.
+    """
+    if observer not in observers:
+        observers.append(observer)
+
+
+def remove_observer(observer: Observer) -> None:
+    """
+    Unregisters an observer registered with :func:`add_observer`.
+    """
+    if observer in observers:
+        observers.remove(observer)
+
+
+def _notify(connection_name: str, metric: str, value: float) -> None:
+    for observer in list(observers):
+        try:
+            observer(connection_name, metric, value)
+        except Exception:
+            logger.exception("Metrics observer %r failed", observer)
+
+
+class Histogram:
+    """
+    Histogram of durations, with fixed buckets.
+
+    :param buckets: Upper bounds of the buckets, in seconds, in ascending order.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Sequence[float] = BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        # The last count is for values above all buckets
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the histogram as a dict of ``count``, ``sum`` and ``buckets``, which maps the
+        upper bound of each bucket to the cumulative number of values up to it, as Prometheus
+        expects them.
+        """
+        buckets: Dict[float, int] = {}
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            buckets[bound] = cumulative
+        buckets[float("inf")] = self.count
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+class ConnectionStats:
+    """
+    Metrics of the connections of one connection name, shared by its transactions.
+    """
+
+    __slots__ = (
+        "connection_name",
+        "in_use",
+        "waiters",
+        "acquired",
+        "errors",
+        "rejected",
+        "retries",
+        "acquire_wait",
+        "hold",
+        "lock_wait",
+    )
+
+    def __init__(self, connection_name: str) -> None:
+        self.connection_name = connection_name
+        #: Connections currently acquired
+        self.in_use = 0
+        #: Tasks currently waiting to acquire a connection
+        self.waiters = 0
+        #: Total number of connections acquired
+        self.acquired = 0
+        #: Total number of acquisitions that failed
+        self.errors = 0
+        #: Total number of acquisitions shed before waiting
+        self.rejected = 0
+        #: Total number of transactions retried after a conflict
+        self.retries = 0
+        #: Seconds waited for a connection
+        self.acquire_wait = Histogram()
+        #: Seconds a connection was held for
+        self.hold = Histogram()
+        #: Seconds statements of a transaction waited for the transaction's connection
+        self.lock_wait = Histogram()
+
+    def acquiring(self) -> float:
+        """
+        Counts a waiter, and returns the time it started waiting.
+        """
+        self.waiters += 1
+        return time.perf_counter()
+
+    def acquire_done(self, started: float) -> float:
+        """
+        Records a connection acquired by a waiter, and returns the time it was acquired at.
+        """
+        now = time.perf_counter()
+        wait = now - started
+        self.waiters -= 1
+        self.in_use += 1
+        self.acquired += 1
+        self.acquire_wait.observe(wait)
+        if hooks:
+            add_timing("acquire", wait)
+        if observers:
+            _notify(self.connection_name, "acquire_wait", wait)
+        return now
+
+    def acquire_failed(self) -> None:
+        """
+        Records a waiter that failed to acquire a connection.
+        """
+        self.waiters -= 1
+        self.errors += 1
+        if observers:
+            _notify(self.connection_name, "error", 1)
+
+    def reject(self) -> None:
+        """
+        Records an acquisition shed before waiting.
+        """
+        self.rejected += 1
+        if observers:
+            _notify(self.connection_name, "rejected", 1)
+
+    def retried(self) -> None:
+        """
+        Records a transaction retried after a conflict.
+        """
+        self.retries += 1
+        if observers:
+            _notify(self.connection_name, "retry", 1)
+
+    def released(self, acquired: float) -> None:
+        """
+        Records a connection acquired at the given time being released.
+        """
+        held = time.perf_counter() - acquired
+        self.in_use -= 1
+        self.hold.observe(held)
+        if observers:
+            _notify(self.connection_name, "hold", held)
+
+    def lock_done(self, started: float) -> None:
+        """
+        Records the lock of a transaction acquired, waited for since the given time.
+        """
+        wait = time.perf_counter() - started
+        self.lock_wait.observe(wait)
+        if hooks:
+            add_timing("acquire", wait)
+        if observers:
+            _notify(self.connection_name, "lock_wait", wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "in_use": self.in_use,
+            "waiters": self.waiters,
+            "acquired": self.acquired,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "retries": self.retries,
+            "acquire_wait": self.acquire_wait.snapshot(),
+            "hold": self.hold.snapshot(),
+            "lock_wait": self.lock_wait.snapshot(),
+        }
+
+
+_stats: Dict[str, ConnectionStats] = {}
+
+
+def get_stats(connection_name: str) -> ConnectionStats:
+    """
+    Returns the metrics of a connection name, creating them if needed.
+    """
+    try:
+        return _stats[connection_name]
+    except KeyError:
+        stats = _stats[connection_name] = ConnectionStats(connection_name)
+        return stats
+
+
+def reset_stats() -> None:
+    """
+    Drops the metrics of all connection names.
+    """
+    _stats.clear()
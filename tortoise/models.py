@@ -1,6 +1,9 @@
+import ast
 import asyncio
 import inspect
+import linecache
 import re
+import sys
 from copy import copy, deepcopy
 from functools import partial
 from typing import (
@@ -17,6 +20,7 @@ from typing import (
     Type,
     TypeVar,
     Union,
+    cast,
 )
 
 from pypika import Order, Query, Table
@@ -25,6 +29,12 @@ from typing_extensions import Self
 
 from tortoise import connections
 from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.cache import (
+    ObjectCache,
+    current_identity_map,
+    discard_deleted,
+    invalidate_model,
+)
 from tortoise.exceptions import (
     ConfigurationError,
     DoesNotExist,
@@ -33,7 +43,7 @@ from tortoise.exceptions import (
     OperationalError,
     ParamsError,
 )
-from tortoise.fields.base import Field
+from tortoise.fields.base import CASCADE, SET_DEFAULT, SET_NULL, Field
 from tortoise.fields.data import IntField
 from tortoise.fields.relational import (
     BackwardFKRelation,
@@ -48,7 +58,9 @@ from tortoise.fields.relational import (
 from tortoise.filters import get_filters_for_field
 from tortoise.functions import Function
 from tortoise.indexes import Index
+from tortoise.loader import RelationLoader, RelationQuery
 from tortoise.manager import Manager
+from tortoise.query_utils import FilterKeyCache
 from tortoise.queryset import (
     BulkCreateQuery,
     BulkUpdateQuery,
@@ -108,7 +120,10 @@ def _fk_getter(
     except AttributeError:
         value = getattr(self, relation_field)
         if value is not None:
-            return ftype.filter(**{to_field: value}).first()
+            queryset = ftype.filter(**{to_field: value}).first()
+            if self._relation_loader is not None:
+                return RelationQuery(self._relation_loader, self, _key[1:], queryset)
+            return queryset
         return NoneAwaitable
 
 
@@ -117,7 +132,7 @@ def _rfk_getter(
 ) -> ReverseRelation:
     val = getattr(self, _key, None)
     if val is None:
-        val = ReverseRelation(ftype, frelfield, self, from_field)
+        val = ReverseRelation(ftype, frelfield, self, from_field, _key[1:])
         setattr(self, _key, val)
     return val
 
@@ -125,10 +140,14 @@ def _rfk_getter(
 def _ro2o_getter(
     self: "Model", _key: str, ftype: "Type[Model]", frelfield: str, from_field: str
 ) -> "QuerySetSingle[Optional[Model]]":
+    loader = self._relation_loader
     if hasattr(self, _key):
-        return getattr(self, _key)
-
+        val = getattr(self, _key)
+        if val is not None or loader is None:
+            return val
     val = ftype.filter(**{frelfield: getattr(self, from_field)}).first()
+    if loader is not None:
+        return RelationQuery(loader, self, _key[1:], val)
     setattr(self, _key, val)
     return val
 
@@ -143,6 +162,56 @@ def _m2m_getter(
     return val
 
 
+# Source lines of each module file, and the line range of each class in it by qualified name
+_CLASS_SOURCES: Dict[str, Tuple[List[str], Dict[str, Tuple[int, int]]]] = {}
+
+
+def _index_classes(tree: ast.AST) -> Dict[str, Tuple[int, int]]:
+    classes: Dict[str, Tuple[int, int]] = {}
+
+    def visit(node: ast.AST, prefix: str) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                qualname = prefix + child.name
+                start = min([child.lineno] + [d.lineno for d in child.decorator_list])
+                classes.setdefault(qualname, (start, child.end_lineno or child.lineno))
+                visit(child, qualname + ".")
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                visit(child, prefix + child.name + ".<locals>.")
+            else:
+                visit(child, prefix)
+
+    visit(tree, "")
+    return classes
+
+
+def _get_class_source(cls: type) -> str:
+    """
+    Returns the source of a class like ``inspect.getsource()``, but parses each module only
+    once instead of once per class.
+    """
+    filename = inspect.getsourcefile(cls)
+    if filename is None:
+        return inspect.getsource(cls)
+    module = sys.modules.get(cls.__module__)
+    # Like inspect.getsource(), drops the lines cached for a file changed since, e.g. when
+    # its module is reloaded, which makes linecache return new lines
+    linecache.checkcache(filename)
+    lines = linecache.getlines(filename, module.__dict__ if module else None)
+    entry = _CLASS_SOURCES.get(filename)
+    if entry is None or entry[0] is not lines:
+        try:
+            classes = _index_classes(ast.parse("".join(lines)))
+        except (SyntaxError, ValueError):  # pragma: nocoverage
+            classes = {}
+        entry = _CLASS_SOURCES[filename] = (lines, classes)
+    classes = entry[1]
+    span = classes.get(cls.__qualname__)
+    if span is None:
+        return inspect.getsource(cls)
+    return "".join(lines[span[0] - 1 : span[1]])
+
+
 def _get_comments(cls: "Type[Model]") -> Dict[str, str]:
     """
     Get comments exactly before attributes
@@ -155,7 +224,7 @@ def _get_comments(cls: "Type[Model]") -> Dict[str, str]:
     :return: The dictionary of comments by field name
     """
     try:
-        source = inspect.getsource(cls)
+        source = _get_class_source(cls)
     except (TypeError, OSError):  # pragma: nocoverage
         return {}
     comments = {}
@@ -212,6 +281,10 @@ class MetaInfo:
         "db_complex_fields",
         "_default_ordering",
         "_ordering_validated",
+        "filter_cache",
+        "record_classes",
+        "object_cache",
+        "_delete_cascade",
     )
 
     def __init__(self, meta: "Model.Meta") -> None:
@@ -251,11 +324,70 @@ class MetaInfo:
         self.db_native_fields: List[Tuple[str, str, Field]] = []
         self.db_default_fields: List[Tuple[str, str, Field]] = []
         self.db_complex_fields: List[Tuple[str, str, Field]] = []
+        self.filter_cache: FilterKeyCache = FilterKeyCache(self)
+        self.record_classes: Dict[Tuple[str, ...], Type[tuple]] = {}
+        object_cache_size: int = getattr(meta, "object_cache_size", 0)
+        self.object_cache: Optional[ObjectCache] = (
+            ObjectCache(self, object_cache_size, getattr(meta, "object_cache_ttl", None))
+            if object_cache_size
+            else None
+        )
+        self._delete_cascade: Optional[Tuple[Tuple[str, ...], Tuple[MetaInfo, ...]]] = None
 
     @property
     def full_name(self) -> str:
         return f"{self.app}.{self._model.__name__}"
 
+    @property
+    def delete_tables(self) -> Tuple[str, ...]:
+        """
+        Tables whose rows change when rows of this model are deleted: its own, its m2m
+        through tables, and those the database cascades the delete to through ``CASCADE``
+        (recursively), ``SET_NULL`` or ``SET_DEFAULT`` foreign keys.
+        """
+        return self._get_delete_cascade()[0]
+
+    @property
+    def delete_related(self) -> Tuple["MetaInfo", ...]:
+        """
+        The other models whose rows the database changes when rows of this model are
+        deleted, see :attr:`delete_tables`.
+        """
+        return self._get_delete_cascade()[1]
+
+    def _get_delete_cascade(self) -> Tuple[Tuple[str, ...], Tuple["MetaInfo", ...]]:
+        if self._delete_cascade is None:
+            tables: Dict[str, None] = {}
+            related: Dict[MetaInfo, None] = {}
+            self._collect_delete_cascade(tables, related, set())
+            related.pop(self, None)
+            self._delete_cascade = (tuple(tables), tuple(related))
+        return self._delete_cascade
+
+    def _collect_delete_cascade(
+        self, tables: Dict[str, None], related: Dict["MetaInfo", None], deleted: Set["MetaInfo"]
+    ) -> None:
+        from tortoise import Tortoise
+
+        deleted.add(self)
+        tables[self.db_table] = None
+        related[self] = None
+        for name in self.m2m_fields:
+            tables[cast(ManyToManyFieldInstance, self.fields_map[name]).through] = None
+        for models in Tortoise.apps.values():
+            for model in models.values():
+                meta = model._meta
+                for name in meta.fk_fields | meta.o2o_fields:
+                    field = cast(ForeignKeyFieldInstance, meta.fields_map[name])
+                    if field.related_model is not self._model:
+                        continue
+                    if field.on_delete == CASCADE:
+                        if meta not in deleted:
+                            meta._collect_delete_cascade(tables, related, deleted)
+                    elif field.on_delete in (SET_NULL, SET_DEFAULT):
+                        tables[meta.db_table] = None
+                        related[meta] = None
+
     def add_field(self, name: str, value: Field) -> None:
         if name in self.fields_map:
             raise ConfigurationError(f"Field {name} already present in meta")
@@ -310,6 +442,11 @@ class MetaInfo:
         self._generate_db_fields()
 
     def finalise_fields(self) -> None:
+        self.filter_cache.clear()
+        self.record_classes.clear()
+        if self.object_cache is not None:
+            self.object_cache.clear()
+        self._delete_cascade = None
         self.db_fields = set(self.fields_db_projection.values())
         self.fields = set(self.fields_map.keys())
         self.fields_db_projection_reverse = {
@@ -473,6 +610,7 @@ class MetaInfo:
                 self.db_default_fields.append((key, model_field, field))
 
     def _generate_filters(self) -> None:
+        self.filter_cache.clear()
         get_overridden_filter_func = self.db.executor_class.get_overridden_filter_func
         for key, filter_info in self._filters.items():
             overridden_operator = get_overridden_filter_func(
@@ -659,6 +797,8 @@ class Model(metaclass=ModelMeta):
         Signals.pre_delete: {},
         Signals.post_delete: {},
     }
+    # Set on instances returned by a query with .batch_lazy_load()
+    _relation_loader: Optional["RelationLoader"] = None
 
     def __init__(self, **kwargs: Any) -> None:
         # self._meta is a very common attribute lookup, lets cache it.
@@ -724,6 +864,14 @@ class Model(metaclass=ModelMeta):
 
     @classmethod
     def _init_from_db(cls: Type[MODEL], **kwargs: Any) -> MODEL:
+        identity_map = current_identity_map.get()
+        if identity_map is not None:
+            pk_value = kwargs.get(cls._meta.db_pk_column)
+            if pk_value is not None:
+                instance = identity_map.get(cls, cls._meta.pk.to_python_value(pk_value))
+                if instance is not None:
+                    return instance
+
         self = cls.__new__(cls)
         self._partial = False
         self._saved_in_db = True
@@ -757,6 +905,8 @@ class Model(metaclass=ModelMeta):
             for key, value in kwargs.items():
                 setattr(self, key, meta.fields_map[key].to_python_value(value))
 
+        if identity_map is not None and not self._partial:
+            identity_map.add(self)
         return self
 
     def __str__(self) -> str:
@@ -779,6 +929,12 @@ class Model(metaclass=ModelMeta):
     def __eq__(self, other: object) -> bool:
         return type(other) is type(self) and self.pk == other.pk  # type: ignore
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # Bound to the connection and result set the instance was loaded with
+        state.pop("_relation_loader", None)
+        return state
+
     def _get_pk_val(self) -> Any:
         return getattr(self, self._meta.pk_attr)
 
@@ -883,6 +1039,8 @@ class Model(metaclass=ModelMeta):
         using_db: Optional[BaseDBAsyncClient] = None,
     ) -> None:
         listeners = []
+        await invalidate_model(using_db or self._choose_db(True), self._meta, self.pk, delete=True)
+        discard_deleted(self._meta, self)
         cls_listeners = self._listeners.get(Signals.post_delete, {}).get(self.__class__, [])
         for listener in cls_listeners:
             listeners.append(
@@ -912,6 +1070,7 @@ class Model(metaclass=ModelMeta):
         update_fields: Optional[Iterable[str]] = None,
     ) -> None:
         listeners = []
+        await invalidate_model(using_db or self._choose_db(True), self._meta, self.pk)
         cls_listeners = self._listeners.get(Signals.post_save, {}).get(self.__class__, [])
         for listener in cls_listeners:
             listeners.append(listener(self.__class__, self, created, using_db, update_fields))
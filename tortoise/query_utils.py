@@ -1,7 +1,18 @@
 from __future__ import annotations
 
 from copy import copy
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
 
 from pypika import Table
 from pypika.terms import Criterion
@@ -14,6 +25,8 @@ from tortoise.fields.relational import (
 )
 
 if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.fields.base import Field
+    from tortoise.models import MetaInfo, Model
     from tortoise.queryset import QuerySet
 
 
@@ -75,6 +88,166 @@ def _get_joins_for_related_field(
     return required_joins
 
 
+class ResolvedFilterKey:
+    """
+    The parsed form of a single filter key (e.g. ``author__name__in``) for one model.
+
+    Everything in here only depends on the model definition, so it is computed once per
+    key and memoised in :class:`FilterKeyCache`.
+    """
+
+    __slots__ = (
+        "filter_key",
+        "unwrap_pk",
+        "known",
+        "related_field_name",
+        "related_field",
+        "forwarded_fields",
+        "param",
+        "field_object",
+        "isnull_param",
+        "isnull_field_object",
+        "field_to_db",
+        "wrapper_cls",
+        "_joins",
+    )
+
+    #: Encodes a filter value for the database, only set for keys with a field object
+    field_to_db: "Callable[[Field, Any, Type[Model]], Any]"
+    #: Wraps an encoded value for equality comparisons, set along with ``field_to_db``
+    wrapper_cls: Callable[[Any], Any]
+
+    def __init__(self, meta: "MetaInfo", key: str) -> None:
+        #: The key the filter is applied with, FK names are replaced with their source field
+        self.filter_key = key
+        #: Should model instances passed as value be replaced with their ``pk``
+        self.unwrap_pk = False
+        #: Is the key known to the model, or must it be provided as a custom filter
+        self.known = True
+        self.related_field_name: Optional[str] = None
+        self.related_field: Optional[RelationalField] = None
+        self.forwarded_fields = ""
+        self.param: Optional[dict] = None
+        self.field_object: "Optional[Field]" = None
+        self.isnull_param: Optional[dict] = None
+        self.isnull_field_object: "Optional[Field]" = None
+        self._joins: Dict[Table, List[TableCriterionTuple]] = {}
+
+        if key in meta.fk_fields or key in meta.o2o_fields:
+            self.filter_key = cast(str, meta.fields_map[key].source_field)
+            self.unwrap_pk = True
+        elif key in meta.m2m_fields:
+            self.unwrap_pk = True
+        elif key.split("__")[0] not in meta.fetch_fields and key not in meta.filters:
+            self.known = False
+            return
+
+        filter_key = self.filter_key
+        related_field_name, __, forwarded_fields = filter_key.partition("__")
+        if filter_key not in meta.filters and related_field_name in meta.fetch_fields:
+            self.related_field_name = related_field_name
+            self.related_field = cast(RelationalField, meta.fields_map[related_field_name])
+            self.forwarded_fields = forwarded_fields
+            return
+
+        self.param = meta.filters.get(filter_key)
+        self.isnull_param = meta.filters.get(f"{filter_key}__isnull")
+        self.field_object = self._get_field_object(meta, self.param)
+        self.isnull_field_object = self._get_field_object(meta, self.isnull_param)
+        if self.field_object is not None or self.isnull_field_object is not None:
+            db = meta.db
+            self.field_to_db = db.executor_class._field_to_db
+            self.wrapper_cls = db.query_class._builder()._wrapper_cls
+
+    def get_joins(self, table: Table) -> List[TableCriterionTuple]:
+        """
+        Returns the joins needed to filter on the related field from the given table.
+
+        They only depend on the table (and its alias), so are memoised per table.
+        """
+        try:
+            return self._joins[table]
+        except KeyError:
+            joins = _get_joins_for_related_field(
+                table, cast(RelationalField, self.related_field), cast(str, self.related_field_name)
+            )
+            self._joins[table] = joins
+            return joins
+
+    @staticmethod
+    def _get_field_object(meta: "MetaInfo", param: Optional[dict]) -> "Optional[Field]":
+        if param is None or param.get("table"):
+            return None
+        return meta.fields_map[param["field"]]
+
+
+class FilterKeyCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class FilterKeyCache:
+    """
+    Per-model memo of filter key → :class:`ResolvedFilterKey`.
+
+    Repeated filter shapes (which is the common case) then only cost a dict lookup instead
+    of re-parsing the key and walking the model meta on every query.
+
+    Use :meth:`cache_info` to check the hit rate when tuning ``maxsize``.
+
+    :param meta: The model meta to resolve keys against.
+    :param maxsize: Maximum number of keys to keep, keys past this are resolved uncached.
+    """
+
+    __slots__ = ("_meta", "_entries", "maxsize", "hits", "misses")
+
+    def __init__(self, meta: "MetaInfo", maxsize: int = 1024) -> None:
+        self._meta = meta
+        self._entries: Dict[str, ResolvedFilterKey] = {}
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> ResolvedFilterKey:
+        """
+        Returns the resolved form of the given filter key, parsing it on first use.
+        """
+        try:
+            resolved = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            resolved = ResolvedFilterKey(self._meta, key)
+            if len(self._entries) < self.maxsize:
+                self._entries[key] = resolved
+            return resolved
+        self.hits += 1
+        return resolved
+
+    def clear(self) -> None:
+        """
+        Drops all memoised keys and resets the statistics.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Ratio of lookups served from the cache, ``0.0`` if there were no lookups yet.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def cache_info(self) -> FilterKeyCacheInfo:
+        """
+        Returns the cache statistics, in the style of ``functools.lru_cache``.
+        """
+        return FilterKeyCacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
 class EmptyCriterion(Criterion):  # type:ignore[misc]
     def __or__(self, other: Criterion) -> Criterion:
         return other
@@ -156,7 +329,8 @@ class Prefetch:
     for specialised prefetching.
 
     :param relation: Related field name.
-    :param queryset: Custom QuerySet to use for prefetching.
+    :param queryset: Custom QuerySet to use for prefetching. For reverse foreign key and
+        many-to-many relations its ``limit()`` and ``offset()`` apply per instance.
     :param to_attr: Sets the result of the prefetch operation to a custom attribute.
     """
 
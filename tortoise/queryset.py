@@ -1,9 +1,13 @@
+import importlib.util
 import types
+from array import array
+from collections import namedtuple
 from copy import copy
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncIterator,
+    Awaitable,
     Callable,
     Dict,
     Generator,
@@ -11,6 +15,7 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -27,8 +32,15 @@ from pypika.queries import QueryBuilder
 from pypika.terms import Case, Field, Term, ValueWrapper
 from typing_extensions import Literal, Protocol
 
-from tortoise.backends.base.client import BaseDBAsyncClient, Capabilities
+from tortoise.backends.base.client import (
+    BaseDBAsyncClient,
+    BaseTransactionWrapper,
+    Capabilities,
+    query_timeout,
+)
+from tortoise.cache import ObjectCache, discard_deleted, invalidate_model, query_cache
 from tortoise.exceptions import (
+    ConfigurationError,
     DoesNotExist,
     FieldError,
     IntegrityError,
@@ -42,6 +54,8 @@ from tortoise.fields.relational import (
     RelationalField,
 )
 from tortoise.functions import Function
+from tortoise.instrumentation import hooks, instrument_query
+from tortoise.loader import BatchLoader, RelationLoader, current_batch_loader
 from tortoise.query_utils import Prefetch, QueryModifier, _get_joins_for_related_field
 from tortoise.router import router
 from tortoise.utils import chunk
@@ -51,11 +65,16 @@ from tortoise.utils import chunk
 QUERY: QueryBuilder = QueryBuilder()
 
 if TYPE_CHECKING:  # pragma: nocoverage
+    from os import PathLike
+
+    from tortoise.contrib.arrow import ArrowQuery
+    from tortoise.fields.base import Field
     from tortoise.models import Model
 
 MODEL = TypeVar("MODEL", bound="Model")
 T_co = TypeVar("T_co", covariant=True)
 SINGLE = TypeVar("SINGLE", bound=bool)
+QUERY_T = TypeVar("QUERY_T", bound="AwaitableQuery")
 
 
 class QuerySetSingle(Protocol[T_co]):
@@ -84,8 +103,13 @@ class QuerySetSingle(Protocol[T_co]):
         self, *args: str, **kwargs: str
     ) -> "ValuesQuery[Literal[True]]": ...  # pragma: nocoverage
 
+    def records(self, *fields_: str) -> "RecordsQuery[Literal[True]]": ...  # pragma: nocoverage
+
 
 class AwaitableQuery(Generic[MODEL]):
+    #: Operation reported to instrumentation hooks
+    _operation = "select"
+
     __slots__ = (
         "_joined_tables",
         "query",
@@ -93,6 +117,7 @@ class AwaitableQuery(Generic[MODEL]):
         "_db",
         "capabilities",
         "_annotations",
+        "_timeout",
     )
 
     def __init__(self, model: Type[MODEL]) -> None:
@@ -102,6 +127,7 @@ class AwaitableQuery(Generic[MODEL]):
         self._db: BaseDBAsyncClient = None  # type: ignore
         self.capabilities: Capabilities = model._meta.db.capabilities
         self._annotations: Dict[str, Expression] = {}
+        self._timeout: Optional[float] = None
 
     def _choose_db(self, for_write: bool = False) -> BaseDBAsyncClient:
         """
@@ -258,6 +284,20 @@ class AwaitableQuery(Generic[MODEL]):
 
         return any(info["field"].is_aggregate for info in annotation_info.values())
 
+    def timeout(self: QUERY_T, seconds: Optional[float]) -> QUERY_T:
+        """
+        Cancel each statement of this query that runs longer than the given seconds,
+        raising :class:`~tortoise.exceptions.QueryTimeoutError`.
+
+        Overrides the ``query_timeout`` of the connection, ``None`` uses it.
+
+        :raises ParamsError: Timeout should be a positive number.
+        """
+        if seconds is not None and seconds <= 0:
+            raise ParamsError("Timeout should be a positive number")
+        self._timeout = seconds
+        return self
+
     def sql(self, **kwargs) -> str:
         """Return the actual SQL."""
         return self.as_query().get_sql(**kwargs)
@@ -275,6 +315,49 @@ class AwaitableQuery(Generic[MODEL]):
     async def _execute(self) -> Any:
         raise NotImplementedError()  # pragma: nocoverage
 
+    def _make_and_execute(self, *args: Any) -> Generator[Any, None, Any]:
+        """
+        Builds and executes the query, reporting it to the instrumentation hooks if any.
+        """
+        execute: Callable[..., Awaitable[Any]] = self._execute
+        if self._timeout is not None:
+            execute = self._execute_with_timeout
+        if hooks:
+            return instrument_query(
+                self._db,
+                self.model,
+                self._operation,
+                self._make_query,
+                lambda: execute(*args),
+            ).__await__()
+        self._make_query()
+        return execute(*args).__await__()
+
+    async def _execute_with_timeout(self, *args: Any) -> Any:
+        token = query_timeout.set(self._timeout)
+        try:
+            return await self._execute(*args)
+        finally:
+            query_timeout.reset(token)
+
+    def _derive(self, query: "QUERY_T") -> "QUERY_T":
+        """
+        Returns a query built from this one, with its timeout.
+        """
+        query._timeout = self._timeout
+        return query
+
+    async def _invalidate_caches(self, delete: bool = False) -> None:
+        """
+        Drops cached results and rows of the model after rows were written in bulk.
+
+        :param delete: Whether rows were deleted, which also invalidates the tables the
+            delete cascades to.
+        """
+        await invalidate_model(self._db, self.model._meta, delete=delete)
+        if delete:
+            discard_deleted(self.model._meta)
+
 
 class QuerySet(AwaitableQuery[MODEL]):
     __slots__ = (
@@ -302,6 +385,9 @@ class QuerySet(AwaitableQuery[MODEL]):
         "_select_related_idx",
         "_use_indexes",
         "_force_indexes",
+        "_use_cache",
+        "_cache_ttl",
+        "_batch_lazy_load",
     )
 
     def __init__(self, model: Type[MODEL]) -> None:
@@ -331,30 +417,36 @@ class QuerySet(AwaitableQuery[MODEL]):
         ] = []  # format with: model,idx,model_name,parent_model
         self._force_indexes: Set[str] = set()
         self._use_indexes: Set[str] = set()
+        self._use_cache: bool = False
+        self._cache_ttl: Optional[float] = None
+        self._batch_lazy_load: bool = False
 
     def _clone(self) -> "QuerySet[MODEL]":
+        # Containers are shared with the clone and treated as immutable (copy-on-write):
+        # every method that changes one of them assigns a new container instead of
+        # mutating the existing one, so a clone costs O(1) and not a copy per container.
         queryset = self.__class__.__new__(self.__class__)
         queryset.fields = self.fields
         queryset.model = self.model
         queryset.query = self.query
         queryset.capabilities = self.capabilities
-        queryset._prefetch_map = copy(self._prefetch_map)
-        queryset._prefetch_queries = copy(self._prefetch_queries)
+        queryset._prefetch_map = self._prefetch_map
+        queryset._prefetch_queries = self._prefetch_queries
         queryset._single = self._single
         queryset._raise_does_not_exist = self._raise_does_not_exist
         queryset._db = self._db
         queryset._limit = self._limit
         queryset._offset = self._offset
         queryset._fields_for_select = self._fields_for_select
-        queryset._filter_kwargs = copy(self._filter_kwargs)
-        queryset._orderings = copy(self._orderings)
-        queryset._joined_tables = copy(self._joined_tables)
-        queryset._q_objects = copy(self._q_objects)
+        queryset._filter_kwargs = self._filter_kwargs
+        queryset._orderings = self._orderings
+        queryset._joined_tables = self._joined_tables
+        queryset._q_objects = self._q_objects
         queryset._distinct = self._distinct
-        queryset._annotations = copy(self._annotations)
-        queryset._having = copy(self._having)
-        queryset._custom_filters = copy(self._custom_filters)
-        queryset._group_bys = copy(self._group_bys)
+        queryset._annotations = self._annotations
+        queryset._having = self._having
+        queryset._custom_filters = self._custom_filters
+        queryset._group_bys = self._group_bys
         queryset._select_for_update = self._select_for_update
         queryset._select_for_update_nowait = self._select_for_update_nowait
         queryset._select_for_update_skip_locked = self._select_for_update_skip_locked
@@ -363,24 +455,30 @@ class QuerySet(AwaitableQuery[MODEL]):
         queryset._select_related_idx = self._select_related_idx
         queryset._force_indexes = self._force_indexes
         queryset._use_indexes = self._use_indexes
+        queryset._use_cache = self._use_cache
+        queryset._cache_ttl = self._cache_ttl
+        queryset._batch_lazy_load = self._batch_lazy_load
+        queryset._timeout = self._timeout
         return queryset
 
     def _filter_or_exclude(self, *args: Q, negate: bool, **kwargs: Any) -> "QuerySet[MODEL]":
         queryset = self._clone()
+        q_objects = list(self._q_objects)
         for arg in args:
             if not isinstance(arg, Q):
                 raise TypeError("expected Q objects as args")
             if negate:
-                queryset._q_objects.append(~arg)
+                q_objects.append(~arg)
             else:
-                queryset._q_objects.append(arg)
+                q_objects.append(arg)
 
         for key, value in kwargs.items():
             if negate:
-                queryset._q_objects.append(~Q(**{key: value}))
+                q_objects.append(~Q(**{key: value}))
             else:
-                queryset._q_objects.append(Q(**{key: value}))
+                q_objects.append(Q(**{key: value}))
 
+        queryset._q_objects = q_objects
         return queryset
 
     def filter(self, *args: Q, **kwargs: Any) -> "QuerySet[MODEL]":
@@ -527,11 +625,13 @@ class QuerySet(AwaitableQuery[MODEL]):
         from tortoise.models import get_filters_for_field
 
         queryset = self._clone()
+        queryset._annotations = annotations = dict(self._annotations)
+        queryset._custom_filters = custom_filters = dict(self._custom_filters)
         for key, annotation in kwargs.items():
             # if not isinstance(annotation, (Function, Term)):
             #     raise TypeError("value is expected to be Function/Term instance")
-            queryset._annotations[key] = annotation
-            queryset._custom_filters.update(get_filters_for_field(key, None, key))
+            annotations[key] = annotation
+            custom_filters.update(get_filters_for_field(key, None, key))
         return queryset
 
     def group_by(self, *fields: str) -> "QuerySet[MODEL]":
@@ -555,7 +655,7 @@ class QuerySet(AwaitableQuery[MODEL]):
         If no arguments are passed it will default to a tuple containing all fields
         in order of declaration.
         """
-        return ValuesListQuery(
+        query = ValuesListQuery(
             db=self._db,
             model=self.model,
             q_objects=self._q_objects,
@@ -579,6 +679,7 @@ class QuerySet(AwaitableQuery[MODEL]):
             force_indexes=self._force_indexes,
             use_indexes=self._use_indexes,
         )
+        return self._derive(query)
 
     def values(self, *args: str, **kwargs: str) -> "ValuesQuery[Literal[False]]":
         """
@@ -612,7 +713,7 @@ class QuerySet(AwaitableQuery[MODEL]):
 
             fields_for_select = {field: field for field in _fields}
 
-        return ValuesQuery(
+        query: "ValuesQuery[Literal[False]]" = ValuesQuery(
             db=self._db,
             model=self.model,
             q_objects=self._q_objects,
@@ -629,12 +730,134 @@ class QuerySet(AwaitableQuery[MODEL]):
             force_indexes=self._force_indexes,
             use_indexes=self._use_indexes,
         )
+        return self._derive(query)
+
+    def values_columns(self, *fields_: str, numpy: bool = False) -> "ValuesColumnsQuery":
+        """
+        Make QuerySet return a dict of ``{field: sequence of values}``, one entry per column,
+        instead of objects.
+
+        No per-row tuples or dicts are built, each column is converted in one go.
+        Integer and float columns are returned as ``array.array``
+        (or as NumPy arrays if ``numpy=True``), other columns, and numeric columns that
+        contain ``NULL``, as lists.
+
+        If no arguments are passed it will default to all fields in order of declaration.
+
+        :param numpy: Return numeric columns as ``numpy.ndarray``.
+
+        :raises ConfigurationError: If ``numpy=True`` but NumPy is not installed.
+        """
+        if numpy and importlib.util.find_spec("numpy") is None:
+            raise ConfigurationError("values_columns(numpy=True) requires NumPy to be installed")
+        query = ValuesColumnsQuery(
+            db=self._db,
+            model=self.model,
+            q_objects=self._q_objects,
+            single=False,
+            raise_does_not_exist=False,
+            flat=False,
+            fields_for_select_list=fields_
+            or [
+                field
+                for field in self.model._meta.fields_map.keys()
+                if field in self.model._meta.db_fields
+            ]
+            + list(self._annotations.keys()),
+            distinct=self._distinct,
+            limit=self._limit,
+            offset=self._offset,
+            orderings=self._orderings,
+            annotations=self._annotations,
+            custom_filters=self._custom_filters,
+            group_bys=self._group_bys,
+            force_indexes=self._force_indexes,
+            use_indexes=self._use_indexes,
+            use_numpy=numpy,
+        )
+        return self._derive(query)
+
+    def records(self, *fields_: str) -> "RecordsQuery[Literal[False]]":
+        """
+        Make QuerySet return lightweight read-only records instead of objects.
+
+        Records are instances of a ``namedtuple`` generated once per model and set of fields,
+        so they support attribute access and ``._asdict()``, and can be validated by pydantic
+        models with ``from_attributes=True``. Values are converted like model fields, but no
+        ``Model`` instance is built per row.
+
+        If call after `.get()`, `.get_or_none()` or `.first()` return a record instead of object.
+
+        If no arguments are passed it will default to all fields in order of declaration.
+        """
+        query = RecordsQuery(
+            db=self._db,
+            model=self.model,
+            q_objects=self._q_objects,
+            single=self._single,
+            raise_does_not_exist=self._raise_does_not_exist,
+            flat=False,
+            fields_for_select_list=fields_  # type: ignore
+            or [
+                field
+                for field in self.model._meta.fields_map.keys()
+                if field in self.model._meta.db_fields
+            ]
+            + list(self._annotations.keys()),
+            distinct=self._distinct,
+            limit=self._limit,
+            offset=self._offset,
+            orderings=self._orderings,
+            annotations=self._annotations,
+            custom_filters=self._custom_filters,
+            group_bys=self._group_bys,
+            force_indexes=self._force_indexes,
+            use_indexes=self._use_indexes,
+        )
+        return self._derive(query)
+
+    def to_arrow(self, *fields_: str, batch_size: Optional[int] = None) -> "ArrowQuery":
+        """
+        Export the QuerySet to Apache Arrow.
+
+        Await the result to get a ``pyarrow.Table``, or iterate it with ``async for`` to get
+        ``pyarrow.RecordBatch`` objects of at most ``batch_size`` rows, fetched one query
+        per batch. The schema is derived from the field types.
+
+        If no arguments are passed it will default to all fields in order of declaration.
+
+        :param batch_size: Rows per batch, or ``None`` to fetch everything in one query.
+
+        :raises ConfigurationError: If pyarrow is not installed.
+        """
+        if importlib.util.find_spec("pyarrow") is None:
+            raise ConfigurationError("to_arrow() requires pyarrow to be installed")
+        from tortoise.contrib.arrow import ArrowQuery
+
+        return ArrowQuery(self, fields_, batch_size)
+
+    async def to_parquet(
+        self, path: "Union[str, PathLike]", *fields_: str, batch_size: int = 65536, **kwargs: Any
+    ) -> int:
+        """
+        Stream the QuerySet into a Parquet file, one batch at a time.
+
+        Extra keyword arguments are passed to ``pyarrow.parquet.ParquetWriter``.
+
+        :param path: Path of the Parquet file to write.
+        :param batch_size: Rows fetched and written per batch.
+
+        :return: The number of rows written.
+
+        :raises ConfigurationError: If pyarrow is not installed.
+        """
+        return await self.to_arrow(*fields_, batch_size=batch_size).to_parquet(path, **kwargs)
 
     def delete(self) -> "DeleteQuery":
         """
         Delete all objects in QuerySet.
         """
-        return DeleteQuery(
+        query = DeleteQuery(
             db=self._db,
             model=self.model,
             q_objects=self._q_objects,
@@ -643,6 +866,7 @@ class QuerySet(AwaitableQuery[MODEL]):
             limit=self._limit,
             orderings=self._orderings,
         )
+        return self._derive(query)
 
     def update(self, **kwargs: Any) -> "UpdateQuery":
         """
@@ -656,7 +880,7 @@ class QuerySet(AwaitableQuery[MODEL]):
 
         Will instead of returning a resultset, update the data in the DB itself.
         """
-        return UpdateQuery(
+        query = UpdateQuery(
             db=self._db,
             model=self.model,
             update_kwargs=kwargs,
@@ -666,12 +890,13 @@ class QuerySet(AwaitableQuery[MODEL]):
             limit=self._limit,
             orderings=self._orderings,
         )
+        return self._derive(query)
 
     def count(self) -> "CountQuery":
         """
         Return count of objects in queryset instead of objects.
         """
-        return CountQuery(
+        query = CountQuery(
             db=self._db,
             model=self.model,
             q_objects=self._q_objects,
@@ -682,12 +907,13 @@ class QuerySet(AwaitableQuery[MODEL]):
             force_indexes=self._force_indexes,
             use_indexes=self._use_indexes,
         )
+        return self._derive(query)
 
     def exists(self) -> "ExistsQuery":
         """
         Return True/False whether queryset exists.
         """
-        return ExistsQuery(
+        query = ExistsQuery(
             db=self._db,
             model=self.model,
             q_objects=self._q_objects,
@@ -696,6 +922,7 @@ class QuerySet(AwaitableQuery[MODEL]):
             force_indexes=self._force_indexes,
             use_indexes=self._use_indexes,
         )
+        return self._derive(query)
 
     def all(self) -> "QuerySet[MODEL]":
         """
@@ -708,7 +935,7 @@ class QuerySet(AwaitableQuery[MODEL]):
         """
         Return the QuerySet from raw SQL
         """
-        return RawSQLQuery(model=self.model, db=self._db, sql=sql)
+        return self._derive(RawSQLQuery(model=self.model, db=self._db, sql=sql))
 
     def first(self) -> QuerySetSingle[Optional[MODEL]]:
         """
@@ -769,7 +996,7 @@ class QuerySet(AwaitableQuery[MODEL]):
         if not ignore_conflicts:
             if (update_fields and not on_conflict) or (on_conflict and not update_fields):
                 raise ValueError("update_fields and on_conflict need set in same time.")
-        return BulkCreateQuery(
+        query = BulkCreateQuery(
             db=self._db,
             model=self.model,
             objects=objects,
@@ -778,6 +1005,7 @@ class QuerySet(AwaitableQuery[MODEL]):
             update_fields=update_fields,
             on_conflict=on_conflict,
         )
+        return self._derive(query)
 
     def bulk_update(
         self,
@@ -796,7 +1024,7 @@ class QuerySet(AwaitableQuery[MODEL]):
         """
         if any(obj.pk is None for obj in objects):
             raise ValueError("All bulk_update() objects must have a primary key set.")
-        return BulkUpdateQuery(
+        query = BulkUpdateQuery(
             db=self._db,
             model=self.model,
             q_objects=self._q_objects,
@@ -808,6 +1036,7 @@ class QuerySet(AwaitableQuery[MODEL]):
             fields=fields,
             batch_size=batch_size,
         )
+        return self._derive(query)
 
     def get_or_none(self, *args: Q, **kwargs: Any) -> QuerySetSingle[Optional[MODEL]]:
         """
@@ -849,8 +1078,7 @@ class QuerySet(AwaitableQuery[MODEL]):
         """
 
         queryset = self._clone()
-        for field in fields:
-            queryset._select_related.add(field)
+        queryset._select_related = {*self._select_related, *fields}
         return queryset
 
     def force_index(self, *index_names: str) -> "QuerySet[MODEL]":
@@ -860,8 +1088,7 @@ class QuerySet(AwaitableQuery[MODEL]):
         """
         if self.capabilities.support_index_hint:
             queryset = self._clone()
-            for index_name in index_names:
-                queryset._force_indexes.add(index_name)
+            queryset._force_indexes = {*self._force_indexes, *index_names}
             return queryset
         return self
 
@@ -871,8 +1098,7 @@ class QuerySet(AwaitableQuery[MODEL]):
         """
         if self.capabilities.support_index_hint:
             queryset = self._clone()
-            for index_name in index_names:
-                queryset._use_indexes.add(index_name)
+            queryset._use_indexes = {*self._use_indexes, *index_names}
             return queryset
         return self
 
@@ -884,6 +1110,10 @@ class QuerySet(AwaitableQuery[MODEL]):
         """
         queryset = self._clone()
         queryset._prefetch_map = {}
+        # Prefetch objects append to these lists, so they have to be owned by the clone
+        queryset._prefetch_queries = {
+            field: list(queries) for field, queries in self._prefetch_queries.items()
+        }
 
         for relation in args:
             if isinstance(relation, Prefetch):
@@ -936,6 +1166,50 @@ class QuerySet(AwaitableQuery[MODEL]):
         queryset._db = _db if _db else queryset._db
         return queryset
 
+    def timeout(self, seconds: Optional[float]) -> "QuerySet[MODEL]":
+        """
+        Cancel each statement of this query that runs longer than the given seconds,
+        raising :class:`~tortoise.exceptions.QueryTimeoutError`. Queries built from the
+        QuerySet, like ``.update()`` or ``.count()``, have the same timeout.
+
+        Overrides the ``query_timeout`` of the connection, ``None`` uses it.
+
+        :raises ParamsError: Timeout should be a positive number.
+        """
+        return AwaitableQuery.timeout(self._clone(), seconds)
+
+    def cache(self, ttl: Optional[float] = None) -> "QuerySet[MODEL]":
+        """
+        Cache the rows returned by this query in ``tortoise.cache.query_cache``.
+
+        Entries are keyed by connection name and SQL, and are invalidated when the model,
+        or any table joined by the query, is written to through Tortoise.
+        Prefetched relations are not cached, and queries inside a transaction or with
+        ``select_for_update()`` always bypass the cache.
+
+        :param ttl: Seconds to keep the result for, ``None`` keeps it until invalidated
+            or evicted.
+        """
+        queryset = self._clone()
+        queryset._use_cache = True
+        queryset._cache_ttl = ttl
+        return queryset
+
+    def batch_lazy_load(self) -> "QuerySet[MODEL]":
+        """
+        Load relations of the returned objects for all of them at once when first awaited.
+
+        The first time a relation that was not prefetched is awaited on one of the objects,
+        e.g. ``await event.tournament`` or ``await tournament.events``, it is fetched like
+        ``prefetch_related()`` for every object of the result that has not loaded it yet,
+        so looping over the result costs one query per relation instead of one per object.
+        Awaiting a reverse or many-to-many relation then returns the loaded objects
+        instead of querying again.
+        """
+        queryset = self._clone()
+        queryset._batch_lazy_load = True
+        return queryset
+
     def _join_table_with_select_related(
         self,
         model: "Type[Model]",
@@ -1050,21 +1324,120 @@ class QuerySet(AwaitableQuery[MODEL]):
     def __await__(self) -> Generator[Any, None, List[MODEL]]:
         if self._db is None:
             self._db = self._choose_db(self._select_for_update)  # type: ignore
-        self._make_query()
-        return self._execute().__await__()
+        object_cache = self._get_object_cache()
+        lookup = self._get_single_lookup() if self._single else None
+        if lookup is not None:
+            field_name, value = lookup
+            if object_cache is not None:
+                row = object_cache.get(self._db.connection_name, field_name, value)
+                if row is not None:
+                    instance = self.model._init_from_db(**row)
+                    return self._return_cached(instance).__await__()  # type: ignore
+            loader = current_batch_loader.get()
+            if loader is not None and field_name == self.model._meta.pk_attr:
+                return self._load_batched(loader, value).__await__()  # type: ignore
+        return self._make_and_execute(object_cache)
 
     async def __aiter__(self) -> AsyncIterator[MODEL]:
         for val in await self:
             yield val
 
-    async def _execute(self) -> List[MODEL]:
+    def _get_tables(self) -> Set[str]:
+        tables = {self.model._meta.db_table}
+        for join in self.query._joins:
+            table_name = getattr(join.item, "_table_name", None)
+            if table_name is not None:
+                tables.add(table_name)
+        return tables
+
+    def _get_object_cache(self) -> Optional[ObjectCache]:
+        """
+        Returns the object cache of the model if this query may use it.
+        """
+        object_cache = self.model._meta.object_cache
+        if (
+            object_cache is None
+            or self._select_related
+            or self._annotations
+            or self._fields_for_select
+            or self._select_for_update
+            or isinstance(self._db, BaseTransactionWrapper)
+        ):
+            return None
+        return object_cache
+
+    def _get_single_lookup(self) -> Optional[Tuple[str, Any]]:
+        """
+        Returns ``(field name, python value)`` if this query fetches a full instance by
+        an exact match on one primary key or unique field, else ``None``.
+        """
+        if (
+            self._select_related
+            or self._annotations
+            or self._fields_for_select
+            or self._select_for_update
+            or self._offset
+            or self._distinct
+            or self._group_bys
+            or self._prefetch_map
+            or len(self._q_objects) != 1
+        ):
+            return None
+        q_object = self._q_objects[0]
+        if q_object.children or q_object._is_negated or len(q_object.filters) != 1:
+            return None
+        ((key, value),) = q_object.filters.items()
+        meta = self.model._meta
+        if key == "pk":
+            key = meta.pk_attr
+        field = meta.fields_map.get(key)
+        if field is None or not (field.pk or field.unique) or key not in meta.fields_db_projection:
+            return None
+        try:
+            return key, field.to_python_value(value)
+        except Exception:  # nosec
+            # Values that can't be converted, e.g. expressions, are left to the database
+            return None
+
+    @staticmethod
+    async def _return_cached(instance: MODEL) -> MODEL:
+        return instance
+
+    async def _load_batched(self, loader: BatchLoader, pk: Any) -> Optional[MODEL]:
+        instance = await loader.load(self.model, self._db, pk)
+        if instance is None and self._raise_does_not_exist:
+            raise DoesNotExist("Object does not exist")
+        return instance
+
+    async def _execute(self, object_cache: Optional[ObjectCache] = None) -> List[MODEL]:
+        raw_results: Optional[Sequence[Any]] = None
+        if (
+            self._use_cache
+            and not self._select_for_update
+            and not isinstance(self._db, BaseTransactionWrapper)
+        ):
+            raw_results = await query_cache.execute(
+                self._db, str(self.query), self._get_tables(), self._cache_ttl
+            )
+        elif object_cache is not None:
+            _, raw_results = await self._db.execute_query(str(self.query))
         instance_list = await self._db.executor_class(
             model=self.model,
             db=self._db,
             prefetch_map=self._prefetch_map,
             prefetch_queries=self._prefetch_queries,
             select_related_idx=self._select_related_idx,
-        ).execute_select(self.query, custom_fields=list(self._annotations.keys()))
+        ).execute_select(
+            self.query, custom_fields=list(self._annotations.keys()), raw_results=raw_results
+        )
+        if object_cache is not None:
+            for instance, row in zip(instance_list, raw_results):  # type: ignore
+                if not instance._partial:
+                    object_cache.add(self._db.connection_name, instance, row)
+        if self._batch_lazy_load and len(instance_list) > 1:
+            loader = RelationLoader(instance_list, self._db)
+            for instance in instance_list:
+                instance._relation_loader = loader
         if self._single:
             if len(instance_list) == 1:
                 return instance_list[0]
@@ -1077,6 +1450,8 @@ class QuerySet(AwaitableQuery[MODEL]):
 
 
 class UpdateQuery(AwaitableQuery):
+    _operation = "update"
+
     __slots__ = (
         "update_kwargs",
         "q_objects",
@@ -1158,14 +1533,17 @@ class UpdateQuery(AwaitableQuery):
     def __await__(self) -> Generator[Any, None, int]:
         if self._db is None:
             self._db = self._choose_db(True)  # type: ignore
-        self._make_query()
-        return self._execute().__await__()
+        return self._make_and_execute()
 
     async def _execute(self) -> int:
-        return (await self._db.execute_query(str(self.query), self.values))[0]
+        count = (await self._db.execute_query(str(self.query), self.values))[0]
+        await self._invalidate_caches()
+        return count
 
 
 class DeleteQuery(AwaitableQuery):
+    _operation = "delete"
+
     __slots__ = (
         "q_objects",
         "annotations",
@@ -1213,11 +1591,12 @@ class DeleteQuery(AwaitableQuery):
     def __await__(self) -> Generator[Any, None, int]:
         if self._db is None:
             self._db = self._choose_db(True)  # type: ignore
-        self._make_query()
-        return self._execute().__await__()
+        return self._make_and_execute()
 
     async def _execute(self) -> int:
-        return (await self._db.execute_query(str(self.query)))[0]
+        count = (await self._db.execute_query(str(self.query)))[0]
+        await self._invalidate_caches(delete=True)
+        return count
 
 
 class ExistsQuery(AwaitableQuery):
@@ -1268,8 +1647,7 @@ class ExistsQuery(AwaitableQuery):
     def __await__(self) -> Generator[Any, None, bool]:
         if self._db is None:
             self._db = self._choose_db()  # type: ignore
-        self._make_query()
-        return self._execute().__await__()
+        return self._make_and_execute()
 
     async def _execute(self) -> bool:
         result, _ = await self._db.execute_query(str(self.query))
@@ -1332,8 +1710,7 @@ class CountQuery(AwaitableQuery):
     def __await__(self) -> Generator[Any, None, int]:
         if self._db is None:
             self._db = self._choose_db()  # type: ignore
-        self._make_query()
-        return self._execute().__await__()
+        return self._make_and_execute()
 
     async def _execute(self) -> int:
         _, result = await self._db.execute_query(str(self.query))
@@ -1558,8 +1935,7 @@ class ValuesListQuery(FieldSelectQuery, Generic[SINGLE]):
     def __await__(self) -> Generator[Any, None, Union[List[Any], Tuple[Any, ...]]]:
         if self._db is None:
             self._db = self._choose_db()  # type: ignore
-        self._make_query()
-        return self._execute().__await__()  # pylint: disable=E1101
+        return self._make_and_execute()
 
     async def __aiter__(self: "ValuesListQuery[Any]") -> AsyncIterator[Any]:
         for val in await self:
@@ -1590,6 +1966,129 @@ class ValuesListQuery(FieldSelectQuery, Generic[SINGLE]):
         return lst_values
 
 
+class RecordsQuery(ValuesListQuery[SINGLE]):
+    __slots__ = ("record_class",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.record_class = self.get_record_class(self.model, tuple(self.fields_for_select_list))
+
+    @staticmethod
+    def get_record_class(model: "Type[Model]", fields: Tuple[str, ...]) -> Type[tuple]:
+        """
+        Returns the record class for the given fields of a model, creating it on first use.
+        """
+        record_classes = model._meta.record_classes
+        record_class: Optional[Type[tuple]] = record_classes.get(fields)
+        if record_class is None:
+            try:
+                record_classes[fields] = namedtuple(
+                    f"{model.__name__}Record", fields, module=model.__module__
+                )
+            except ValueError as e:
+                raise FieldError(f"Can't build a record for fields {fields}: {e}")
+            record_class = record_classes[fields]
+        return record_class
+
+    @overload
+    def __await__(
+        self: "RecordsQuery[Literal[False]]",
+    ) -> Generator[Any, None, List[Any]]: ...
+
+    @overload
+    def __await__(
+        self: "RecordsQuery[Literal[True]]",
+    ) -> Generator[Any, None, Any]: ...
+
+    def __await__(self) -> Generator[Any, None, Union[List[Any], Any]]:
+        if self._db is None:
+            self._db = self._choose_db()  # type: ignore
+        return self._make_and_execute()
+
+    async def _execute(self) -> Union[List[Any], Any]:
+        _, result = await self._db.execute_query(str(self.query))
+        columns = [
+            (key, self.resolve_to_python_value(self.model, name))
+            for key, name in self.fields.items()
+        ]
+        make = self.record_class._make  # type: ignore
+        lst_values = [make([func(entry[column]) for column, func in columns]) for entry in result]
+
+        if self.single:
+            if len(lst_values) == 1:
+                return lst_values[0]
+            if not lst_values:
+                if self.raise_does_not_exist:
+                    raise DoesNotExist("Object does not exist")
+                return None
+            raise MultipleObjectsReturned("Multiple objects returned, expected exactly one")
+        return lst_values
+
+
+class ValuesColumnsQuery(ValuesListQuery[Literal[False]]):
+    __slots__ = ("use_numpy",)
+
+    #: array typecode and NumPy dtype for the python types that are stored in arrays
+    ARRAY_TYPES: Dict[type, Tuple[str, str]] = {int: ("q", "int64"), float: ("d", "float64")}
+
+    def __init__(self, *args: Any, use_numpy: bool = False, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.use_numpy = use_numpy
+
+    @staticmethod
+    def _array_field_type(field_object: Optional["Field"]) -> Optional[type]:
+        # Enum members are kept, as values_list() returns them, instead of packing their values
+        if getattr(field_object, "enum_type", None) is not None:
+            return None
+        return getattr(field_object, "field_type", None)
+
+    def _resolve_field_type(self, model: "Type[Model]", field: str) -> Optional[type]:
+        if field in model._meta.fetch_fields:
+            return None
+        if field in self.annotations:
+            return self._array_field_type(getattr(self.annotations[field], "field_object", None))
+        if field in model._meta.fields_map:
+            return self._array_field_type(model._meta.fields_map[field])
+        field_, __, forwarded_fields = field.partition("__")
+        if field_ in model._meta.fetch_fields:
+            new_model = model._meta.fields_map[field_].related_model  # type: ignore
+            return self._resolve_field_type(new_model, forwarded_fields)
+        return None
+
+    def _to_array(self, values: List[Any], field_type: Optional[type]) -> Any:
+        array_type = self.ARRAY_TYPES.get(field_type)  # type: ignore
+        if array_type is None:
+            return values
+        typecode, dtype = array_type
+        try:
+            if self.use_numpy:
+                import numpy
+
+                if None in values:
+                    return values
+                return numpy.array(values, dtype=dtype)
+            return array(typecode, values)
+        except (TypeError, OverflowError):
+            # NULLs or values that don't fit the native type
+            return values
+
+    def __await__(self) -> Generator[Any, None, Dict[str, Any]]:  # type: ignore
+        if self._db is None:
+            self._db = self._choose_db()  # type: ignore
+        return self._make_and_execute()
+
+    async def _execute(self) -> Dict[str, Any]:  # type: ignore
+        _, result = await self._db.execute_query(str(self.query))
+        columns: Dict[str, Any] = {}
+        for key, name in self.fields.items():
+            values = [row[key] for row in result]
+            func = self.resolve_to_python_value(self.model, name)
+            if not isinstance(func, types.LambdaType):
+                values = list(map(func, values))
+            columns[name] = self._to_array(values, self._resolve_field_type(self.model, name))
+        return columns
+
+
 class ValuesQuery(FieldSelectQuery, Generic[SINGLE]):
     __slots__ = (
         "fields_for_select",
@@ -1688,8 +2187,7 @@ class ValuesQuery(FieldSelectQuery, Generic[SINGLE]):
     ) -> Generator[Any, None, Union[List[Dict[str, Any]], Dict[str, Any]]]:
         if self._db is None:
             self._db = self._choose_db()  # type: ignore
-        self._make_query()
-        return self._execute().__await__()  # pylint: disable=E1101
+        return self._make_and_execute()
 
     async def __aiter__(self: "ValuesQuery[Any]") -> AsyncIterator[Dict[str, Any]]:
         for val in await self:
@@ -1723,6 +2221,8 @@ class ValuesQuery(FieldSelectQuery, Generic[SINGLE]):
 
 
 class RawSQLQuery(AwaitableQuery):
+    _operation = "raw"
+
     __slots__ = ("_sql", "_db")
 
     def __init__(self, model: Type[MODEL], db: BaseDBAsyncClient, sql: str):
@@ -1743,8 +2243,7 @@ class RawSQLQuery(AwaitableQuery):
     def __await__(self) -> Generator[Any, None, List[MODEL]]:
         if self._db is None:
             self._db = self._choose_db()  # type: ignore
-        self._make_query()
-        return self._execute().__await__()
+        return self._make_and_execute()
 
 
 class BulkUpdateQuery(UpdateQuery, Generic[MODEL]):
@@ -1829,6 +2328,7 @@ class BulkUpdateQuery(UpdateQuery, Generic[MODEL]):
         count = 0
         for query in self.queries:
             count += (await self._db.execute_query(str(query)))[0]
+        await self._invalidate_caches()
         return count
 
     def sql(self, **kwargs) -> str:
@@ -1837,6 +2337,8 @@ class BulkUpdateQuery(UpdateQuery, Generic[MODEL]):
 
 
 class BulkCreateQuery(AwaitableQuery, Generic[MODEL]):
+    _operation = "insert"
+
     __slots__ = (
         "objects",
         "ignore_conflicts",
@@ -1928,12 +2430,12 @@ class BulkCreateQuery(AwaitableQuery, Generic[MODEL]):
                 await self._db.execute_many(str(self.insert_query_all), values_lists_all)
             if values_lists:
                 await self._db.execute_many(str(self.insert_query), values_lists)
+        await self._invalidate_caches()
 
     def __await__(self) -> Generator[Any, None, None]:
         if self._db is None:
             self._db = self._choose_db(True)  # type: ignore
-        self._make_query()
-        return self._execute().__await__()
+        return self._make_and_execute()
 
     def sql(self, **kwargs) -> str:
         self.as_query()
@@ -38,5 +38,23 @@ class ConnectionRouter:
     def db_for_write(self, model: Type["Model"]) -> Optional["BaseDBAsyncClient"]:
         return self._db_route(model, "db_for_write")
 
+    def db_for_transaction(
+        self, connection_name: str, read_only: bool
+    ) -> Optional["BaseDBAsyncClient"]:
+        """
+        Returns the connection to run a transaction asked for on the given connection on, as
+        chosen by the first router with a ``db_for_transaction`` method returning one.
+        """
+        for r in self._routers or ():
+            method = getattr(r, "db_for_transaction", None)
+            if method is not None:
+                chosen_db = method(connection_name, read_only=read_only)
+                if chosen_db:
+                    try:
+                        return connections.get(chosen_db)
+                    except ConfigurationError:
+                        return None
+        return None
+
 
 router = ConnectionRouter()
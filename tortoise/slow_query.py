@@ -0,0 +1,179 @@
+"""
+Slow query log, built on the :mod:`instrumentation hooks <tortoise.instrumentation>`.
+
+.. code-block:: python3
+
+    from tortoise.instrumentation import add_hook
+    from tortoise.slow_query import SlowQueryMonitor
+
+    monitor = SlowQueryMonitor(threshold=0.2, logger=logging.getLogger("slow_queries"))
+    add_hook(monitor)
+    ...
+    for record in monitor.records:
+        print(record.duration, record.sql, record.call_site, record.plan)
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+from collections import deque
+from contextvars import ContextVar
+from types import FrameType
+from typing import TYPE_CHECKING, Any, Deque, Optional, Set, Type
+
+import tortoise
+from tortoise.connection import connections
+from tortoise.instrumentation import QueryEvent
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.models import Model
+
+# Frames of these directories are skipped when looking for the caller of a query
+_SKIPPED_DIRS = tuple(
+    os.path.dirname(module.__file__) + os.sep for module in (tortoise, asyncio)  # type: ignore
+)
+_explaining: ContextVar[bool] = ContextVar("explaining_slow_query", default=False)
+
+
+def _call_site() -> Optional[str]:
+    """
+    Returns ``file:line in function`` of the innermost frame outside of Tortoise.
+    """
+    frame: Optional[FrameType] = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not filename.startswith(_SKIPPED_DIRS):
+            return f"{filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+class SlowQuery:
+    """
+    A query that ran slower than the threshold of a :class:`SlowQueryMonitor`.
+    """
+
+    __slots__ = ("event", "call_site", "recorded_at", "plan", "plan_error")
+
+    def __init__(self, event: QueryEvent, call_site: Optional[str]) -> None:
+        #: The :class:`~tortoise.instrumentation.QueryEvent` of the query
+        self.event = event
+        #: ``file:line in function`` the query was awaited from
+        self.call_site = call_site
+        #: Wall clock time the record was made at, in seconds since the epoch
+        self.recorded_at = time.time()
+        #: Rows returned by ``EXPLAIN``, ``None`` until captured or if not captured
+        self.plan: Any = None
+        #: Exception raised by ``EXPLAIN``, if any
+        self.plan_error: Optional[BaseException] = None
+
+    @property
+    def sql(self) -> Optional[str]:
+        return self.event.sql
+
+    @property
+    def values(self) -> Optional[list]:
+        return self.event.values
+
+    @property
+    def duration(self) -> float:
+        return self.event.duration
+
+    def __repr__(self) -> str:
+        return f"<SlowQuery {self.duration:.3f}s {self.sql!r} at {self.call_site}>"
+
+
+class SlowQueryMonitor:
+    """
+    Instrumentation hook recording queries slower than a threshold.
+
+    Records are kept in :attr:`records`, holding up to ``maxlen`` of the latest ones, and
+    logged to ``logger`` if given. Unless disabled, the plan of each recorded select, update
+    or delete is captured with ``EXPLAIN`` in a background task, on a connection of its own
+    outside of any transaction the query ran in. Records are logged once their plan was
+    captured.
+
+    :param threshold: Seconds above which a query is recorded.
+    :param maxlen: Maximum number of records kept.
+    :param explain: Capture the plan of recorded queries.
+    :param analyze: Capture plans with ``EXPLAIN ANALYZE`` where supported, which runs
+        the select again. Only selects are analyzed.
+    :param logger: Logger recorded queries are logged to with ``WARNING`` level.
+    """
+
+    __slots__ = ("threshold", "explain", "analyze", "logger", "records", "_pending")
+
+    def __init__(
+        self,
+        threshold: float = 1.0,
+        maxlen: int = 100,
+        explain: bool = True,
+        analyze: bool = False,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self.threshold = threshold
+        self.explain = explain
+        self.analyze = analyze
+        self.logger = logger
+        self.records: Deque[SlowQuery] = deque(maxlen=maxlen)
+        self._pending: Set[asyncio.Future] = set()
+
+    def __call__(self, event: QueryEvent) -> None:
+        if event.duration < self.threshold or _explaining.get():
+            return
+        record = SlowQuery(event, _call_site())
+        self.records.append(record)
+        if (
+            self.explain
+            and event.error is None
+            and event.model is not None
+            and event.operation in ("select", "update", "delete")
+        ):
+            future = asyncio.ensure_future(self._explain(record, event.model))
+            self._pending.add(future)
+            future.add_done_callback(self._pending.discard)
+        else:
+            self._log(record)
+
+    async def _explain(self, record: SlowQuery, model: Type["Model"]) -> None:
+        _explaining.set(True)
+        event = record.event
+        db = connections.get(event.connection_name)
+        # Use the connection the transaction was started from, if any
+        while getattr(db, "_parent", None) is not None:
+            db = db._parent  # type: ignore
+        try:
+            record.plan = await db.executor_class(model=model, db=db).explain_sql(
+                event.sql,  # type: ignore
+                event.values,
+                analyze=self.analyze and event.operation == "select",
+            )
+        except Exception as exc:
+            record.plan_error = exc
+        self._log(record)
+
+    def _log(self, record: SlowQuery) -> None:
+        if self.logger is not None:
+            self.logger.warning(
+                "Slow query (%.3fs) at %s: %s %s, plan: %s",
+                record.duration,
+                record.call_site,
+                record.sql,
+                record.values,
+                record.plan if record.plan_error is None else record.plan_error,
+            )
+
+    async def wait(self) -> None:
+        """
+        Waits for plans being captured.
+        """
+        while self._pending:
+            await asyncio.gather(*self._pending)
+
+    def clear(self) -> None:
+        """
+        Drops all records.
+        """
+        self.records.clear()
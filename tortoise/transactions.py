@@ -1,8 +1,13 @@
+import asyncio
+import random
 from functools import wraps
 from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, cast
 
 from tortoise import connections
-from tortoise.exceptions import ParamsError
+from tortoise.backends.base.client import BaseTransactionWrapper
+from tortoise.exceptions import ParamsError, TransactionConflictError
+from tortoise.metrics import get_stats
+from tortoise.router import router
 
 if TYPE_CHECKING:  # pragma: nocoverage
     from tortoise.backends.base.client import BaseDBAsyncClient, TransactionContext
@@ -25,36 +30,107 @@ def _get_connection(connection_name: Optional[str]) -> "BaseDBAsyncClient":
     return connection
 
 
-def in_transaction(connection_name: Optional[str] = None) -> "TransactionContext":
+def _get_transaction_connection(
+    connection_name: Optional[str], read_only: bool
+) -> "BaseDBAsyncClient":
+    connection = _get_connection(connection_name)
+    if isinstance(connection, BaseTransactionWrapper):
+        return connection
+    return router.db_for_transaction(connection.connection_name, read_only) or connection
+
+
+def _in_transaction(
+    connection: "BaseDBAsyncClient",
+    isolation: Optional[str],
+    read_only: bool,
+    deferrable: bool,
+) -> "TransactionContext":
+    if isinstance(connection, BaseTransactionWrapper):
+        # Nested transactions run within the enclosing one, with its options
+        return connection._in_transaction()
+    options = {"isolation": isolation, "read_only": read_only, "deferrable": deferrable}
+    return connection._in_transaction(**{key: value for key, value in options.items() if value})
+
+
+def in_transaction(
+    connection_name: Optional[str] = None,
+    isolation: Optional[str] = None,
+    read_only: bool = False,
+    deferrable: bool = False,
+) -> "TransactionContext":
     """
     Transaction context manager.
 
     You can run your code inside ``async with in_transaction():`` statement to run it
     into one transaction. If error occurs transaction will rollback.
 
+    The isolation level and the read-only and deferrable modes apply to new transactions, and
+    are ignored by transactions nested in another one. Routers with a ``db_for_transaction``
+    method can run transactions on another connection, such as read-only transactions on a
+    read replica.
+
     :param connection_name: name of connection to run with, optional if you have only
                             one db connection
+    :param isolation: isolation level of the transaction, such as ``"SERIALIZABLE"`` or
+                      ``"repeatable_read"``, defaults to the one of the database
+    :param read_only: run a read-only transaction
+    :param deferrable: let a serializable read-only transaction wait to run without
+                       serialization failures, on PostgreSQL
     """
-    connection = _get_connection(connection_name)
-    return connection._in_transaction()
-
-
-def atomic(connection_name: Optional[str] = None) -> Callable[[F], F]:
+    connection = _get_transaction_connection(connection_name, read_only)
+    return _in_transaction(connection, isolation, read_only, deferrable)
+
+
+def atomic(
+    connection_name: Optional[str] = None,
+    retries: int = 0,
+    backoff: float = 0.05,
+    max_backoff: float = 2.0,
+    isolation: Optional[str] = None,
+    read_only: bool = False,
+    deferrable: bool = False,
+) -> Callable[[F], F]:
     """
     Transaction decorator.
 
     You can wrap your function with this decorator to run it into one transaction.
     If error occurs transaction will rollback.
 
+    With ``retries``, the function is run again in a new transaction when the database aborts
+    the transaction with a :class:`~tortoise.exceptions.TransactionConflictError`, such as a
+    serialization failure or a deadlock, up to ``retries`` times. Retries wait for a random
+    delay up to ``backoff`` seconds, doubled on every retry up to ``max_backoff``, and are
+    counted by the ``retries`` metric of the connection. The function must then be safe to run
+    more than once. Within an enclosing transaction, the conflict is left to the enclosing
+    transaction, as the function can't be retried on its own.
+
     :param connection_name: name of connection to run with, optional if you have only
                             one db connection
+    :param retries: how many times to retry the function after a conflict
+    :param backoff: upper bound of the delay before the first retry, in seconds
+    :param max_backoff: upper bound of the delay before any retry, in seconds
+    :param isolation: isolation level of the transaction, as for :func:`in_transaction`
+    :param read_only: run a read-only transaction, as for :func:`in_transaction`
+    :param deferrable: run a deferrable transaction, as for :func:`in_transaction`
     """
 
     def wrapper(func: F) -> F:
         @wraps(func)
         async def wrapped(*args, **kwargs):
-            async with in_transaction(connection_name):
-                return await func(*args, **kwargs)
+            attempt = 0
+            while True:
+                connection = _get_transaction_connection(connection_name, read_only)
+                try:
+                    async with _in_transaction(connection, isolation, read_only, deferrable):
+                        return await func(*args, **kwargs)
+                except TransactionConflictError:
+                    if attempt >= retries or isinstance(connection, BaseTransactionWrapper):
+                        raise
+                attempt += 1
+                get_stats(connection.connection_name).retried()
+                # Full jitter, to spread the retries of conflicting transactions
+                delay = min(max_backoff, backoff * 2 ** (attempt - 1))
+                await asyncio.sleep(random.uniform(0, delay))
 
         return cast(F, wrapped)
 